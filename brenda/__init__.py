@@ -18,6 +18,52 @@ BRENDA Enzyme Database Access
 .. |c| unicode:: U+A9
 """
 
+__all__ = ["BRENDAParser", "Enzyme", "Protein", "Entry", "EntryComment", "parse_entry",
+           "parse_entries", "iter_entries", "EnzymeStore", "ProteinRegistry", "TextIndex",
+           "NameIndex", "RangeIndex", "ReactionNetwork", "to_jsonl", "from_jsonl",
+           "extract_records", "ArgumentError"]
 
-from parser import *
+import importlib
+
+
+# Submodules, loaded on first access (e.g. brenda.parser or brenda.BRENDAParser)
+# so that importing the package itself is almost free
+_submodules = ('conformance', 'export', 'names', 'parser', 'ranges', 'reactions', 'registry',
+               'search', 'server', 'store', 'subset', 'tables', 'transfer', 'utils')
+
+# attribute -> submodule defining it
+_attributes = {
+    'BRENDAParser': 'parser',
+    'Enzyme': 'parser',
+    'Protein': 'parser',
+    'Entry': 'parser',
+    'EntryComment': 'parser',
+    'parse_entry': 'parser',
+    'parse_entries': 'parser',
+    'iter_entries': 'parser',
+    'EnzymeStore': 'store',
+    'ProteinRegistry': 'registry',
+    'TextIndex': 'search',
+    'NameIndex': 'names',
+    'RangeIndex': 'ranges',
+    'ReactionNetwork': 'reactions',
+    'to_jsonl': 'export',
+    'from_jsonl': 'export',
+    'extract_records': 'subset',
+    'ArgumentError': 'utils'}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module('.' + name, __name__)
+    submodule = _attributes.get(name)
+    if submodule is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    value = getattr(importlib.import_module('.' + submodule, __name__), name)
+    globals()[name] = value  # later accesses bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_submodules))
 
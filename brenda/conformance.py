@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+==================================
+BRENDA Enzyme Database Conformance
+==================================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    conformance.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["MODES", "Difference", "ModeResult", "diff_enzymes", "run_mode", "check_conformance",
+           "mutate", "fuzz_file"]
+
+import argparse
+import os
+import pickle
+import random
+import tempfile
+import time
+
+from collections import namedtuple
+
+from brenda.export import enzyme_to_dict, iter_jsonl, to_jsonl
+from brenda.parser import BRENDAParser
+from brenda.store import EnzymeStore
+from brenda.transfer import decode_enzymes, encode_enzymes
+from brenda.utils import unique_enzymes
+
+
+# Field of a parsed enzyme whose value differs between two parsing modes,
+# e.g. path ('1.1.1.1', 'entries', 'KM_VALUE', 3, 'comment', 'msg')
+Difference = namedtuple('Difference', ['path', 'expected', 'actual'])
+
+# Outcome of a parsing mode on one input: elapsed time, throughput (input
+# bytes per second), number of enzymes and differences with the reference mode
+ModeResult = namedtuple('ModeResult', ['mode', 'seconds', 'bytes_per_second', 'enzymes',
+                                       'differences'])
+
+
+def _parse(filename, parser_class=BRENDAParser, **options):
+    """Parses a flat file and returns its enzymes (in order) and errors."""
+    with parser_class(filename, **options) as parser:
+        enzymes = list(unique_enzymes(parser.parse()))
+    return enzymes, parser.errors
+
+
+def _parse_threads(filename, **options):
+    return _parse(filename, threads=4, **options)
+
+
+def _parse_cache(filename, **options):
+    return _parse(filename, cache_size=10000, **options)
+
+
+def _parse_store(filename, **options):
+    with EnzymeStore(cache_size=16) as store:
+        enzymes, errors = _parse(filename, store=store, **options)
+    return enzymes, errors
+
+
+def _parse_jsonl(filename, **options):
+    enzymes, errors = _parse(filename, **options)
+    with tempfile.TemporaryFile() as handle:
+        to_jsonl(enzymes, handle)
+        handle.seek(0)
+        return list(iter_jsonl(handle)), errors
+
+
+def _parse_pickle(filename, **options):
+    enzymes, errors = _parse(filename, **options)
+    return pickle.loads(pickle.dumps(enzymes, pickle.HIGHEST_PROTOCOL)), errors
+
+
+def _parse_transfer(filename, **options):
+    enzymes, errors = _parse(filename, **options)
+    return decode_enzymes(encode_enzymes(enzymes)), errors
+
+
+# Parsing modes: name -> function parsing a flat file with BRENDAParser
+# options, and returning the list of parsed enzymes and the list of errors
+MODES = {
+    'reference': _parse,
+    'threads': _parse_threads,
+    'cache': _parse_cache,
+    'store': _parse_store,
+    'jsonl': _parse_jsonl,
+    'pickle': _parse_pickle,
+    'transfer': _parse_transfer}
+
+
+def _diff(expected, actual, path, differences):
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in expected:
+            if key in actual:
+                _diff(expected[key], actual[key], path + (key,), differences)
+            else:
+                differences.append(Difference(path + (key,), expected[key], None))
+        for key in actual:
+            if key not in expected:
+                differences.append(Difference(path + (key,), None, actual[key]))
+    elif isinstance(expected, list) and isinstance(actual, list) and \
+            len(expected) == len(actual) and any(isinstance(e, dict) for e in expected):
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            _diff(left, right, path + (index,), differences)
+    elif expected != actual:
+        differences.append(Difference(path, expected, actual))
+
+
+def diff_enzymes(expected, actual):
+    """Compares every field of two lists of enzymes: EC numbers and comments,
+    proteins (organism, accessions, information, comment and references) and
+    entries of every section (message, information, comment, proteins and
+    references).
+
+    :param expected: list of Enzyme instances
+    :param actual: list of Enzyme instances
+    :return: list of Difference tuples, empty if both lists are identical
+    """
+    differences = list()
+    if [e.ec_number for e in expected] != [e.ec_number for e in actual]:
+        differences.append(Difference(('ec_numbers',), [e.ec_number for e in expected],
+                                      [e.ec_number for e in actual]))
+        return differences
+    for left, right in zip(expected, actual):
+        _diff(enzyme_to_dict(left), enzyme_to_dict(right), (left.ec_number,), differences)
+    return differences
+
+
+def _diff_errors(expected, actual):
+    """Compares the malformed entries recorded in tolerant mode."""
+    keys = [[(e.line_number, e.ec_number, e.section, e.text, type(e.error).__name__)
+             for e in errors] for errors in (expected, actual)]
+    if keys[0] != keys[1]:
+        return [Difference(('errors',), keys[0], keys[1])]
+    return list()
+
+
+def run_mode(mode, filename, **options):
+    """Parses a flat file with a parsing mode and measures its throughput.
+
+    :param mode: name of a parsing mode (see MODES)
+    :param filename: path of the BRENDA flat file
+    :param options: keyword arguments of BRENDAParser, e.g. tolerant=True
+    :return: (enzymes, errors, seconds) tuple
+    """
+    start = time.perf_counter()
+    enzymes, errors = MODES[mode](filename, **options)
+    return enzymes, errors, time.perf_counter() - start
+
+
+def check_conformance(filename, modes=None, **options):
+    """Parses a flat file with the reference mode and other parsing modes, and
+    compares their results field by field.
+
+    :param filename: path of the BRENDA flat file
+    :param modes: names of the parsing modes to check, or None for all modes
+    :param options: keyword arguments of BRENDAParser, e.g. tolerant=True
+    :return: list of ModeResult tuples, the reference mode first
+    """
+    size = os.path.getsize(filename)
+    expected, expected_errors, seconds = run_mode('reference', filename, **options)
+    results = [ModeResult('reference', seconds, size / seconds, len(expected), list())]
+    for mode in modes or MODES:
+        if mode == 'reference':
+            continue
+        enzymes, errors, seconds = run_mode(mode, filename, **options)
+        differences = diff_enzymes(expected, enzymes) + _diff_errors(expected_errors, errors)
+        results.append(ModeResult(mode, seconds, size / seconds, len(enzymes), differences))
+    return results
+
+
+def _add_hash(text, rng):
+    position = rng.randrange(len(text) + 1)
+    return text[:position] + '#' + text[position:]
+
+
+def _add_pipe(text, rng):
+    position = rng.randrange(len(text) + 1)
+    return text[:position] + '|' + text[position:]
+
+
+def _drop_parenthesis(text, rng):
+    positions = [i for i, char in enumerate(text) if char in '()']
+    if not positions:
+        return text
+    position = rng.choice(positions)
+    return text[:position] + text[position + 1:]
+
+
+def _add_parenthesis(text, rng):
+    position = rng.randrange(len(text) + 1)
+    return text[:position] + rng.choice('()') + text[position:]
+
+
+def _add_abnormal_comment(text, rng):
+    return text + ' |#1# abnormal comment <1>|'
+
+
+def _add_empty_fields(text, rng):
+    return text + rng.choice((' ()', ' {}', ' ||', ' (  )'))
+
+
+def _wrap_line(text, rng):
+    positions = [i for i, char in enumerate(text) if char == ' ']
+    if not positions:
+        return text
+    position = rng.choice(positions)
+    return text[:position] + '\n\t' + text[position + 1:]
+
+
+def _add_pdb_id(text, rng):
+    return text + '\n\t' + rng.choice(('1A2B', '3XYZ', '6HT8')) + ' structure <1>'
+
+
+# Edge cases of the flat file: extra hashes, bogus pipes, (un)matched
+# parentheses, abnormal and empty comments, continuation lines (possibly
+# starting with PDB identifiers)
+_MUTATIONS = (_add_hash, _add_pipe, _drop_parenthesis, _add_parenthesis, _add_abnormal_comment,
+              _add_empty_fields, _wrap_line, _add_pdb_id)
+
+
+def mutate(text, rng, mutations=10):
+    """Applies random edge case mutations to the entries of a flat file.
+
+    Only entry lines (starting with a short section identifier or with
+    whitespace) are mutated, so that the record and section structure of the
+    file is preserved.
+
+    :param text: contents of a BRENDA flat file
+    :param rng: a random.Random instance
+    :param mutations: number of mutations
+    :return: mutated contents
+    """
+    lines = text.split('\n')
+    candidates = [i for i, line in enumerate(lines)
+                  if '\t' in line and not line.startswith(('ID', '*'))]
+    for index in rng.sample(candidates, min(mutations, len(candidates))):
+        line = lines[index]
+        lead, _, rest = line.partition('\t')
+        lines[index] = lead + '\t' + rng.choice(_MUTATIONS)(rest, rng)
+    return '\n'.join(lines)
+
+
+def fuzz_file(filename, output, seed, mutations=10, encoding='utf8'):
+    """Writes a mutated copy of a flat file (see mutate).
+
+    :param filename: path of the BRENDA flat file
+    :param output: path of the mutated flat file
+    :param seed: seed of the random number generator
+    :param mutations: number of mutations
+    :param encoding: encoding of the flat file
+    """
+    with open(filename, encoding=encoding, newline='') as handle:
+        text = handle.read()
+    with open(output, 'w', encoding=encoding, newline='') as handle:
+        handle.write(mutate(text, random.Random(seed), mutations))
+
+
+def _print_results(label, results):
+    print(label)
+    for result in results:
+        print('  {:<10} {:8.3f} s {:8.2f} MB/s {:6d} enzymes {:6d} differences'.format(
+            result.mode, result.seconds, result.bytes_per_second / 1e6, result.enzymes,
+            len(result.differences)))
+        for difference in result.differences[:5]:
+            print('    {}: {!r} != {!r}'.format('/'.join(map(str, difference.path)),
+                                               difference.expected, difference.actual))
+
+
+def main(args=None):
+    """Command line interface, see python -m brenda.conformance --help."""
+    parser = argparse.ArgumentParser(
+        description='Compares the parsing modes of BRENDAParser on a flat file and on fuzzed '
+                    'copies of it.')
+    parser.add_argument('input', help='BRENDA flat file')
+    parser.add_argument('--modes', nargs='+', choices=sorted(MODES), help='modes to check')
+    parser.add_argument('--fuzz', type=int, default=0, help='number of fuzzed copies')
+    parser.add_argument('--mutations', type=int, default=10, help='mutations per fuzzed copy')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first fuzzed copy')
+    options = parser.parse_args(args)
+
+    failed = False
+    results = check_conformance(options.input, options.modes, tolerant=True)
+    _print_results(options.input, results)
+    failed |= any(result.differences for result in results)
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in range(options.seed, options.seed + options.fuzz):
+            output = os.path.join(directory, 'fuzzed.txt')
+            fuzz_file(options.input, output, seed, options.mutations)
+            results = check_conformance(output, options.modes, tolerant=True)
+            _print_results('fuzzed copy, seed {}'.format(seed), results)
+            failed |= any(result.differences for result in results)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+===============================
+BRENDA Enzyme JSON Lines Export
+===============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    export.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["to_jsonl", "from_jsonl", "iter_jsonl", "enzyme_to_dict", "enzyme_from_dict",
+           "entry_to_dict", "entry_from_dict"]
+
+import json
+import os
+
+from collections import defaultdict
+
+from brenda.parser import Enzyme, Entry, EntryComment, Protein, Current
+from brenda.utils import ArgumentError, ec_prefixes, unique_enzymes
+
+try:  # optional, considerably faster encoder/decoder
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+
+
+def _get_backend(backend):
+    """Returns the (dumps, loads) pair for the requested JSON backend.
+
+    :param backend: 'orjson', 'json', or None for the fastest one available
+    :return: dumps function returning bytes, and loads function accepting bytes
+    """
+    if backend is None:
+        backend = 'json' if orjson is None else 'orjson'
+    if backend == 'orjson':
+        if orjson is None:
+            raise ArgumentError('JSON backend not installed: orjson')
+        return orjson.dumps, orjson.loads
+    if backend == 'json':
+        return _json_dumps, json.loads
+    raise ArgumentError('Unknown JSON backend: {}'.format(backend))
+
+
+def _comment_to_dict(comment):
+    if comment is None:
+        return None
+    return {'msg': comment.msg, 'proteins': comment.proteins, 'references': comment.references}
+
+
+def _comment_from_dict(data):
+    if data is None:
+        return None
+    return EntryComment(data['msg'], data['proteins'], data['references'])
+
+
+def entry_to_dict(entry):
+    """Converts an Entry instance to a dict of JSON-serializable values.
+
+    :param entry: an Entry instance
+    :return: dict representation of the entry
+    """
+    return {
+        'msg': entry.msg,
+        'information': entry.information,
+        'comment': _comment_to_dict(entry.comment),
+        'proteins': entry.proteins,
+        'references': entry.references}
+
+
+def entry_from_dict(data):
+    """Creates an Entry instance from its dict representation (see
+    entry_to_dict).
+
+    :param data: dict representation of an entry
+    :return: an Entry instance
+    """
+    return Entry(data['msg'], Current(data['proteins'], _comment_from_dict(data['comment']),
+                                      data['information'], data['references'], None, None))
+
+
+def enzyme_to_dict(enzyme):
+    """Converts an Enzyme instance to a dict of JSON-serializable values.
+
+    Protein identifiers (dict keys of Enzyme.proteins) are converted to strings
+    since JSON object keys are always strings.
+
+    :param enzyme: an Enzyme instance
+    :return: dict representation of the enzyme
+    """
+    proteins = dict()
+    for protein_id, protein in enzyme.proteins.items():
+        proteins[str(protein_id)] = {
+            'organism': protein.organism,
+            'identifiers': protein.identifiers,
+            'references': protein.references,
+            'information': protein.information,
+            'comment': _comment_to_dict(protein.comment)}
+
+    entries = dict()
+    for section, section_entries in enzyme.entries.items():
+        entries[section] = [entry_to_dict(entry) for entry in section_entries]
+
+    return {
+        'ec_number': enzyme.ec_number,
+        'comment': enzyme.comment,
+        'proteins': proteins,
+        'references': enzyme.references,
+        'entries': entries}
+
+
+def enzyme_from_dict(data):
+    """Creates an Enzyme instance from its dict representation (see
+    enzyme_to_dict).
+
+    :param data: dict representation of an enzyme
+    :return: an Enzyme instance
+    """
+    enzyme = Enzyme(data['ec_number'], data['comment'])
+    enzyme.references = data['references']
+
+    for protein_id, protein in data['proteins'].items():
+        current = Current(protein['identifiers'], _comment_from_dict(protein['comment']),
+                          protein['information'], protein['references'], None, None)
+        enzyme.proteins[int(protein_id)] = Protein(protein['organism'], current)
+
+    for section, section_entries in data['entries'].items():
+        enzyme.entries[section] = [entry_from_dict(entry) for entry in section_entries]
+
+    return enzyme
+
+
+def to_jsonl(enzymes, filename, backend=None):
+    """Writes enzymes to a JSON Lines file, one enzyme per line.
+
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances (e.g. a generator, in which case enzymes are streamed)
+    :param filename: path of the output file (str or os.PathLike), or a file
+        object opened in binary mode
+    :param backend: 'orjson', 'json', or None to use orjson when installed
+    :return: number of enzymes written
+    """
+    dumps, _ = _get_backend(backend)
+    count = 0
+    handle = open(os.fspath(filename), 'wb') if isinstance(filename, (str, os.PathLike)) \
+        else filename
+    try:
+        for enzyme in unique_enzymes(enzymes):
+            handle.write(dumps(enzyme_to_dict(enzyme)))
+            handle.write(b'\n')
+            count += 1
+    finally:
+        if handle is not filename:
+            handle.close()
+    return count
+
+
+def iter_jsonl(filename, backend=None):
+    """Reads enzymes from a JSON Lines file written by to_jsonl, one at a time.
+
+    :param filename: path of the input file (str or os.PathLike), or a file
+        object opened in binary mode
+    :param backend: 'orjson', 'json', or None to use orjson when installed
+    :return: generator of Enzyme instances
+    """
+    _, loads = _get_backend(backend)
+    handle = open(os.fspath(filename), 'rb') if isinstance(filename, (str, os.PathLike)) \
+        else filename
+    try:
+        for line in handle:
+            if line.strip():
+                yield enzyme_from_dict(loads(line))
+    finally:
+        if handle is not filename:
+            handle.close()
+
+
+def from_jsonl(filename, backend=None):
+    """Loads enzymes from a JSON Lines file written by to_jsonl.
+
+    :param filename: path of the input file (str or os.PathLike), or a file
+        object opened in binary mode
+    :param backend: 'orjson', 'json', or None to use orjson when installed
+    :return: dict of Enzyme objects, indexed like the result of
+        BRENDAParser.parse
+    """
+    enzymes = defaultdict(list)
+    for enzyme in iter_jsonl(filename, backend):
+        for prefix in ec_prefixes(enzyme.ec_number):
+            enzymes[prefix].append(enzyme)
+    return dict(enzymes)
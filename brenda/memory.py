@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Memory
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    memory.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["ParseMemory", "SizeBreakdown", "deep_size", "size_breakdown", "measure_parse"]
+
+import gc
+import sys
+import tracemalloc
+
+from collections import namedtuple
+
+from brenda.utils import unique_enzymes
+
+
+# Memory traced while parsing a flat file: peak and retained (by the parse
+# result) sizes, in bytes
+ParseMemory = namedtuple('ParseMemory', ['result', 'peak', 'retained'])
+
+# Retained size of parsed enzymes in bytes, split between Enzyme objects
+# (including their dicts), Protein objects and the entries of every section,
+# and number of objects of each kind
+SizeBreakdown = namedtuple('SizeBreakdown', ['enzymes', 'proteins', 'entries', 'sections',
+                                             'n_enzymes', 'n_proteins', 'n_entries',
+                                             'section_entries'])
+
+
+def deep_size(obj, seen=None):
+    """Returns the size of an object and of all objects it references, in
+    bytes, counting every object once.
+
+    Containers (dicts, lists, tuples, sets), instance dicts and slots are
+    followed; classes, modules and functions are not.
+
+    :param obj: any object
+    :param seen: set of identifiers of the objects already counted, updated
+        in place, or None
+    :return: size in bytes
+    """
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type) or callable(obj):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif not isinstance(obj, (str, bytes, int, float, bool)) and obj is not None:
+            if hasattr(obj, '__dict__'):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for slot in getattr(cls, '__slots__', ()):
+                    if hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+    return size
+
+
+def size_breakdown(enzymes):
+    """Splits the retained size of parsed enzymes between enzymes, proteins
+    and sections.
+
+    Objects shared between enzymes or entries (e.g. cached entries or
+    interned strings) are attributed to the first one they are found in.
+
+    :param enzymes: dict (or EnzymeStore) as returned by BRENDAParser.parse,
+        or an iterable of Enzyme instances
+    :return: a SizeBreakdown tuple, whose sections and section_entries
+        attributes are dicts of section name -> size in bytes and number of
+        entries, respectively
+    """
+    seen = set()
+    enzyme_size = protein_size = entry_size = 0
+    n_enzymes = n_proteins = n_entries = 0
+    sections = dict()
+    section_entries = dict()
+    for enzyme in unique_enzymes(enzymes):
+        n_enzymes += 1
+        # the enzyme itself, without the contents of its proteins and entries
+        seen.update(id(item) for item in enzyme.proteins.values())
+        seen.update(id(item) for item in enzyme.entries.values())
+        enzyme_size += deep_size(enzyme, seen)
+        seen.difference_update(id(item) for item in enzyme.proteins.values())
+        seen.difference_update(id(item) for item in enzyme.entries.values())
+
+        for protein in enzyme.proteins.values():
+            n_proteins += 1
+            protein_size += deep_size(protein, seen)
+        for section, entries in enzyme.entries.items():
+            n_entries += len(entries)
+            size = deep_size(entries, seen)
+            sections[section] = sections.get(section, 0) + size
+            section_entries[section] = section_entries.get(section, 0) + len(entries)
+            entry_size += size
+    return SizeBreakdown(enzyme_size, protein_size, entry_size, sections,
+                         n_enzymes, n_proteins, n_entries, section_entries)
+
+
+def measure_parse(filename, **options):
+    """Parses a flat file while tracing memory allocations with tracemalloc.
+
+    :param filename: path of the BRENDA flat file
+    :param options: keyword arguments of BRENDAParser
+    :return: a ParseMemory tuple, whose result is the parse result
+    """
+    from brenda.parser import BRENDAParser
+
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        with BRENDAParser(filename, **options) as parser:
+            result = parser.parse()
+        del parser
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return ParseMemory(result, peak - start, current - start)
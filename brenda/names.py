@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+============================
+BRENDA Enzyme Database Names
+============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    names.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["NAME_SECTIONS", "NameHit", "NameIndex", "normalize_name"]
+
+import re
+
+from collections import namedtuple
+
+from brenda.utils import unique_enzymes
+
+
+# Sections holding enzyme names
+NAME_SECTIONS = ('RECOMMENDED_NAME', 'SYSTEMATIC_NAME', 'SYNONYMS')
+
+# Enzyme name as found in a section of an EC number, with the proteins it
+# applies to (#...# tags of SYNONYMS entries, None otherwise)
+NameHit = namedtuple('NameHit', ['ec_number', 'section', 'name', 'proteins'])
+
+_punctuation = re.compile(r'[\W_]+', re.UNICODE)
+
+_KEY = ''  # trie node item holding the normalized name ending at that node
+
+
+def normalize_name(name):
+    """Folds case and removes whitespace and punctuation from a name, e.g.
+    'G-1-P Dehydrogenase' and 'g1p-dehydrogenase' both become
+    'g1pdehydrogenase'.
+
+    :param name: enzyme name
+    :return: normalized name
+    """
+    return _punctuation.sub('', name.casefold())
+
+
+class NameIndex:
+    """Maps enzyme names (recommended and systematic names, and synonyms) to
+    EC numbers.
+
+    Names are normalized (see normalize_name) and stored in a dict for exact
+    lookups, and in a character trie for prefix completion and approximate
+    (edit distance) matching.
+    """
+
+    def __init__(self):
+        """Initializes an empty NameIndex instance."""
+        self._hits = dict()  # normalized name -> list of NameHit
+        self._trie = dict()  # character -> child node; _KEY -> normalized name
+
+    def __len__(self):
+        return len(self._hits)
+
+    def add(self, hit):
+        """Indexes a name.
+
+        :param hit: NameHit whose name is indexed
+        """
+        key = normalize_name(hit.name)
+        if not key:
+            return
+        hits = self._hits.get(key)
+        if hits is not None:
+            hits.append(hit)
+            return
+
+        self._hits[key] = [hit]
+        node = self._trie
+        for char in key:
+            child = node.get(char)
+            if child is None:
+                child = node[char] = dict()
+            node = child
+        node[_KEY] = key
+
+    def add_enzyme(self, enzyme):
+        """Indexes the names of an enzyme.
+
+        :param enzyme: an Enzyme instance
+        """
+        for section in NAME_SECTIONS:
+            for entry in enzyme.entries.get(section, ()):
+                self.add(NameHit(enzyme.ec_number, section, entry.msg, entry.proteins))
+
+    @classmethod
+    def from_enzymes(cls, enzymes):
+        """Builds a NameIndex from parsed enzymes.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an iterable
+            of Enzyme instances
+        :return: a NameIndex instance
+        """
+        index = cls()
+        for enzyme in unique_enzymes(enzymes):
+            index.add_enzyme(enzyme)
+        return index
+
+    def lookup(self, name):
+        """Returns the hits for a name, after normalization.
+
+        :param name: enzyme name
+        :return: list of NameHit tuples, empty if the name is unknown
+        """
+        return list(self._hits.get(normalize_name(name), ()))
+
+    def ec_numbers(self, name):
+        """Returns the EC numbers an enzyme name resolves to.
+
+        :param name: enzyme name
+        :return: sorted list of EC numbers
+        """
+        return sorted({hit.ec_number for hit in self._hits.get(normalize_name(name), ())})
+
+    def complete(self, prefix, limit=10):
+        """Returns the hits of the names starting with a prefix, after
+        normalization, in lexicographical order of the normalized names.
+
+        :param prefix: beginning of an enzyme name
+        :param limit: maximum number of distinct normalized names, or None
+        :return: list of NameHit tuples
+        """
+        node = self._trie
+        for char in normalize_name(prefix):
+            node = node.get(char)
+            if node is None:
+                return list()
+
+        hits = list()
+        count = 0
+        stack = [node]
+        while stack and (limit is None or count < limit):
+            node = stack.pop()
+            if _KEY in node:
+                hits.extend(self._hits[node[_KEY]])
+                count += 1
+            stack.extend(node[char] for char in sorted(node, reverse=True) if char != _KEY)
+        return hits
+
+    def fuzzy(self, name, max_distance=1):
+        """Returns the hits of the names within a Levenshtein distance of a
+        name, after normalization.
+
+        The trie is traversed once, computing one row of the edit distance
+        matrix per node and pruning the subtries whose rows exceed
+        max_distance.
+
+        :param name: enzyme name
+        :param max_distance: maximum number of inserted, deleted or
+            substituted characters
+        :return: list of (distance, NameHit) tuples, closest names first
+        """
+        key = normalize_name(name)
+        first_row = list(range(len(key) + 1))
+        matches = list()
+        stack = [(node, char, first_row) for char, node in self._trie.items() if char != _KEY]
+        while stack:
+            node, char, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(key) + 1):
+                row.append(min(row[column - 1] + 1, previous_row[column] + 1,
+                               previous_row[column - 1] + (key[column - 1] != char)))
+            if _KEY in node and row[-1] <= max_distance:
+                matches.append((row[-1], node[_KEY]))
+            if min(row) <= max_distance:
+                stack.extend((child, child_char, row) for child_char, child in node.items()
+                             if child_char != _KEY)
+
+        return [(distance, hit) for distance, key in sorted(matches) for hit in self._hits[key]]
@@ -21,17 +21,24 @@ BRENDA Enzyme Database Parser
 .. |c| unicode:: U+A9
 """
 
-__all__ = ["BRENDAParser"]
+__all__ = ["BRENDAParser", "MalformedEntry", "CommentClause", "split_comment", "parse_entry",
+           "parse_entries", "iter_entries", "RecordStats", "SectionStats", "summarize_stats"]
 
 import re
-import codecs
-import typing
+import threading
 
-from collections import defaultdict
-from recordclass import recordclass
+from collections import defaultdict, deque, namedtuple
+
+try:  # optional, more compact mutable records
+    from recordclass import recordclass
+except ImportError:
+    recordclass = None
 
 from brenda.utils import ArgumentError, ProgressMeter, is_ec_number, has_ec_number, \
-    replace_abnormal_comment, init_tags, find_parentheses_indexes
+    replace_abnormal_comment, init_tags, find_parentheses_indexes, ec_prefixes, \
+    find_accessions, find_all, protein_field, LRUCache, unique_enzymes, \
+    comment_clause_separator, clause_proteins, clause_references, count_lines, iter_line_blocks
+from brenda.reactions import EQUATION_SECTIONS, ReactionNetwork, parse_equation
 
 
 class Enzyme:
@@ -54,9 +61,106 @@ class Enzyme:
     def __repr__(self):
         return self.ec_number
 
+    def __reduce__(self):
+        return _restore_enzyme, (self.ec_number, self.comment, self.proteins, self.references,
+                                 self.entries), _extra_state(self, _enzyme_fields)
+
+
+_current_fields = ['proteins', 'comment', 'information', 'references', 'ec_number', 'line_number']
+
+if recordclass is not None:
+    Current = recordclass('Current', _current_fields)
+else:
+    class Current:
+        """Mutable record of the entry being parsed (standard library
+        replacement of the recordclass type).
+        """
+
+        __slots__ = _current_fields
+
+        def __init__(self, proteins, comment, information, references, ec_number, line_number):
+            self.proteins = proteins
+            self.comment = comment
+            self.information = information
+            self.references = references
+            self.ec_number = ec_number
+            self.line_number = line_number
+
+        def __repr__(self):
+            return 'Current({})'.format(', '.join(
+                '{}={!r}'.format(field, getattr(self, field)) for field in self.__slots__))
+
+
+# Size of the record of an EC number (from its ID line to its '///' line) and
+# number of entries of each of its sections (see BRENDAParser.scan_stats)
+RecordStats = namedtuple('RecordStats', ['ec_number', 'line_number', 'lines', 'bytes', 'entries'])
+
+# Number of records having a section, and total and maximum number of entries
+# of the section per record (see summarize_stats)
+SectionStats = namedtuple('SectionStats', ['section', 'records', 'entries', 'max_entries'])
+
+# Entry that could not be parsed in tolerant mode
+MalformedEntry = namedtuple(
+    'MalformedEntry', ['line_number', 'ec_number', 'section', 'text', 'error'])
+
+# Clause of a comment, with the proteins and references it applies to
+CommentClause = namedtuple('CommentClause', ['text', 'proteins', 'references'])
+
+
+def _numbers(text):
+    return [int(number) for number in init_tags().numbers.findall(text)]
+
+
+def split_comment(text):
+    """Splits a comment into its clauses.
+
+    Clauses are separated by semicolons, and each clause is normally scoped to
+    the proteins (#...# tags) it starts with and the literature references
+    (<...> tags) it ends with, e.g. '#8# ordered bi-bi mechanism <8>; #1,2#
+    reaction mechanism <12>'. Semicolons that are not followed by a proteins
+    field do not start a new clause.
+
+    :param text: text of a comment
+    :return: list of CommentClause tuples, whose proteins and references are
+        None when the clause has no such tags
+    """
+    clauses = list()
+    if not text:
+        return clauses
+
+    for clause in comment_clause_separator.split(text):
+        proteins = references = None
+        mobj = clause_proteins.match(clause)
+        if mobj:
+            proteins = _numbers(mobj.group(1))
+            clause = clause[mobj.end():]
+        mobj = clause_references.search(clause)
+        if mobj:
+            references = _numbers(mobj.group(1))
+            clause = clause[:mobj.start()]
+        clauses.append(CommentClause(clause.strip(), proteins, references))
+    return clauses
+
+
+# Kinds of lines other than entry and continuation lines (see BRENDAParser.parse)
+_ID_LINE, _SECTION_LINE, _END_LINE = range(3)
+
+
+
+class _PendingEntry:
+    """Entry submitted to the thread pool, standing in for its result in the
+    section contents until the batch it belongs to is resolved.
+    """
+
+    __slots__ = ('line_number', 'enzyme', 'section', 'text', 'result', 'parsed')
 
-Current = recordclass(
-    'Current', ['proteins', 'comment', 'information', 'references', 'ec_number', 'line_number'])
+    def __init__(self, line_number, enzyme, section, text):
+        self.line_number = line_number
+        self.enzyme = enzyme
+        self.section = section
+        self.text = text
+        self.result = None
+        self.parsed = False
 
 
 class EntryComment:
@@ -74,10 +178,27 @@ class EntryComment:
     def __repr__(self):
         return self.msg
 
+    def __reduce__(self):
+        return _restore_comment, (self.msg, self.proteins, self.references), \
+            _extra_state(self, _comment_fields)
+
+    @property
+    def clauses(self):
+        """List of CommentClause tuples (see split_comment), computed on first
+        access.
+        """
+        try:
+            return self._clauses
+        except AttributeError:
+            self._clauses = split_comment(self.msg)
+            return self._clauses
+
 
 class Entry(EntryComment):
     """Encapsulates an entry in a BRENDA information field."""
 
+    clauses = None  # entries are not comments
+
     def __init__(self, message, current):
         """Initializes an Entry instance."""
         if not isinstance(current, Current):
@@ -86,18 +207,24 @@ class Entry(EntryComment):
         self.information = current.information
         self.comment = current.comment
 
+    def __reduce__(self):
+        return _restore_entry, (self.msg, self.proteins, self.references, self.information,
+                                self.comment), _extra_state(self, _entry_fields)
+
 
 class Protein:
     """Encapsulates an entry in a BRENDA PROTEIN (PR) field."""
 
     _counter = 1
+    _counter_lock = threading.Lock()
 
     def __init__(self, organism, current):
         """Initializes a Protein instance."""
         if not isinstance(current, Current):
             raise ArgumentError('Protein: expected type Current')
-        self._index = self._counter
-        self.__class__._counter += 1
+        with Protein._counter_lock:
+            self._index = Protein._counter
+            Protein._counter += 1
         self.organism = organism
         self.identifiers = current.proteins
         self.references = current.references
@@ -110,6 +237,66 @@ class Protein:
     def __repr__(self):
         return '<%s.%s, %d>' % (self.__module__, self.__class__.__name__, id(self))
 
+    def __reduce__(self):
+        return _restore_protein, (self._index, self.organism, self.identifiers, self.references,
+                                  self.information, self.comment), \
+            _extra_state(self, _protein_fields)
+
+
+# Compact pickling: instances are pickled as the arguments of the _restore_*
+# functions below rather than as their __dict__, whose keys would be pickled
+# (or referenced) for every instance. Other attributes (e.g. Protein.global_id)
+# are pickled as a dict; cached comment clauses are not pickled.
+_enzyme_fields = frozenset(('ec_number', 'comment', 'proteins', 'references', 'entries'))
+_comment_fields = frozenset(('msg', 'proteins', 'references', '_clauses'))
+_entry_fields = _comment_fields | {'information', 'comment'}
+_protein_fields = frozenset(('_index', 'organism', 'identifiers', 'references', 'information',
+                             'comment'))
+
+
+def _extra_state(obj, fields):
+    extra = {name: value for name, value in obj.__dict__.items() if name not in fields}
+    return extra or None
+
+
+def _restore_enzyme(ec_number, comment, proteins, references, entries):
+    enzyme = Enzyme.__new__(Enzyme)
+    enzyme.ec_number = ec_number
+    enzyme.comment = comment
+    enzyme.proteins = proteins
+    enzyme.references = references
+    enzyme.entries = entries
+    return enzyme
+
+
+def _restore_comment(message, proteins, references):
+    comment = EntryComment.__new__(EntryComment)
+    comment.msg = message
+    comment.proteins = proteins
+    comment.references = references
+    return comment
+
+
+def _restore_entry(message, proteins, references, information, comment):
+    entry = Entry.__new__(Entry)
+    entry.msg = message
+    entry.proteins = proteins
+    entry.references = references
+    entry.information = information
+    entry.comment = comment
+    return entry
+
+
+def _restore_protein(index, organism, identifiers, references, information, comment):
+    protein = Protein.__new__(Protein)
+    protein._index = index
+    protein.organism = organism
+    protein.identifiers = identifiers
+    protein.references = references
+    protein.information = information
+    protein.comment = comment
+    return protein
+
 
 class BRENDAParser:
     """Encapsulates the parsing of a BRENDA database plain text file."""
@@ -122,7 +309,7 @@ class BRENDAParser:
         'CRYSTALLIZATION': 'CR',
         'ENGINEERING': 'EN',
         'GENERAL_STABILITY': 'GS',
-        'IC50_VALUE': 'IC5',
+        'IC50_VALUE': 'IC50',
         'INHIBITORS': 'IN',
         'KI_VALUE': 'KI',
         'KM_VALUE': 'KM',
@@ -156,8 +343,50 @@ class BRENDAParser:
         'TEMPERATURE_RANGE': 'TR',
         'TEMPERATURE_STABILITY': 'TS'}
 
-    def __init__(self, filename, encoding='utf8'):
-        """Initializes a BRENDAParser instance."""
+    # short section identifier -> section name, e.g. 'PR' -> 'PROTEIN'
+    _section_names = {short: section for section, short in _sections.items()}
+
+    # leading token -> kind of line (see parse); the short identifier of the
+    # current section (entry lines) is checked first, other tokens denote
+    # continuation lines
+    _line_kinds = dict.fromkeys(_sections, _SECTION_LINE)
+    _line_kinds.update({'ID': _ID_LINE, '///': _END_LINE})
+
+    # first characters of the leading tokens above and of short section
+    # identifiers: lines starting otherwise are continuation lines
+    _token_initials = frozenset(token[0] for token in list(_line_kinds) + list(_section_names))
+
+    def __init__(self, filename, encoding='utf8', equations=False, tolerant=False,
+                 max_errors=None, cache_size=0, threads=None, registry=None, store=None):
+        """Initializes a BRENDAParser instance.
+
+        :param filename: path of the BRENDA flat file
+        :param encoding: encoding of the BRENDA flat file
+        :param equations: whether REACTION, SUBSTRATE_PRODUCT and
+            NATURAL_SUBSTRATE_PRODUCT entries should be split into substrates
+            and products (stored in their equation attribute) and collected in
+            a ReactionNetwork (stored in the network attribute)
+        :param tolerant: whether malformed entries should be recorded in the
+            errors attribute (as MalformedEntry tuples) and skipped instead of
+            aborting the parsing
+        :param max_errors: maximum number of malformed entries tolerated
+            before aborting the parsing, or None for no limit; only relevant
+            in tolerant mode
+        :param cache_size: number of distinct (section, entry text) pairs whose
+            parsed Entry is memoized, or 0 to disable memoization; identical
+            entries then share the same Entry instance, which must not be
+            modified
+        :param threads: number of worker threads parsing entries concurrently
+            (see parse_entry), or None to parse entries in the calling thread
+        :param registry: a ProteinRegistry in which every parsed protein is
+            registered, or None
+        :param store: an EnzymeStore to which every Enzyme is written once
+            parsed, or None; parse then returns the store instead of a dict,
+            so that only the enzyme being parsed is kept in memory (cannot be
+            combined with threads)
+        """
+        if store is not None and threads:
+            raise ArgumentError('Cannot parse with threads into an EnzymeStore')
         object.__init__(self)
         self._filename = filename
         self._file_handle = None
@@ -173,22 +402,38 @@ class BRENDAParser:
 
         self._skip = False  # skip to next EC number?
         self.enzymes = None  # dict of EC numbers
+        self.network = ReactionNetwork() if equations else None
+
+        self._tolerant = tolerant
+        self._max_errors = max_errors
+        self.errors = list()  # malformed entries skipped in tolerant mode
+
+        self._cache = LRUCache(cache_size) if cache_size else None
+
+        self._threads = threads
+        self._executor = None  # thread pool, while parsing with threads
+        self._batch = list()  # entries of the current record, while parsing with threads
+        self._pending = deque()  # (future, batch, finished Enzyme) submitted to the thread pool
+
+        self.registry = registry
+        self._store = store
 
     def __enter__(self):
         """Opens file and initializes progress meter."""
-        self._file_handle = codecs.open(self._filename, mode='rb', encoding=self._encoding)
-        tmp = self._file_handle.readlines()
-        self._file_handle.close()
-        self._file_handle = tmp
-        self._progress = ProgressMeter('Parsing flat file', len(tmp))
-        self.enzymes = defaultdict(list)
+        self._progress = ProgressMeter('Parsing flat file',
+                                       count_lines(self._filename, self._encoding))
+        self._file_handle = open(self._filename, encoding=self._encoding, newline='')
+        self.enzymes = defaultdict(list) if self._store is None else None
+        self.errors = list()
         self._current.line_number = 0
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Closes the file handle."""
-        if not isinstance(self._file_handle, list):
+        """Closes the file handle and stops worker threads, if any."""
+        if self._file_handle is not None:
             self._file_handle.close()
+            self._file_handle = None
+        self._shutdown_executor()
         return False
 
     def _reset_parser(self):
@@ -210,69 +455,321 @@ class BRENDAParser:
     def parse(self):
         """Parses multiple Enzyme sections.
 
-        :return: dict of Enzyme objects
+        :return: dict of Enzyme objects, or the EnzymeStore given as store
+            option
         """
         section_name = ''  # long section identifier, e.g. 'PROTEIN'
         section_contents = list()  # contents of the section identified by section_name
         short_entry = ''  # two- or three- letter section identifier, e.g. 'PR' for 'PROTEIN'
         entry = list()  # contents of an entry identified by short_entry
+        entry_line = 0  # line number where the current entry starts
         parser = self._parse_generic_entry
 
-        for line in self._file_handle:
-            if self._current.line_number % 1000 == 0:
-                self._progress.update(self._current.line_number)
-            self._current.line_number += 1
-
-            line = line.rstrip()
-            if not line or line.startswith('*'):
-                continue
-
-            content = line.split(None, 1)
-            if content[0] == 'ID' and has_ec_number(content[1]):
-                self._parse_id(content[1])
-            elif content[0] in self._sections.keys():  # handle new section
-                # Finish handling previous section
-                if content[1:]:  # not a new section, actually
-                    entry.append(line.lstrip())
+        # section name -> (short section identifier, parsing function)
+        sections = {section: (short, self._determine_parser_from_section_name(section))
+                    for section, short in self._sections.items()}
+        line_kinds = self._line_kinds
+        token_initials = self._token_initials
+        current = self._current
+        progress = self._progress
+        add_entry = self._add_entry
+        line_number = current.line_number
+
+        if self._threads:
+            from concurrent.futures import ThreadPoolExecutor  # slow to import
+            self._executor = ThreadPoolExecutor(max_workers=self._threads)
+            self._batch = list()
+            self._pending = deque()
+
+        for lines in iter_line_blocks(self._file_handle):
+            progress.update(line_number)
+            for line in lines:
+                line_number += 1
+
+                text = line.strip()
+                if not text or line[0] == '*':
                     continue
-                if entry:
-                    section_contents.append(parser(' '.join(entry)))
-                if section_contents and not self.is_section_redundant(section_name):
-                    if self._current.ec_number is None:  # skip to next EC due to invalid ID
-                        self._skip = True
-                        continue
-                    self._current.ec_number.entries[section_name] = section_contents
-
-                # Prepare to process current section
-                section_contents = list()
-                entry = list()
-                section_name = content[0]
-                parser = self._determine_parser_from_section_name(section_name)
-                short_entry = self._sections.get(section_name, False)
-                if not short_entry:
-                    raise ArgumentError('Unrecognised entry: \'{}\' @ #%{}'
-                                        .format(line, self._current.line_number))
-            elif content[0] == short_entry:  # handle previous and current entries
-                if entry:
-                    section_contents.append(parser(' '.join(entry)))
-                entry = content[1:]
-            elif content[0] == '///':  # handle end of EC number description
-                if self._skip:
-                    self._skip = False
+                if text[0] not in token_initials:  # continuation line
+                    entry.append(text)
                     continue
-                # end one enzyme entry
-                if entry:
-                    section_contents.append(parser(' '.join(entry)))
-                if section_contents and not self.is_section_redundant(section_name):
-                    self._current.ec_number.entries[section_name] = section_contents
-                self._current.ec_number = None
-            else:
-                entry.append(line.lstrip())
+                content = text.split(None, 1)
+                token = content[0]
+
+                if token == short_entry:  # handle previous and current entries
+                    current.line_number = line_number
+                    if entry:
+                        add_entry(section_contents, parser, section_name, entry, entry_line)
+                    entry = content[1:]
+                    entry_line = line_number
+                    continue
+                kind = line_kinds.get(token)
+                if kind is None:  # continuation line
+                    entry.append(text)
+                    continue
+
+                current.line_number = line_number
+                if kind == _ID_LINE:
+                    if len(content) > 1 and has_ec_number(content[1]):
+                        self._parse_id(content[1])
+                    else:
+                        entry.append(text)
+                elif kind == _SECTION_LINE:  # handle new section
+                    # Finish handling previous section
+                    if len(content) > 1:  # not a new section, actually
+                        entry.append(text)
+                        continue
+                    if entry:
+                        add_entry(section_contents, parser, section_name, entry, entry_line)
+                    if section_contents and not self.is_section_redundant(section_name):
+                        if current.ec_number is None:  # skip to next EC due to invalid ID
+                            self._skip = True
+                            continue
+                        self._store_section(section_name, section_contents)
+
+                    # Prepare to process current section
+                    section_contents = list()
+                    entry = list()
+                    section_name = token
+                    short_entry, parser = sections[section_name]
+                else:  # handle end of EC number description
+                    if self._skip:
+                        self._skip = False
+                    else:  # end one enzyme entry
+                        if entry:
+                            add_entry(section_contents, parser, section_name, entry, entry_line)
+                        if section_contents and not self.is_section_redundant(section_name):
+                            self._store_section(section_name, section_contents)
+                        self._finish_enzyme()
+                    # do not carry the last entry and section over to the next record
+                    section_contents = list()
+                    entry = list()
+        current.line_number = line_number
+        if self._executor is not None:
+            try:
+                self._submit_batch(current.ec_number)  # record lacking its '///' line, if any
+                while self._pending:
+                    self._resolve_batch()
+            finally:
+                self._shutdown_executor()
+        if self._store is not None:
+            self._finish_enzyme()
+            self._store.commit()
+            self._progress.close()
+            return self._store
         # convert to normal dictionary again
         res = dict(self.enzymes)
         self._progress.close()
         return res
 
+    def _finish_enzyme(self):
+        """Writes the current Enzyme to the store, if any, and clears it. When
+        parsing with threads, the entries of the record are submitted to the
+        thread pool instead.
+        """
+        if self._executor is not None:
+            self._submit_batch(self._current.ec_number)
+        if self._store is not None and self._current.ec_number is not None:
+            self._store.add(self._current.ec_number)
+        self._current.ec_number = None
+
+    def scan_stats(self):
+        """Counts the lines, bytes and entries of every record of the flat file
+        without parsing entries.
+
+        Only the leading token of every line is examined (ID, section names,
+        short section identifiers and '///'), so that scanning is much faster
+        than parsing. The number of proteins of an EC number is the number of
+        entries of its PROTEIN section. Entries are counted as they appear in
+        the flat file: unlike parse, which keeps the last occurrence, repeated
+        sections and protein identifiers are counted as many times as they
+        occur. The file does not need to be opened with a with statement
+        beforehand.
+
+        :return: list of RecordStats tuples, in the order of the flat file
+        """
+        headers = {section.encode(): (section, short.encode())
+                   for section, short in self._sections.items()}
+        records = list()
+        record = None
+        section = short = None
+        entries = None
+        with open(self._filename, 'rb') as handle:
+            for line_number, line in enumerate(handle, 1):
+                if record is not None:
+                    record[2] += 1
+                    record[3] += len(line)
+                if line[:1] in (b'\t', b' ', b'\n', b'\r', b'*'):
+                    continue  # continuation, blank or comment line
+                content = line.split(None, 1)
+                if not content:
+                    continue
+                token = content[0]
+                if token == short:
+                    entries[section] += 1
+                elif token == b'ID' and len(content) > 1:
+                    if record is not None:  # previous record lacks its '///' line
+                        record[2] -= 1
+                        record[3] -= len(line)
+                        records.append(RecordStats(*record))
+                    entries = dict()
+                    ec_number = content[1].split(None, 1)[0].decode(self._encoding)
+                    record = [ec_number.split('(')[0], line_number, 1, len(line), entries]
+                    section = short = None
+                elif token == b'///':
+                    if record is not None:
+                        records.append(RecordStats(*record))
+                    record = None
+                    section = short = None
+                elif token in headers and len(content) == 1 and record is not None:
+                    section, short = headers[token]
+                    entries.setdefault(section, 0)
+        if record is not None:
+            records.append(RecordStats(*record))
+        return records
+
+    def cache_info(self):
+        """Returns hit and miss statistics of the entry cache (see the
+        cache_size option) as a CacheInfo tuple, or None if the cache is
+        disabled.
+        """
+        return self._cache.info() if self._cache is not None else None
+
+    def _add_entry(self, section_contents, parser, section_name, entry, line_number):
+        """Parses an entry and appends the result to the section contents.
+
+        In tolerant mode, an entry that cannot be parsed is recorded as a
+        MalformedEntry in the errors attribute and skipped. An ArgumentError is
+        raised when the number of malformed entries exceeds max_errors.
+
+        :param section_contents: list of parsed entries of the current section
+        :param parser: parsing function for the current section
+        :param section_name: name of the current section
+        :param entry: list of lines making up the entry
+        :param line_number: line number where the entry starts
+        """
+        text = ' '.join(entry)
+        if self._executor is not None:
+            pending = _PendingEntry(line_number, self._current.ec_number, section_name, text)
+            self._batch.append(pending)
+            section_contents.append(pending)
+            return
+        current = self._current
+        current_line, current.line_number = current.line_number, line_number  # for error messages
+        try:
+            if self._cache is not None and parser == self._parse_generic_entry:
+                key = (section_name, text)
+                result = self._cache.get(key)
+                if result is None:
+                    result = parser(text)
+                    self._cache.put(key, result)
+                section_contents.append(result)
+            else:
+                section_contents.append(parser(text))
+        except Exception as err:
+            if not self._tolerant:
+                raise
+            self._record_error(err, line_number, current.ec_number, section_name, text)
+        finally:
+            current.line_number = current_line
+
+    def _record_error(self, err, line_number, enzyme, section_name, text):
+        """Records a malformed entry in tolerant mode, and raises an
+        ArgumentError when the number of malformed entries exceeds max_errors.
+        """
+        ec_number = enzyme.ec_number if enzyme is not None else None
+        self.errors.append(MalformedEntry(line_number, ec_number, section_name, text, err))
+        if self._max_errors is not None and len(self.errors) > self._max_errors:
+            raise ArgumentError('Too many malformed entries (%s), last one @ #%s: %s',
+                                len(self.errors), line_number, err)
+
+    def _submit_batch(self, enzyme):
+        """Submits the entries of a record to the thread pool as a single batch,
+        and resolves the oldest batches so that at most two per thread are in
+        flight.
+
+        :param enzyme: Enzyme instance of the finished record, whose entries
+            are replaced by their results once the batch is resolved, or None
+        """
+        batch = self._batch
+        self._batch = list()
+        if not batch and enzyme is None:
+            return
+        entries = [(pending.section, pending.text, pending.line_number) for pending in batch]
+        self._pending.append((self._executor.submit(_parse_batch, entries), batch, enzyme))
+        while len(self._pending) > 2 * self._threads:
+            self._resolve_batch()
+
+    def _resolve_batch(self):
+        """Waits for the oldest batch submitted to the thread pool and stores its
+        results, in the order of the flat file: proteins in their Enzyme, and
+        entries in the sections of the finished Enzyme.
+        """
+        future, batch, enzyme = self._pending.popleft()
+        for pending, (result, err) in zip(batch, future.result()):
+            if err is None and pending.section == 'PROTEIN':
+                try:
+                    self._store_protein(pending.enzyme, *result)
+                except Exception as store_err:
+                    err = store_err
+            if err is not None:
+                if not self._tolerant:
+                    raise err
+                self._record_error(err, pending.line_number, pending.enzyme, pending.section,
+                                   pending.text)
+                continue
+            if self._cache is not None and not self.is_section_redundant(pending.section):
+                key = (pending.section, pending.text)
+                cached = self._cache.get(key)
+                if cached is None:
+                    self._cache.put(key, result)
+                else:
+                    result = cached
+            pending.result = result
+            pending.parsed = True
+            pending.text = None
+        if enzyme is None:
+            return
+
+        for section_name in list(enzyme.entries):
+            section_contents = [pending.result for pending in enzyme.entries[section_name]
+                                if pending.parsed]
+            if section_contents:
+                enzyme.entries[section_name] = section_contents
+                self._add_equations(enzyme, section_name, section_contents)
+            else:
+                del enzyme.entries[section_name]
+
+    def _shutdown_executor(self):
+        """Stops the worker threads, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _store_section(self, section_name, section_contents):
+        """Stores the parsed entries of a section in the current Enzyme.
+
+        :param section_name: name of the section, e.g. 'REACTION'
+        :param section_contents: list of Entry objects
+        """
+        enzyme = self._current.ec_number
+        enzyme.entries[section_name] = section_contents
+        if self._executor is None:  # otherwise done once entries are resolved
+            self._add_equations(enzyme, section_name, section_contents)
+
+    def _add_equations(self, enzyme, section_name, section_contents):
+        """Splits the equations of a section's entries and adds them to the
+        reaction network, if enabled.
+
+        :param enzyme: Enzyme instance the section belongs to
+        :param section_name: name of the section, e.g. 'REACTION'
+        :param section_contents: list of Entry objects
+        """
+        if self.network is not None and section_name in EQUATION_SECTIONS:
+            for index, entry in enumerate(section_contents):
+                entry.equation = parse_equation(entry.msg)
+                if entry.equation is not None:
+                    self.network.add(entry.equation, (enzyme.ec_number, section_name, index))
+
     def _determine_parser_from_section_name(self, section_name):
         """Returns the appropriate parser depending on the current section.
 
@@ -312,12 +809,11 @@ class BRENDAParser:
         :param text: text that may contain information
         :return: text resulting from information extraction
         """
-        mobj = self._tags.information.search(text)
+        occurrences = list(self._tags.information.finditer(text)) if '{' in text else None
+        mobj = occurrences[-1] if occurrences else None
 
         if mobj:
-            occurrences = [x for x in re.finditer(self._tags.information, text)]
-            start, end = (occurrences[-1].start(), occurrences[-1].end()) if len(occurrences) > 1\
-                else (mobj.start(), mobj.end())
+            start, end = mobj.start(), mobj.end()
             self._current.information = text[(start + 1):(end - 1)]
             if not self._current.information.strip():
                 self._current.information = None
@@ -334,8 +830,7 @@ class BRENDAParser:
         :param text: text that may represent a proteins field
         :return: True if text contains protein references, False otherwise
         """
-        pattern = re.compile(r'#(\d)+(,*(\s)*\d+)*#')
-        return pattern.match(text)
+        return protein_field.match(text)
 
     def _clean_extra_hash_characters(self, text):
         """If extra hash ('#') characters are present in the given text, remove
@@ -349,7 +844,7 @@ class BRENDAParser:
             the hash character
         """
         if '#' in text:
-            hashes = [x.start() for x in re.finditer(r'#', text)]
+            hashes = find_all(text, '#')
             if len(hashes) == 1:
                 text = text.replace('#', '')
             elif len(hashes) % 2:
@@ -380,8 +875,8 @@ class BRENDAParser:
             text = self._clean_extra_hash_characters(text)
             pobj = self._tags.protein.search(text)
             if not pobj or pobj.start() != 0:
-                raise ArgumentError('Protein reference missing: \'{}\' @ #%{}'
-                                    .format(text, self._current.line_number))
+                raise ArgumentError('Protein reference missing: \'%s\' @ #%s',
+                                    text, self._current.line_number)
             _, self._current.proteins = self._extract_numbers(pobj.group(), self._tags.protein)
             if self._current.proteins is not None:
                 text = text[pobj.end():]
@@ -402,9 +897,9 @@ class BRENDAParser:
         :return: text resulting from the extraction of literature references
         """
         if text.endswith('>'):
-            if self._tags.reference.search(text):
-                ref_matches = [x for x in self._tags.reference.finditer(text)]
-                if ref_matches and ref_matches[-1].end() == len(text):
+            ref_matches = list(self._tags.reference.finditer(text))
+            if ref_matches:
+                if ref_matches[-1].end() == len(text):
                     _, self._current.references = \
                         self._extract_numbers(ref_matches[-1].group(), self._tags.reference)
                 if self._current.references is not None:
@@ -426,7 +921,7 @@ class BRENDAParser:
             a pipe character, if there is an odd number of occurrences
         """
         if '|' in text:
-            pipes = [x.start() for x in re.finditer(r'\|', text)]
+            pipes = find_all(text, '|')
             if len(pipes) == 1:
                 text = text.replace('|', '')
             elif len(pipes) % 2:  # suppress first occurrence
@@ -467,12 +962,13 @@ class BRENDAParser:
         if not cobj:
             return replace_abnormal_comment(text, aobj)
 
-        comment_end = [x.start() for x in re.finditer(r'\)', text) if x.start() < aobj.start()]
-        if not comment_end:
+        comm_end = text.rfind(')', 0, aobj.start())
+        if comm_end == -1:
             return replace_abnormal_comment(text, aobj)
 
-        comm_end = comment_end[-1]
-        comm_start = [x.start() for x in re.finditer(r'\(', text) if x.start() < comm_end][-1]
+        comm_start = text.rfind('(', 0, comm_end)
+        if comm_start == -1:
+            return replace_abnormal_comment(text, aobj)
         comment = text[comm_start:comm_end]
         if self.has_comment_structure(comment):
             return text[:comm_end] + '; ' + aobj.group(1) + ')'
@@ -490,7 +986,7 @@ class BRENDAParser:
         :param pattern: a re pattern
         :return: text resulting from number extraction
         """
-        if not isinstance(pattern, typing.Pattern):
+        if not isinstance(pattern, re.Pattern):
             raise ArgumentError('Expected re.Pattern: {}'.format(pattern))
 
         numbers = None
@@ -617,18 +1113,21 @@ class BRENDAParser:
         :param pattern: pattern describing the numbers
         :return: the list of numbers in comment
         """
-        if not isinstance(pattern, typing.Pattern):
+        if not isinstance(pattern, re.Pattern):
             raise ArgumentError('Expected re.Pattern: {}'.format(pattern))
 
         if comment is None or not comment.strip():
             return None
 
         numbers = list()
+        seen = set()
 
-        matches = [match.group() for match in pattern.finditer(comment)]
-        for number in matches:
-            _, values = self._extract_numbers(number, pattern)
-            numbers.extend([v for v in values if v not in numbers])
+        for mobj in pattern.finditer(comment):
+            for number in self._tags.numbers.findall(mobj.group(1)):
+                value = int(number)
+                if value not in seen:
+                    seen.add(value)
+                    numbers.append(value)
 
         return numbers
 
@@ -652,15 +1151,36 @@ class BRENDAParser:
 
         text = text.strip()
         if is_ec_number(text):
+            self._finish_enzyme()  # previous record may lack its '///' line
             self._current.ec_number = Enzyme(text, comment.msg if comment else None)
-            ec_num = text.split(".")
-            for i in range(1, len(ec_num) + 1):
-                self.enzymes[".".join(ec_num[:i])].append(self._current.ec_number)
+            if self._store is None:
+                for prefix in ec_prefixes(text):
+                    self.enzymes[prefix].append(self._current.ec_number)
 
     def _parse_protein(self, text):
+        """Parses a PROTEIN (PR) entry from the BRENDA flat file and stores the
+        resulting Protein in the current Enzyme.
+
+        :param text: text that represents a PROTEIN (PR) entry
+        """
+        self._store_protein(self._current.ec_number, *self._build_protein(text))
+
+    def _store_protein(self, enzyme, protein_id, protein):
+        """Stores a parsed protein in an Enzyme, registering it if needed.
+
+        :param enzyme: Enzyme instance the protein belongs to
+        :param protein_id: protein identifier (between #...# tags)
+        :param protein: Protein instance
+        """
+        enzyme.proteins[protein_id] = protein
+        if self.registry is not None:
+            self.registry.register(enzyme.ec_number, protein_id, protein)
+
+    def _build_protein(self, text):
         """Parses a PROTEIN (PR) entry from the BRENDA flat file.
 
         :param text: text that represents a PROTEIN (PR) entry
+        :return: protein identifier (between #...# tags), and Protein instance
         """
         self._reset_parser()
         text = self.extract_information(text)
@@ -668,16 +1188,16 @@ class BRENDAParser:
 
         mobj = self._tags.protein.search(text)
         if not mobj:
-            raise ArgumentError(
-                'Protein reference missing: \'{}\' @ #{}'.format(text, self._current.line_number))
+            raise ArgumentError('Protein reference missing: \'%s\' @ #%s',
+                                text, self._current.line_number)
 
         protein_id = int(mobj.group(1))
         text = text[:mobj.start()] + text[mobj.end():]
         text, accessions = self._extract_accessions(text)
 
-        self._current.proteins = sorted(list(set(accessions)))
+        self._current.proteins = sorted(set(accessions))
         text, self._current.references = self._extract_numbers(text, self._tags.reference)
-        self._current.ec_number.proteins[protein_id] = Protein(text.strip(), self._current)
+        return protein_id, Protein(text.strip(), self._current)
 
     def _extract_accessions(self, text):
         """Extracts and returns protein accessions from the given text, as well
@@ -689,24 +1209,200 @@ class BRENDAParser:
         """
         accessions = list()
 
-        accession_occurrences = self._tags.accession.findall(text)
-        if accession_occurrences:
-            accessions = [acc for acc, data_bank in accession_occurrences]
+        matches = find_accessions(text, self._tags.accession)
+        if matches:
+            accessions = [mobj.group(1) for mobj in matches]
+            last = matches[-1]
+            end = last.end(2) if last.group(2) else last.end(1)
+            text = text[:matches[0].start()] + text[end:]
+
+        return text.strip(), accessions
+
+    def _parse_reference(self, text):
+        pass
+
 
-            first_acc = accession_occurrences[0][0]
-            last_acc = accession_occurrences[-1][0]
-            last_bank = accession_occurrences[-1][1]
+def summarize_stats(records):
+    """Summarizes the statistics of the records of a flat file per section.
 
-            possible_end = text.index(last_acc) + len(last_acc)
-            if last_bank is None:
-                end = possible_end
+    :param records: list of RecordStats tuples, see BRENDAParser.scan_stats
+    :return: list of SectionStats tuples, sections with the most entries first
+    """
+    summary = dict()  # section -> [records, entries, max entries]
+    for record in records:
+        for section, count in record.entries.items():
+            stats = summary.get(section)
+            if stats is None:
+                summary[section] = [1, count, count]
             else:
-                tmp_text = text[possible_end:]
-                end = possible_end + tmp_text.index(last_bank) + len(last_bank)
+                stats[0] += 1
+                stats[1] += count
+                stats[2] = max(stats[2], count)
+    return sorted((SectionStats(section, *stats) for section, stats in summary.items()),
+                  key=lambda stats: (-stats.entries, stats.section))
+
+
+def _parse_entry_with(parser, section, text, line_number=None):
+    """Parses a single entry with the given parser, resetting its state.
+
+    :param parser: a BRENDAParser instance that is not parsing a file
+    :param section: section name (e.g. 'SUBSTRATE_PRODUCT') or short section
+        identifier (e.g. 'SP')
+    :param text: text of the entry
+    :param line_number: line number of the entry, only used in error messages
+    :return: see parse_entry
+    """
+    section = BRENDAParser._section_names.get(section, section)
+    parser._current.line_number = line_number
+    if section == 'PROTEIN':
+        return parser._build_protein(text)
+    if section == 'REFERENCE':
+        return parser._parse_reference(text)
+    return parser._parse_generic_entry(text)
 
-            text = text[:text.index(first_acc)] + text[end:]
 
-        return text.strip(), accessions
+def _parse_batch(entries):
+    """Parses the entries of a record with a single parser.
 
-    def _parse_reference(self, text):
-        pass
+    :param entries: list of (section, text, line number) triples
+    :return: list of (result, error) pairs, one of which is None (see
+        parse_entry)
+    """
+    parser = BRENDAParser(None)
+    results = list()
+    for section, text, line_number in entries:
+        try:
+            results.append((_parse_entry_with(parser, section, text, line_number), None))
+        except Exception as err:
+            results.append((None, err))
+    return results
+
+
+def parse_entry(section, text, line_number=None):
+    """Parses a single entry of the BRENDA flat file.
+
+    This function does not share any state with other calls or with
+    BRENDAParser instances, and may therefore be called concurrently from
+    multiple threads. Every call returns newly created objects.
+
+    :param section: name of the section the entry belongs to, e.g.
+        'SUBSTRATE_PRODUCT', or its short identifier, e.g. 'SP'
+    :param text: text of the entry, without the short section identifier and
+        with continuation lines joined by spaces
+    :param line_number: line number of the entry, only used in error messages
+    :return: (protein identifier, Protein instance) tuple for PROTEIN entries,
+        None for REFERENCE entries (not parsed yet), and an Entry instance
+        otherwise
+    """
+    return _parse_entry_with(BRENDAParser(None), section, text, line_number)
+
+
+def _parse_chunk(chunk, start, tolerant):
+    """Parses a list of (section, text) pairs with a single parser.
+
+    :param chunk: list of (section, text) pairs
+    :param start: index of the first pair in the whole batch
+    :param tolerant: whether to return MalformedEntry tuples for entries that
+        cannot be parsed, instead of raising
+    :return: list of parsing results (see parse_entry)
+    """
+    parser = BRENDAParser(None)
+    results = list()
+    for index, (section, text) in enumerate(chunk, start):
+        try:
+            results.append(_parse_entry_with(parser, section, text, index))
+        except Exception as err:
+            if not tolerant:
+                raise
+            results.append(MalformedEntry(index, None, section, text, err))
+    return results
+
+
+def _renumber_proteins(results):
+    """Gives the proteins parsed by an executor indexes of the calling
+    process: worker processes each have their own Protein counter, hence
+    their indexes would repeat across chunks.
+
+    :param results: list of parsing results (see parse_entry)
+    :return: results
+    """
+    with Protein._counter_lock:
+        for result in results:
+            if type(result) is tuple and isinstance(result[1], Protein):
+                result[1]._index = Protein._counter
+                Protein._counter += 1
+    return results
+
+
+def iter_entries(entries, chunk_size=1000, workers=None, executor=None, tolerant=False):
+    """Parses (section, text) pairs in batches, yielding results in order.
+
+    Entries are parsed in chunks of chunk_size pairs sharing a single parser.
+    Chunks are parsed in the calling thread, by a pool of worker processes, or
+    by the given executor. At most two chunks per worker are in flight at any
+    time, so that entries may be streamed from an arbitrarily large iterable.
+    Proteins parsed by workers are numbered (Protein._index) in the calling
+    process, in the order they are yielded.
+
+    :param entries: iterable of (section, text) pairs, where section is a
+        section name or a short section identifier (see parse_entry)
+    :param chunk_size: number of entries parsed at once
+    :param workers: number of worker processes, or None to parse in the
+        calling thread; if executor is given, number of its workers (1 if
+        None), which bounds the number of chunks in flight
+    :param executor: a concurrent.futures.Executor parsing the chunks (e.g. a
+        ThreadPoolExecutor on free-threaded Python builds)
+    :param tolerant: whether to yield a MalformedEntry tuple (whose
+        line_number is the index of the entry in entries) for entries that
+        cannot be parsed, instead of raising
+    :return: generator of parsing results (see parse_entry)
+    """
+    if chunk_size <= 0:
+        raise ArgumentError('Expected positive chunk size: {}'.format(chunk_size))
+
+    chunks = _chunks(entries, chunk_size)
+    if executor is None and not workers:
+        for start, chunk in chunks:
+            yield from _parse_chunk(chunk, start, tolerant)
+        return
+
+    own_executor = executor is None
+    if own_executor:
+        from concurrent.futures import ProcessPoolExecutor  # slow to import
+        executor = ProcessPoolExecutor(max_workers=workers)
+    max_in_flight = 2 * (workers or 1)
+    in_flight = deque()
+    try:
+        for start, chunk in chunks:
+            in_flight.append(executor.submit(_parse_chunk, chunk, start, tolerant))
+            if len(in_flight) >= max_in_flight:
+                yield from _renumber_proteins(in_flight.popleft().result())
+        while in_flight:
+            yield from _renumber_proteins(in_flight.popleft().result())
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def _chunks(entries, chunk_size):
+    """Yields (start index, list of at most chunk_size items) pairs."""
+    start = 0
+    chunk = list()
+    for item in entries:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield start, chunk
+            start += chunk_size
+            chunk = list()
+    if chunk:
+        yield start, chunk
+
+
+def parse_entries(entries, chunk_size=1000, workers=None, executor=None, tolerant=False):
+    """Parses (section, text) pairs in batches (see iter_entries).
+
+    :return: list of parsing results, in the order of entries
+    """
+    return list(iter_entries(entries, chunk_size, workers, executor, tolerant))
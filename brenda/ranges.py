@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Ranges
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    ranges.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["RANGE_SECTIONS", "RangeHit", "RangeIndex", "parse_range"]
+
+import re
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from brenda.utils import ArgumentError, unique_enzymes
+
+
+# Sections whose entries are numerical values or ranges such as '7.5-8.0'
+# (kinetic values are given for the substrate or inhibitor in their information)
+RANGE_SECTIONS = ('PH_OPTIMUM', 'PH_RANGE', 'PH_STABILITY', 'TEMPERATURE_OPTIMUM',
+                  'TEMPERATURE_RANGE', 'TEMPERATURE_STABILITY', 'MOLECULAR_WEIGHT', 'PI_VALUE',
+                  'KM_VALUE', 'TURNOVER_NUMBER', 'KI_VALUE', 'IC50_VALUE', 'SPECIFIC_ACTIVITY')
+
+# BRENDA marks unknown values with -999
+UNKNOWN_VALUE = -999
+
+# An entry (index-th of a section of an EC number) for one of its proteins
+# (None if the entry has no protein references)
+RangeHit = namedtuple('RangeHit', ['ec_number', 'protein', 'section', 'index'])
+
+_range = re.compile(r'(-?\d+(?:\.\d+)?)(?:\s*-\s*(-?\d+(?:\.\d+)?))?$')
+
+
+def parse_range(text):
+    """Parses a value ('7') or a range ('6.5-7.5') of a numerical entry.
+
+    :param text: message of an entry
+    :return: (low, high) tuple of floats (equal for single values), or None if
+        text is not a known value or range
+    """
+    if text is None:
+        return None
+    mobj = _range.match(text.strip())
+    if not mobj:
+        return None
+    low = float(mobj.group(1))
+    high = float(mobj.group(2)) if mobj.group(2) is not None else low
+    if low == UNKNOWN_VALUE:
+        return None
+    return (low, high) if low <= high else (high, low)
+
+
+class _SectionIntervals:
+    """Intervals of one section, sorted by low and by high endpoints."""
+
+    def __init__(self, intervals):
+        by_low = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        by_high = sorted(range(len(intervals)), key=lambda i: intervals[i][1])
+        self.lows = array('d', (intervals[i][0] for i in by_low))
+        self.highs = array('d', (intervals[i][1] for i in by_high))
+        self.by_low = array('l', by_low)
+        self.by_high = array('l', by_high)
+        self.intervals = intervals
+
+    def overlapping(self, low, high):
+        """Returns the indexes of the intervals overlapping [low, high]."""
+        # intervals starting at or before high, and intervals ending at or
+        # after low; enumerate the smaller set and check the other endpoint
+        n_starting = bisect_right(self.lows, high)
+        first_ending = bisect_left(self.highs, low)
+        if n_starting <= len(self.highs) - first_ending:
+            return [i for i in self.by_low[:n_starting] if self.intervals[i][1] >= low]
+        return [i for i in self.by_high[first_ending:] if self.intervals[i][0] <= high]
+
+
+class RangeIndex:
+    """Range query index over numerical sections (see RANGE_SECTIONS).
+
+    Every entry whose message is a value or a range is an interval. Queries
+    return the entries whose interval overlaps the queried range.
+    """
+
+    def __init__(self):
+        """Initializes an empty RangeIndex instance."""
+        self._intervals = dict()  # section -> list of (low, high, RangeHit)
+        self._sorted = dict()  # section -> _SectionIntervals, built on demand
+
+    def add(self, section, low, high, hit):
+        """Indexes an interval.
+
+        :param section: section name
+        :param low: low endpoint
+        :param high: high endpoint
+        :param hit: RangeHit designating the entry
+        """
+        self._intervals.setdefault(section, list()).append((low, high, hit))
+        self._sorted.pop(section, None)
+
+    def add_enzyme(self, enzyme):
+        """Indexes the numerical entries of an enzyme.
+
+        :param enzyme: an Enzyme instance
+        """
+        for section in RANGE_SECTIONS:
+            for index, entry in enumerate(enzyme.entries.get(section, ())):
+                interval = parse_range(entry.msg)
+                if interval is None:
+                    continue
+                for protein in entry.proteins or (None,):
+                    self.add(section, interval[0], interval[1],
+                             RangeHit(enzyme.ec_number, protein, section, index))
+
+    @classmethod
+    def from_enzymes(cls, enzymes):
+        """Builds a RangeIndex from parsed enzymes.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an iterable
+            of Enzyme instances
+        :return: a RangeIndex instance
+        """
+        index = cls()
+        for enzyme in unique_enzymes(enzymes):
+            index.add_enzyme(enzyme)
+        return index
+
+    def query(self, section, low, high=None):
+        """Returns the entries of a section whose value or range overlaps the
+        range [low, high].
+
+        :param section: section name, e.g. 'PH_OPTIMUM'
+        :param low: low endpoint of the queried range
+        :param high: high endpoint of the queried range, or None to query the
+            single value low
+        :return: list of RangeHit tuples
+        :raise ArgumentError: if the section is not indexed
+        """
+        high = low if high is None else high
+        if low > high:
+            raise ArgumentError('Invalid range: {}-{}'.format(low, high))
+        if section not in RANGE_SECTIONS and section not in self._intervals:
+            raise ArgumentError('Section is not indexed: {}'.format(section))
+        intervals = self._intervals.get(section)
+        if not intervals:
+            return list()
+        if section not in self._sorted:
+            self._sorted[section] = _SectionIntervals(intervals)
+        return [intervals[i][2] for i in sorted(self._sorted[section].overlapping(low, high))]
+
+    def query_all(self, criteria, by='protein'):
+        """Combines range queries over several sections.
+
+        :param criteria: dict of section -> (low, high) ranges, all of which
+            must be matched
+        :param by: 'protein' to match (EC number, protein) pairs, for which
+            entries without protein references never match, or 'ec_number' to
+            match EC numbers
+        :return: sorted list of (EC number, protein) pairs or EC numbers
+        """
+        if by not in ('protein', 'ec_number'):
+            raise ArgumentError('Unknown key: {}'.format(by))
+        result = None
+        for section, (low, high) in criteria.items():
+            hits = self.query(section, low, high)
+            if by == 'protein':
+                keys = {(hit.ec_number, hit.protein) for hit in hits if hit.protein is not None}
+            else:
+                keys = {hit.ec_number for hit in hits}
+            result = keys if result is None else result & keys
+            if not result:
+                break
+        return sorted(result or ())
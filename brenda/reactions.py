@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+================================
+BRENDA Enzyme Database Reactions
+================================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    reactions.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["EQUATION_SECTIONS", "PLACEHOLDER_COMPOUNDS", "Equation", "parse_equation",
+           "ReactionNetwork"]
+
+import re
+import sys
+
+from array import array
+from collections import namedtuple
+
+from brenda.utils import unique_enzymes
+
+
+# Sections whose entries are reaction equations such as 'A + B = C + D'
+EQUATION_SECTIONS = ('REACTION', 'SUBSTRATE_PRODUCT', 'NATURAL_SUBSTRATE_PRODUCT')
+
+# Compound names standing for unknown or unspecified compounds, e.g. 'more = ?'
+PLACEHOLDER_COMPOUNDS = frozenset(('?', 'more'))
+
+# substrates and products are lists of (stoichiometric coefficient, compound)
+Equation = namedtuple('Equation', ['substrates', 'products'])
+
+_sides = re.compile(r'\s+=\s+|\s+=$')
+_compounds = re.compile(r'\s+\+\s+')
+_coefficient = re.compile(r'(\d+)\s+(\S.*)$')
+
+
+def _parse_side(text):
+    """Splits one side of an equation into (coefficient, compound) pairs."""
+    side = list()
+    for compound in _compounds.split(text.strip()):
+        if not compound:
+            continue
+        mobj = _coefficient.match(compound)
+        if mobj:
+            side.append((int(mobj.group(1)), sys.intern(mobj.group(2))))
+        else:
+            side.append((1, sys.intern(compound)))
+    return side
+
+
+def parse_equation(text):
+    """Parses a reaction equation into substrates and products.
+
+    Compounds are separated by ' + ' and both sides by ' = '. A leading integer
+    followed by whitespace is taken to be the stoichiometric coefficient of a
+    compound (e.g. '2 H2O'), which otherwise defaults to 1. Compound names are
+    interned, since the same names recur throughout the database. Placeholders
+    for unknown compounds ('?', 'more', see PLACEHOLDER_COMPOUNDS) are kept as
+    they appear in the equation.
+
+    :param text: text of a REACTION, SUBSTRATE_PRODUCT or
+        NATURAL_SUBSTRATE_PRODUCT entry (Entry.msg)
+    :return: an Equation instance, or None if text is not an equation
+    """
+    if text is None:
+        return None
+    sides = _sides.split(text, 1)
+    if len(sides) != 2:
+        return None
+    return Equation(_parse_side(sides[0]), _parse_side(sides[1]))
+
+
+class ReactionNetwork:
+    """Encapsulates reaction equations as a compound x reaction incidence
+    matrix.
+
+    Compounds are interned to consecutive integer identifiers (rows), and every
+    equation added to the network is a reaction (column). Substrates have
+    negative and products positive stoichiometric coefficients.
+
+    Placeholders for unknown compounds (see PLACEHOLDER_COMPOUNDS) are left
+    out of the network, so that reactions with unknown products are not
+    connected through them.
+    """
+
+    def __init__(self):
+        """Initializes an empty ReactionNetwork instance."""
+        self.compounds = list()  # compound identifier -> compound name
+        self.compound_ids = dict()  # compound name -> compound identifier
+        self.reactions = list()  # reaction identifier -> (EC number, section, entry index)
+        self._columns = list()  # reaction identifier -> dict of compound id -> coefficient
+
+    def compound_id(self, name):
+        """Returns the identifier of a compound, interning it if needed.
+
+        :param name: compound name
+        :return: integer compound identifier
+        """
+        compound_id = self.compound_ids.get(name)
+        if compound_id is None:
+            compound_id = len(self.compounds)
+            self.compound_ids[name] = compound_id
+            self.compounds.append(name)
+        return compound_id
+
+    def add(self, equation, label=None):
+        """Adds a reaction equation to the network.
+
+        :param equation: an Equation instance
+        :param label: reaction label, by convention an (EC number, section,
+            entry index) tuple
+        :return: integer reaction identifier
+        """
+        column = dict()
+        for sign, side in ((-1, equation.substrates), (1, equation.products)):
+            for coefficient, compound in side:
+                if compound in PLACEHOLDER_COMPOUNDS:
+                    continue
+                compound_id = self.compound_id(compound)
+                column[compound_id] = column.get(compound_id, 0) + sign * coefficient
+        self._columns.append(column)
+        self.reactions.append(label)
+        return len(self.reactions) - 1
+
+    def add_enzyme(self, enzyme):
+        """Adds all equations of an enzyme to the network.
+
+        Entries having an equation attribute (see the equations option of
+        BRENDAParser) are not parsed again.
+
+        :param enzyme: an Enzyme instance
+        """
+        for section, entries in enzyme.entries.items():
+            if section not in EQUATION_SECTIONS:
+                continue
+            for index, entry in enumerate(entries):
+                equation = getattr(entry, 'equation', None) or parse_equation(entry.msg)
+                if equation is not None:
+                    self.add(equation, (enzyme.ec_number, section, index))
+
+    @classmethod
+    def from_enzymes(cls, enzymes):
+        """Builds a ReactionNetwork from parsed enzymes.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an iterable
+            of Enzyme instances
+        :return: a ReactionNetwork instance
+        """
+        network = cls()
+        for enzyme in unique_enzymes(enzymes):
+            network.add_enzyme(enzyme)
+        return network
+
+    @property
+    def shape(self):
+        return len(self.compounds), len(self.reactions)
+
+    def incidence(self):
+        """Returns the compound x reaction incidence matrix in compressed sparse
+        row (CSR) format.
+
+        The arrays can be passed as is to e.g. scipy.sparse.csr_matrix((data,
+        indices, indptr), shape=network.shape). Compounds whose coefficients
+        cancel out in a reaction (e.g. 'A + B = A + C') are omitted for that
+        reaction.
+
+        :return: indptr, indices (reaction identifiers) and data
+            (stoichiometric coefficients) arrays
+        """
+        counts = [0] * (len(self.compounds) + 1)
+        for column in self._columns:
+            for compound_id, coefficient in column.items():
+                if coefficient:
+                    counts[compound_id + 1] += 1
+
+        indptr = array('l', counts)
+        for i in range(1, len(indptr)):
+            indptr[i] += indptr[i - 1]
+
+        nnz = indptr[-1]
+        indices = array('l', [0]) * nnz
+        data = array('l', [0]) * nnz
+        position = array('l', indptr[:-1])
+        for reaction_id, column in enumerate(self._columns):
+            for compound_id, coefficient in column.items():
+                if coefficient:
+                    k = position[compound_id]
+                    indices[k] = reaction_id
+                    data[k] = coefficient
+                    position[compound_id] = k + 1
+
+        return indptr, indices, data
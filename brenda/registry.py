@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+===============================
+BRENDA Enzyme Database Registry
+===============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    registry.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["ProteinRecord", "ProteinRegistry"]
+
+import sys
+
+from collections import namedtuple
+
+from brenda.utils import unique_enzymes
+
+
+# Protein shared across EC numbers, identified by organism and UniProt accessions
+ProteinRecord = namedtuple('ProteinRecord', ['organism', 'identifiers'])
+
+
+class ProteinRegistry:
+    """Assigns global identifiers to proteins across EC numbers.
+
+    Proteins are identified by their organism and their (sorted) UniProt
+    accessions. Proteins without accessions cannot be told apart, hence each
+    of them gets its own global identifier (only its organism string is
+    interned and shared). Registered Protein instances get a global_id
+    attribute, and their organism and identifiers attributes are replaced by
+    the ones of the shared ProteinRecord, so that they are stored once. Since
+    identifiers lists are shared, they must not be modified.
+
+    Global identifiers are assigned in first-registration order: a protein
+    gets the next free identifier the first time it is registered, and keeps
+    it when it is registered again under other EC numbers. Identifiers are
+    therefore not stable across parses of different files or subsets of
+    records, and should not be stored.
+    """
+
+    def __init__(self):
+        """Initializes an empty ProteinRegistry instance."""
+        self.records = list()  # global identifier -> ProteinRecord
+        self._ids = dict()  # (organism, accessions or local protein) -> global identifier
+        self._occurrences = list()  # global identifier -> list of (EC number, protein id)
+
+    def __len__(self):
+        return len(self.records)
+
+    def lookup(self, organism, identifiers=()):
+        """Returns the global identifier of a protein.
+
+        :param organism: organism of the protein
+        :param identifiers: UniProt accessions of the protein
+        :return: global identifier, or None if the protein is not registered
+            or has no accessions
+        """
+        if not identifiers:
+            return None
+        return self._ids.get((organism, tuple(sorted(identifiers))))
+
+    def register(self, ec_number, protein_id, protein):
+        """Registers a protein of an EC number.
+
+        :param ec_number: EC number the protein is listed under
+        :param protein_id: local protein identifier (#...# tags)
+        :param protein: a Protein instance
+        :return: global identifier of the protein
+        """
+        if protein.identifiers:
+            key = (protein.organism, tuple(sorted(protein.identifiers)))
+        else:  # only the same local protein (listed twice) is the same protein
+            key = (protein.organism, ec_number, protein_id)
+        global_id = self._ids.get(key)
+        if global_id is None:
+            global_id = len(self.records)
+            self._ids[key] = global_id
+            self.records.append(ProteinRecord(sys.intern(protein.organism),
+                                              sorted(protein.identifiers)))
+            self._occurrences.append(list())
+        record = self.records[global_id]
+        protein.global_id = global_id
+        protein.organism = record.organism
+        protein.identifiers = record.identifiers
+        self._occurrences[global_id].append((ec_number, protein_id))
+        return global_id
+
+    def register_enzymes(self, enzymes):
+        """Registers all proteins of parsed enzymes.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an iterable
+            of Enzyme instances
+        """
+        for enzyme in unique_enzymes(enzymes):
+            for protein_id, protein in enzyme.proteins.items():
+                self.register(enzyme.ec_number, protein_id, protein)
+
+    def occurrences(self, global_id):
+        """Returns where a protein is listed.
+
+        :param global_id: global identifier of the protein
+        :return: list of (EC number, local protein identifier) pairs
+        """
+        return list(self._occurrences[global_id])
+
+    def ec_numbers(self, global_id):
+        """Returns the EC numbers a protein is listed under.
+
+        :param global_id: global identifier of the protein
+        :return: sorted list of EC numbers
+        """
+        return sorted({ec_number for ec_number, _ in self._occurrences[global_id]})
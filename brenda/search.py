@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Search
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    search.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["Hit", "TextIndex", "tokenize"]
+
+import pickle
+import re
+import sys
+
+from bisect import bisect_left
+from collections import namedtuple
+
+from brenda.utils import ArgumentError, unique_enzymes, in_ec_class
+
+
+# Location of an indexed text: the field ('msg', 'information' or 'comment')
+# of the index-th entry of a section of an EC number. For PROTEIN, index is the
+# protein identifier and 'msg' is the organism.
+Hit = namedtuple('Hit', ['ec_number', 'section', 'index', 'field'])
+
+FIELDS = ('msg', 'information', 'comment')
+
+_token = re.compile(r'\w+', re.UNICODE)
+_query_term = re.compile(r'"([^"]*)"|(\S+)', re.UNICODE)
+
+
+def tokenize(text):
+    """Returns the lowercase word tokens of a text.
+
+    :param text: text to tokenize
+    :return: list of tokens
+    """
+    return _token.findall(text.lower())
+
+
+class TextIndex:
+    """Inverted index with positional postings over the texts of parsed
+    enzymes: entry messages, information and comments, and protein organisms,
+    information and comments.
+
+    Queries consist of whitespace-separated terms that must all match: plain
+    keywords, prefixes ('dehydrogen*') and phrases ('"zinc ion"').
+    """
+
+    def __init__(self):
+        """Initializes an empty TextIndex instance."""
+        self.documents = list()  # document identifier -> Hit
+        self._postings = dict()  # token -> dict of document identifier -> positions
+        self._tokens = None  # sorted tokens, for prefix queries
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, text, hit):
+        """Indexes a text.
+
+        :param text: text to index
+        :param hit: Hit designating the location of the text
+        """
+        doc_id = len(self.documents)
+        self.documents.append(hit)
+        postings = self._postings
+        for position, token in enumerate(tokenize(text)):
+            doc_positions = postings.get(token)
+            if doc_positions is None:
+                postings[sys.intern(token)] = {doc_id: [position]}
+            elif doc_id in doc_positions:
+                doc_positions[doc_id].append(position)
+            else:
+                doc_positions[doc_id] = [position]
+        self._tokens = None
+
+    def add_enzyme(self, enzyme):
+        """Indexes the texts of an enzyme.
+
+        :param enzyme: an Enzyme instance
+        """
+        ec_number = enzyme.ec_number
+        for section, entries in enzyme.entries.items():
+            for index, entry in enumerate(entries):
+                self._add_fields(ec_number, section, index, entry.msg, entry.information,
+                                 entry.comment)
+        for protein_id, protein in enzyme.proteins.items():
+            self._add_fields(ec_number, 'PROTEIN', protein_id, protein.organism,
+                             protein.information, protein.comment)
+
+    def _add_fields(self, ec_number, section, index, msg, information, comment):
+        for field, text in zip(FIELDS, (msg, information, comment.msg if comment else None)):
+            if text:
+                self.add(text, Hit(ec_number, section, index, field))
+
+    @classmethod
+    def from_enzymes(cls, enzymes):
+        """Builds a TextIndex over parsed enzymes.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an iterable
+            of Enzyme instances
+        :return: a TextIndex instance
+        """
+        index = cls()
+        for enzyme in unique_enzymes(enzymes):
+            index.add_enzyme(enzyme)
+        return index
+
+    def _prefix_documents(self, prefix):
+        """Returns the set of documents containing a token starting with prefix."""
+        if self._tokens is None:
+            self._tokens = sorted(self._postings)
+        documents = set()
+        i = bisect_left(self._tokens, prefix)
+        while i < len(self._tokens) and self._tokens[i].startswith(prefix):
+            documents.update(self._postings[self._tokens[i]])
+            i += 1
+        return documents
+
+    def _phrase_documents(self, tokens):
+        """Returns the set of documents containing the tokens consecutively."""
+        postings = [self._postings.get(token) for token in tokens]
+        if not all(postings):
+            return set()
+        if len(tokens) == 1:
+            return set(postings[0])
+
+        candidates = set(postings[0]).intersection(*postings[1:])
+        documents = set()
+        for doc_id in candidates:
+            following = [set(p[doc_id]) for p in postings[1:]]
+            for start in postings[0][doc_id]:
+                if all(start + offset in positions
+                       for offset, positions in enumerate(following, 1)):
+                    documents.add(doc_id)
+                    break
+        return documents
+
+    def search(self, query, ec_prefix=None, section=None, field=None):
+        """Returns the locations of the texts matching a query.
+
+        :param query: whitespace-separated keywords, prefixes (ending with '*')
+            and double-quoted phrases, which must all match (case-insensitive)
+        :param ec_prefix: EC number or EC class (e.g. '3.4') the results are
+            restricted to, or None
+        :param section: section name (e.g. 'COFACTOR') the results are
+            restricted to, or None
+        :param field: field ('msg', 'information' or 'comment') the results
+            are restricted to, or None
+        :return: list of Hit tuples, in indexing order
+        """
+        if field is not None and field not in FIELDS:
+            raise ArgumentError('Unknown field: {}'.format(field))
+
+        documents = None
+        for mobj in _query_term.finditer(query):
+            phrase, term = mobj.groups()
+            if term is not None and term.endswith('*') and len(tokenize(term)) == 1:
+                matches = self._prefix_documents(tokenize(term)[0])
+            else:
+                tokens = tokenize(phrase if phrase is not None else term)
+                if not tokens:
+                    continue
+                matches = self._phrase_documents(tokens)
+            documents = matches if documents is None else documents & matches
+            if not documents:
+                return list()
+
+        if documents is None:
+            return list()
+
+        hits = list()
+        for doc_id in sorted(documents):
+            hit = self.documents[doc_id]
+            if ec_prefix is not None and not in_ec_class(hit.ec_number, ec_prefix):
+                continue
+            if section is not None and hit.section != section:
+                continue
+            if field is not None and hit.field != field:
+                continue
+            hits.append(hit)
+        return hits
+
+    def save(self, filename):
+        """Saves the index to a file.
+
+        :param filename: path of the output file
+        """
+        with open(filename, 'wb') as handle:
+            pickle.dump((self.documents, self._postings), handle, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filename):
+        """Loads an index saved with TextIndex.save.
+
+        :param filename: path of the input file
+        :return: a TextIndex instance
+        """
+        index = cls()
+        with open(filename, 'rb') as handle:
+            index.documents, index._postings = pickle.load(handle)
+        return index
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Server
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    server.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["DEFAULT_PORT", "QueryEngine", "BRENDAServer", "BRENDAClient"]
+
+import argparse
+import json
+
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.error import HTTPError
+from urllib.parse import quote, unquote, urlsplit
+from urllib.request import urlopen
+
+from brenda.export import enzyme_to_dict, enzyme_from_dict, entry_to_dict, entry_from_dict
+from brenda.tables import accession_table
+from brenda.utils import ArgumentError, LRUCache, unique_enzymes
+
+
+DEFAULT_PORT = 8765
+
+
+def _dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+
+
+class QueryEngine:
+    """Answers queries over parsed enzymes, keeping the encoded results of the
+    most recent queries in an LRU cache.
+
+    Queries are paths:
+
+      * /enzymes/<EC number or EC class> -- enzymes, as dicts (see
+        enzyme_to_dict)
+      * /entries/<EC number or EC class>/<section> -- (EC number, entry dict)
+        pairs of a section (see entry_to_dict)
+      * /organism/<organism> -- (EC number, protein identifier) pairs of the
+        proteins of an organism (case-insensitive)
+      * /accession/<UniProt accession> -- (EC number, protein identifier)
+        pairs of the proteins identified by an accession
+      * /stats -- number of queries and cache statistics
+
+    Results larger than max_result_size bytes (e.g. the enzymes of a whole EC
+    class) are not cached, so that a few of them do not fill the memory.
+    """
+
+    def __init__(self, enzymes, cache_size=1024, max_result_size=1 << 20):
+        """Initializes a QueryEngine instance.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an
+            EnzymeStore
+        :param cache_size: maximum number of cached query results
+        :param max_result_size: maximum size of a cached query result, in bytes
+        """
+        self.enzymes = enzymes
+        self.queries = 0
+        self._cache = LRUCache(cache_size)
+        self._max_result_size = max_result_size
+        self._accessions = accession_table(enzymes)
+        self._organisms = dict()  # casefolded organism -> list of (EC number, protein id)
+        for enzyme in unique_enzymes(enzymes):
+            for protein_id, protein in enzyme.proteins.items():
+                self._organisms.setdefault(protein.organism.casefold(), list()).append(
+                    (enzyme.ec_number, protein_id))
+        self._routes = {  # query -> (function, names of its path segments)
+            'enzymes': (self._enzymes, ('EC number',)),
+            'entries': (self._entries, ('EC number', 'section')),
+            'organism': (self._organism, ('organism',)),
+            'accession': (self._accession, ('accession',))}
+
+    def stats(self):
+        """Returns the number of queries and the cache statistics.
+
+        :return: dict of statistics, including the cache hit rate
+        """
+        info = self._cache.info()
+        lookups = info.hits + info.misses
+        return {
+            'queries': self.queries,
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+            'maxsize': info.maxsize,
+            'currsize': info.currsize}
+
+    def query(self, path):
+        """Answers a query.
+
+        :param path: query path, e.g. '/enzymes/1.1.1'
+        :return: JSON-encoded result
+        :raise KeyError: if the EC number or EC class is unknown
+        :raise ArgumentError: if the query is invalid
+        """
+        self.queries += 1
+        # Empty segments are ignored, so that '/enzymes//1.1.1/' is '/enzymes/1.1.1'
+        parts = tuple(unquote(part) for part in path.split('/') if part)
+        if parts == ('stats',):
+            return _dumps(self.stats())
+        result = self._cache.get(parts)
+        if result is None:
+            if not parts or parts[0] not in self._routes:
+                raise ArgumentError('Unknown query: %s', path)
+            route, names = self._routes[parts[0]]
+            if len(parts) - 1 != len(names):
+                raise ArgumentError('Expected /%s/%s: %s', parts[0],
+                                    '/'.join('<{}>'.format(name) for name in names), path)
+            result = _dumps(route(*parts[1:]))
+            if len(result) <= self._max_result_size:
+                self._cache.put(parts, result)
+        return result
+
+    def _enzymes(self, ec_number):
+        return [enzyme_to_dict(enzyme) for enzyme in self.enzymes[ec_number]]
+
+    def _entries(self, ec_number, section):
+        return [(enzyme.ec_number, entry_to_dict(entry)) for enzyme in self.enzymes[ec_number]
+                for entry in enzyme.entries.get(section, ())]
+
+    def _organism(self, organism):
+        return self._organisms.get(organism.casefold(), list())
+
+    def _accession(self, accession):
+        return self._accessions.get(accession, list())
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Answers GET requests with the QueryEngine of the server."""
+
+    def do_GET(self):
+        try:
+            status, body = 200, self.server.engine.query(urlsplit(self.path).path)
+        except KeyError as err:
+            status, body = 404, _dumps({'error': 'Not found: {}'.format(err.args[0])})
+        except ArgumentError as err:
+            status, body = 400, _dumps({'error': str(err)})
+        except Exception as err:  # e.g. an unreadable EnzymeStore
+            status, body = 500, _dumps({'error': 'Internal error: {}'.format(err)})
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BRENDAServer(HTTPServer):
+    """Local HTTP server answering queries over parsed enzymes (see
+    QueryEngine), so that they are parsed or loaded only once.
+
+    Requests are handled one at a time, hence enzymes may be read from an
+    EnzymeStore.
+    """
+
+    def __init__(self, enzymes, host='127.0.0.1', port=DEFAULT_PORT, cache_size=1024,
+                 max_result_size=1 << 20):
+        """Initializes a BRENDAServer instance.
+
+        :param enzymes: dict as returned by BRENDAParser.parse, or an
+            EnzymeStore
+        :param host: address the server listens on
+        :param port: port the server listens on, or 0 for any free port
+        :param cache_size: maximum number of cached query results
+        :param max_result_size: maximum size of a cached query result, in bytes
+        """
+        self.engine = QueryEngine(enzymes, cache_size, max_result_size)
+        super().__init__((host, port), _RequestHandler)
+
+
+class BRENDAClient:
+    """Queries a BRENDAServer. Results are Enzyme and Entry instances, as
+    returned by BRENDAParser.parse.
+    """
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, timeout=10):
+        """Initializes a BRENDAClient instance.
+
+        :param host: address of the server
+        :param port: port of the server
+        :param timeout: timeout of every query, in seconds
+        """
+        self._url = 'http://{}:{}'.format(host, port)
+        self._timeout = timeout
+
+    def _get(self, *parts):
+        path = '/' + '/'.join(quote(part, safe='') for part in parts)
+        try:
+            with urlopen(self._url + path, timeout=self._timeout) as response:
+                return json.loads(response.read())
+        except HTTPError as err:
+            message = json.loads(err.read())['error']
+            if err.code == 404:
+                raise KeyError(parts[1]) from None
+            raise ArgumentError('%s', message) from None
+
+    def enzymes(self, ec_number):
+        """Returns the enzymes of an EC number or EC class.
+
+        :param ec_number: EC number or EC class, e.g. '1.1.1'
+        :return: list of Enzyme instances
+        :raise KeyError: if the EC number or EC class is unknown
+        """
+        return [enzyme_from_dict(data) for data in self._get('enzymes', ec_number)]
+
+    def entries(self, ec_number, section):
+        """Returns the entries of a section for an EC number or EC class.
+
+        :param ec_number: EC number or EC class
+        :param section: section name, e.g. 'KM_VALUE'
+        :return: list of (EC number, Entry instance) pairs
+        :raise KeyError: if the EC number or EC class is unknown
+        """
+        return [(ec, entry_from_dict(data)) for ec, data in self._get('entries', ec_number,
+                                                                      section)]
+
+    def organism(self, organism):
+        """Returns the proteins of an organism.
+
+        :param organism: organism name (case-insensitive), e.g. 'Homo sapiens'
+        :return: list of (EC number, protein identifier) pairs
+        """
+        return [tuple(hit) for hit in self._get('organism', organism)]
+
+    def accession(self, accession):
+        """Returns the proteins identified by a UniProt accession.
+
+        :param accession: UniProt accession
+        :return: list of (EC number, protein identifier) pairs
+        """
+        return [tuple(hit) for hit in self._get('accession', accession)]
+
+    def stats(self):
+        """Returns the query and cache statistics of the server (see
+        QueryEngine.stats).
+        """
+        return self._get('stats')
+
+
+def main(args=None):
+    """Command line interface, see python -m brenda.server --help."""
+    parser = argparse.ArgumentParser(description='Serves queries over a BRENDA flat file.')
+    parser.add_argument('input', help='BRENDA flat file, or EnzymeStore database with --store')
+    parser.add_argument('--store', action='store_true',
+                        help='input is an EnzymeStore database')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+    parser.add_argument('--cache-size', type=int, default=1024,
+                        help='number of cached query results')
+    parser.add_argument('--max-result-size', type=int, default=1 << 20,
+                        help='size in bytes of the largest cached query result')
+    options = parser.parse_args(args)
+
+    if options.store:
+        from brenda.store import EnzymeStore
+        enzymes = EnzymeStore(options.input)
+    else:
+        from brenda.parser import BRENDAParser
+        with BRENDAParser(options.input) as brenda_parser:
+            enzymes = brenda_parser.parse()
+
+    with BRENDAServer(enzymes, options.host, options.port, options.cache_size,
+                      options.max_result_size) as server:
+        print('Serving on http://{}:{}'.format(*server.server_address))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+============================
+BRENDA Enzyme Database Store
+============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    store.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["EnzymeStore"]
+
+import os
+import pickle
+import sqlite3
+import tempfile
+
+from collections.abc import Mapping, Sequence
+
+from brenda.utils import ArgumentError, LRUCache, ec_prefixes
+
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS enzymes '
+    '(id INTEGER PRIMARY KEY, ec_number TEXT NOT NULL, data BLOB NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS prefixes (prefix TEXT NOT NULL, enzyme_id INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS prefixes_prefix ON prefixes (prefix, enzyme_id)')
+
+
+class _StoredEnzymes(Sequence):
+    """Enzymes listed under an EC number or EC class of an EnzymeStore, loaded
+    on access.
+    """
+
+    def __init__(self, store, enzyme_ids):
+        self._store = store
+        self._enzyme_ids = enzyme_ids
+
+    def __len__(self):
+        return len(self._enzyme_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.get_enzyme(i) for i in self._enzyme_ids[index]]
+        return self._store.get_enzyme(self._enzyme_ids[index])
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class EnzymeStore(Mapping):
+    """On-disk (SQLite) store of parsed enzymes, see the store option of
+    BRENDAParser.
+
+    The store is a read-only mapping with the same keys as the dict returned
+    by BRENDAParser.parse: full and partial EC numbers, in order of appearance.
+    Its values are sequences whose Enzyme instances are unpickled on access,
+    and at most cache_size of them are kept in memory. Enzymes are copies:
+    modifying them does not modify the store, and objects shared between
+    enzymes (e.g. through a ProteinRegistry) are no longer shared.
+    """
+
+    def __init__(self, filename=None, cache_size=128):
+        """Initializes an EnzymeStore instance.
+
+        :param filename: path of the SQLite database, created if needed, or
+            None for a temporary database that is deleted when the store is
+            closed
+        :param cache_size: maximum number of unpickled enzymes kept in memory
+        """
+        if cache_size <= 0:
+            raise ArgumentError('Expected positive cache size: {}'.format(cache_size))
+        self._temporary = filename is None
+        if self._temporary:
+            handle, filename = tempfile.mkstemp(prefix='brenda-', suffix='.sqlite')
+            os.close(handle)
+        self.filename = filename
+        self._connection = sqlite3.connect(filename)
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+        self._cache = LRUCache(cache_size)  # enzyme identifier -> Enzyme
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Closes the database, deleting it if it is temporary."""
+        if self._connection is None:
+            return
+        self._connection.close()
+        self._connection = None
+        self._cache.clear()
+        if self._temporary:
+            os.remove(self.filename)
+
+    def add(self, enzyme):
+        """Writes an enzyme to the store.
+
+        :param enzyme: an Enzyme instance
+        """
+        cursor = self._connection.execute(
+            'INSERT INTO enzymes (ec_number, data) VALUES (?, ?)',
+            (enzyme.ec_number, pickle.dumps(enzyme, pickle.HIGHEST_PROTOCOL)))
+        self._connection.executemany(
+            'INSERT INTO prefixes (prefix, enzyme_id) VALUES (?, ?)',
+            ((prefix, cursor.lastrowid) for prefix in ec_prefixes(enzyme.ec_number)))
+
+    def commit(self):
+        """Commits the enzymes written to the store."""
+        self._connection.commit()
+
+    def get_enzyme(self, enzyme_id):
+        """Returns a stored enzyme from its identifier in the store.
+
+        :param enzyme_id: integer identifier of the enzyme in the store
+        :return: an Enzyme instance
+        """
+        enzyme = self._cache.get(enzyme_id)
+        if enzyme is None:
+            row = self._connection.execute(
+                'SELECT data FROM enzymes WHERE id = ?', (enzyme_id,)).fetchone()
+            if row is None:
+                raise KeyError(enzyme_id)
+            enzyme = pickle.loads(row[0])
+            self._cache.put(enzyme_id, enzyme)
+        return enzyme
+
+    def enzymes(self):
+        """Yields every stored enzyme once, in order of appearance.
+
+        :return: generator of Enzyme instances
+        """
+        rows = self._connection.execute('SELECT id FROM enzymes ORDER BY id').fetchall()
+        for (enzyme_id,) in rows:
+            yield self.get_enzyme(enzyme_id)
+
+    def cache_info(self):
+        """Returns hit and miss statistics of the enzyme cache as a CacheInfo
+        tuple.
+        """
+        return self._cache.info()
+
+    def __getitem__(self, key):
+        rows = self._connection.execute(
+            'SELECT enzyme_id FROM prefixes WHERE prefix = ? ORDER BY enzyme_id', (key,))
+        enzyme_ids = [enzyme_id for (enzyme_id,) in rows]
+        if not enzyme_ids:
+            raise KeyError(key)
+        return _StoredEnzymes(self, enzyme_ids)
+
+    def __contains__(self, key):
+        return self._connection.execute(
+            'SELECT 1 FROM prefixes WHERE prefix = ? LIMIT 1', (key,)).fetchone() is not None
+
+    def __iter__(self):
+        rows = self._connection.execute(
+            'SELECT prefix FROM prefixes GROUP BY prefix ORDER BY MIN(rowid)').fetchall()
+        return (prefix for (prefix,) in rows)
+
+    def __len__(self):
+        row = self._connection.execute('SELECT COUNT(DISTINCT prefix) FROM prefixes').fetchone()
+        return row[0]
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Subset
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    subset.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["Record", "iter_records", "sample_records", "extract_records", "parse_sample"]
+
+import argparse
+import mmap
+import os
+import random
+import re
+import tempfile
+
+from collections import namedtuple
+from operator import attrgetter
+
+from brenda.utils import ArgumentError, in_ec_class
+
+
+# Record of the flat file: EC number of its ID line, and byte range [start,
+# end) from the ID line to the end of the '///' line and following blank lines
+Record = namedtuple('Record', ['ec_number', 'start', 'end'])
+
+_record_id = re.compile(rb'ID[ \t]+([^\s(]*)')
+_record_end = b'\n///'
+_protein_section = b'\nPROTEIN'
+
+
+def _id_line_at(data, position):
+    """Returns the match of an ID line starting at position, or None."""
+    return _record_id.match(data, position)
+
+
+def _next_id_line(data, start, end):
+    """Returns the match of the first ID line in data[start:end], or None."""
+    if start == 0 or data[start - 1:start] == b'\n':
+        mobj = _id_line_at(data, start)
+        if mobj:
+            return mobj
+    position = data.find(b'\nID', start, end)
+    while position != -1:
+        mobj = _id_line_at(data, position + 1)
+        if mobj:
+            return mobj
+        position = data.find(b'\nID', position + 1, end)
+    return None
+
+
+def iter_records(data):
+    """Yields the records of a BRENDA flat file without parsing them.
+
+    Records start at an ID line and end at the following '///' line, or at
+    the next ID line if the '///' line is missing.
+
+    :param data: contents of the flat file, as bytes or a memory map
+    :return: generator of Record tuples
+    """
+    position = 0
+    size = len(data)
+    mobj = _next_id_line(data, 0, size)
+    while mobj is not None:
+        start = mobj.start()
+        end = data.find(_record_end, mobj.end())
+        end = size if end == -1 else end + len(_record_end)
+        next_id = _next_id_line(data, mobj.end(), end)
+        if next_id is not None:
+            end = next_id.start()
+        else:
+            line_end = data.find(b'\n', end)
+            end = size if line_end == -1 else line_end + 1
+            while data[end:end + 1] == b'\n':  # blank lines separating records
+                end += 1
+        yield Record(mobj.group(1).decode('ascii', 'replace'), start, end)
+        position = end
+        mobj = next_id if next_id is not None else _next_id_line(data, position, size)
+
+
+def _has_organism(data, record, organism):
+    """Returns whether organism occurs in the PROTEIN section of a record."""
+    start = data.find(_protein_section, record.start, record.end)
+    if start == -1:
+        return False
+    end = data.find(b'\n\n', start + 1, record.end)
+    return data.find(organism, start, record.end if end == -1 else end) != -1
+
+
+def _reservoir(records, size, rng):
+    """Chooses size records uniformly at random, in a single pass (reservoir
+    sampling).
+    """
+    reservoir = list()
+    for index, record in enumerate(records):
+        if index < size:
+            reservoir.append(record)
+        else:
+            position = rng.randrange(index + 1)
+            if position < size:
+                reservoir[position] = record
+    return reservoir
+
+
+def _allocate(size, counts):
+    """Splits a sample size between strata proportionally to their sizes
+    (largest remainder method), giving at least one record to every stratum
+    when the sample is large enough.
+    """
+    size = min(size, sum(counts))
+    if size >= len(counts):
+        shares = [1] * len(counts)
+        weights = [count - 1 for count in counts]
+        remaining = size - len(counts)
+    else:
+        shares = [0] * len(counts)
+        weights = counts
+        remaining = size
+    total = sum(weights)
+    quotas = [remaining * weight / total if total else 0 for weight in weights]
+    floors = [int(quota) for quota in quotas]
+    order = sorted(range(len(counts)), key=lambda i: quotas[i] - floors[i], reverse=True)
+    for i in order[:remaining - sum(floors)]:
+        floors[i] += 1
+    return [share + floor for share, floor in zip(shares, floors)]
+
+
+def sample_records(records, size, seed=None, stratify=False):
+    """Chooses records at random, e.g. among those yielded by iter_records.
+
+    Records are chosen uniformly (reservoir sampling), or, if stratify is
+    True, separately within every EC class (first number of the EC number), in
+    proportion to the number of records of the class.
+
+    :param records: iterable of Record tuples
+    :param size: number of records (int), or fraction of the records (float
+        between 0 and 1)
+    :param seed: seed of the random number generator; the same seed chooses
+        the same records
+    :param stratify: whether records are chosen within every EC class
+    :return: list of the chosen Record tuples, in file order
+    """
+    if isinstance(size, float):
+        if not 0 <= size <= 1:
+            raise ArgumentError('Sample fraction must be between 0 and 1: {}'.format(size))
+        records = list(records)
+        size = round(size * len(records))
+    elif size < 0:
+        raise ArgumentError('Sample size must be positive: {}'.format(size))
+
+    rng = random.Random(seed)
+    if stratify:
+        strata = dict()  # EC class -> records
+        for record in records:
+            strata.setdefault(record.ec_number.split('.')[0], list()).append(record)
+        sample = list()
+        counts = [len(stratum) for stratum in strata.values()]
+        for stratum, count in zip(strata.values(), _allocate(size, counts)):
+            sample.extend(rng.sample(stratum, count))
+    else:
+        sample = _reservoir(records, size, rng)
+    return sorted(sample, key=attrgetter('start'))
+
+
+def extract_records(filename, output, ec_prefixes=None, organism=None, header=True,
+                    encoding='utf8', sample=None, seed=None, stratify=False):
+    """Copies the records of a BRENDA flat file that match the given filters
+    to a new flat file, byte for byte.
+
+    The file is memory-mapped and scanned for record boundaries only; records
+    are never parsed.
+
+    :param filename: path of the BRENDA flat file
+    :param output: path of the output flat file
+    :param ec_prefixes: EC numbers or EC classes (e.g. ['1.1', '3.4.21.4'])
+        whose records are copied, or None to copy all records
+    :param organism: text that must occur (case-sensitive) in the PROTEIN
+        section of a record for it to be copied, e.g. 'Homo sapiens', or None
+    :param header: whether the text preceding the first record (copyright
+        notice) should be copied
+    :param encoding: encoding of the flat file, used to encode organism
+    :param sample: number (int) or fraction (float) of the matching records
+        chosen at random (see sample_records), or None to copy all of them
+    :param seed: seed of the random number generator used for sampling
+    :param stratify: whether records are sampled within every EC class
+    :return: number of records copied
+    """
+    if organism is not None:
+        organism = organism.encode(encoding)
+    count = 0
+    with open(filename, 'rb') as handle, open(output, 'wb') as out:
+        if not handle.seek(0, 2):  # empty file, cannot be memory-mapped
+            return count
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            first = _next_id_line(data, 0, len(data))
+            if first is not None and header:
+                out.write(data[:first.start()])
+            records = iter_records(data)
+            if ec_prefixes is not None:
+                records = (record for record in records
+                           if any(in_ec_class(record.ec_number, prefix)
+                                  for prefix in ec_prefixes))
+            if organism is not None:
+                records = (record for record in records
+                           if _has_organism(data, record, organism))
+            if sample is not None:
+                records = sample_records(records, sample, seed, stratify)
+            for record in records:
+                out.write(data[record.start:record.end])
+                count += 1
+    return count
+
+
+def parse_sample(filename, size, seed=None, stratify=False, **options):
+    """Parses records chosen at random in a BRENDA flat file (see
+    sample_records), e.g. for quick tests on a representative part of the
+    full flat file.
+
+    Only record boundaries are scanned in the full file; the chosen records
+    are copied to a temporary flat file, which is then parsed, hence line
+    numbers (e.g. of MalformedEntry tuples in tolerant mode) refer to the
+    temporary file.
+
+    :param filename: path of the BRENDA flat file
+    :param size: number (int) or fraction (float) of the records to parse
+    :param seed: seed of the random number generator; the same seed parses
+        the same records
+    :param stratify: whether records are chosen within every EC class
+    :param options: keyword arguments of BRENDAParser, e.g. tolerant=True
+    :return: dict of EC numbers and EC classes (see BRENDAParser.parse)
+    """
+    from brenda.parser import BRENDAParser
+
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, 'sample.txt')
+        extract_records(filename, output, sample=size, seed=seed, stratify=stratify)
+        with BRENDAParser(output, **options) as parser:
+            return parser.parse()
+
+
+def _sample_size(text):
+    """Converts a sample size argument: a number of records or a fraction."""
+    return float(text) if '.' in text else int(text)
+
+
+def main(args=None):
+    """Command line interface, see python -m brenda.subset --help."""
+    parser = argparse.ArgumentParser(
+        description='Copies selected records of a BRENDA flat file to a new flat file.')
+    parser.add_argument('input', help='BRENDA flat file')
+    parser.add_argument('output', help='output flat file')
+    parser.add_argument('-e', '--ec', action='append', dest='ec_prefixes', metavar='PREFIX',
+                        help='EC number or EC class to copy (may be repeated)')
+    parser.add_argument('-o', '--organism', help='organism listed in the PROTEIN section')
+    parser.add_argument('--no-header', action='store_false', dest='header',
+                        help='do not copy the text preceding the first record')
+    parser.add_argument('-s', '--sample', type=_sample_size, metavar='SIZE',
+                        help='number (e.g. 500) or fraction (e.g. 0.05) of records chosen at '
+                             'random')
+    parser.add_argument('--seed', type=int, help='seed of the random sample')
+    parser.add_argument('--stratify', action='store_true',
+                        help='sample records within every EC class')
+    options = parser.parse_args(args)
+    count = extract_records(options.input, options.output, options.ec_prefixes,
+                            options.organism, options.header, sample=options.sample,
+                            seed=options.seed, stratify=options.stratify)
+    print('{} records copied to {}'.format(count, options.output))
+
+
+if __name__ == '__main__':
+    main()
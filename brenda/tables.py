@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Tables
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    tables.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["ProteinRow", "FRAME_COLUMNS", "CATEGORICAL_COLUMNS", "protein_table",
+           "accession_table", "tables_from_file", "to_frame"]
+
+from array import array
+from collections import namedtuple
+
+from brenda.parser import BRENDAParser
+from brenda.utils import ArgumentError, unique_enzymes
+
+
+ProteinRow = namedtuple('ProteinRow', ['ec_number', 'protein_id', 'organism', 'accessions'])
+
+# Columns of the DataFrame built by to_frame
+FRAME_COLUMNS = ('ec_number', 'msg', 'information', 'comment', 'proteins', 'references',
+                 'organism')
+
+# Columns of repeated strings, stored as categoricals by default
+CATEGORICAL_COLUMNS = ('ec_number', 'msg', 'information', 'organism')
+
+
+def protein_table(enzymes):
+    """Builds a flat table of all proteins of the given enzymes.
+
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances
+    :return: list of ProteinRow tuples (EC number, protein identifier,
+        organism, UniProt accessions)
+    """
+    return [ProteinRow(enzyme.ec_number, protein_id, protein.organism, protein.identifiers)
+            for enzyme in unique_enzymes(enzymes)
+            for protein_id, protein in enzyme.proteins.items()]
+
+
+def accession_table(enzymes):
+    """Builds a flat table mapping UniProt accessions to the proteins they
+    identify.
+
+    The same accession may identify proteins under several EC numbers (or
+    several proteins of the same EC number), hence every accession is mapped
+    to a list of (EC number, protein identifier) pairs, in parsing order.
+
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances
+    :return: dict of accession -> list of (EC number, protein identifier)
+    """
+    table = dict()
+    for enzyme in unique_enzymes(enzymes):
+        ec_number = enzyme.ec_number
+        for protein_id, protein in enzyme.proteins.items():
+            for accession in protein.identifiers:
+                hits = table.get(accession)
+                if hits is None:
+                    table[accession] = [(ec_number, protein_id)]
+                else:
+                    hits.append((ec_number, protein_id))
+    return table
+
+
+class _ProteinParser(BRENDAParser):
+    """BRENDAParser parsing PROTEIN (PR) entries only. Entries of other
+    sections are collected (so that records are delimited and skipped exactly
+    as by BRENDAParser.parse) but neither parsed nor stored.
+    """
+
+    def _add_entry(self, section_contents, parser, section_name, entry, line_number):
+        if section_name == 'PROTEIN':
+            super(_ProteinParser, self)._add_entry(section_contents, parser, section_name, entry,
+                                                   line_number)
+        else:
+            section_contents.append(None)
+
+    def _store_section(self, section_name, section_contents):
+        pass
+
+
+def tables_from_file(filename, encoding='utf8'):
+    """Builds the protein table and the accession table (see protein_table and
+    accession_table) of a flat file in a single pass over its lines, parsing
+    PROTEIN (PR) entries only.
+
+    The tables are the same as those built from the enzymes parsed by
+    BRENDAParser.parse, which is several times slower since it parses the
+    entries of every section.
+
+    :param filename: path of the BRENDA flat file
+    :param encoding: encoding of the BRENDA flat file
+    :return: list of ProteinRow tuples, and dict of accession -> list of (EC
+        number, protein identifier)
+    """
+    with _ProteinParser(filename, encoding) as parser:
+        enzymes = parser.parse()
+    return protein_table(enzymes), accession_table(enzymes)
+
+
+class _Categories:
+    """Values of a categorical column, encoded as they are appended: codes
+    (-1 for None) and categories in order of first occurrence.
+    """
+
+    __slots__ = ('codes', 'categories', '_codes')
+
+    def __init__(self):
+        self.codes = array('i')
+        self.categories = list()
+        self._codes = dict()  # category -> code
+
+    def code(self, value):
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def append(self, value):
+        self.codes.append(self.code(value))
+
+
+def _entry_organisms(enzyme, protein_ids, cache):
+    """Joins the distinct organisms of the proteins of an entry, e.g.
+    'Homo sapiens; Mus musculus', or returns None if none is known.
+    """
+    key = tuple(protein_ids)
+    organisms = cache.get(key, cache)
+    if organisms is cache:
+        names = list()
+        for protein_id in protein_ids:
+            protein = enzyme.proteins.get(protein_id)
+            if protein is not None and protein.organism not in names:
+                names.append(protein.organism)
+        organisms = cache[key] = '; '.join(names) or None
+    return organisms
+
+
+def _section_columns(enzymes, section, categorical):
+    """Builds the columns of to_frame in a single pass over the entries of a
+    section: lists of values, or _Categories for categorical columns.
+    """
+    columns = {column: _Categories() if column in categorical else list()
+               for column in FRAME_COLUMNS}
+    ec_numbers, messages, information, comments, proteins, references, organisms = \
+        (columns[column] for column in FRAME_COLUMNS)
+    for enzyme in unique_enzymes(enzymes):
+        entries = enzyme.entries.get(section)
+        if not entries:
+            continue
+        if isinstance(ec_numbers, _Categories):
+            ec_numbers.codes.extend([ec_numbers.code(enzyme.ec_number)] * len(entries))
+        else:
+            ec_numbers.extend([enzyme.ec_number] * len(entries))
+        cache = dict()  # protein identifiers -> joined organisms, for this enzyme
+        for entry in entries:
+            messages.append(entry.msg)
+            information.append(entry.information)
+            comments.append(None if entry.comment is None else entry.comment.msg)
+            proteins.append(entry.proteins)
+            references.append(entry.references)
+            organisms.append(_entry_organisms(enzyme, entry.proteins or (), cache))
+    return columns
+
+
+def to_frame(enzymes, section, categorical=CATEGORICAL_COLUMNS):
+    """Builds a pandas DataFrame of the entries of a section, one row per
+    entry, in parsing order.
+
+    Columns (see FRAME_COLUMNS) are the EC number, the message, information
+    and comment (as a string) of the entry, its protein and reference
+    identifiers (lists), and the distinct organisms of its proteins, joined by
+    '; '. Columns are built directly from the entries, without intermediate
+    rows, and repeated strings are stored as categoricals whose codes are
+    assigned while building the columns.
+
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances
+    :param section: section name, e.g. 'SUBSTRATE_PRODUCT'
+    :param categorical: columns stored as categoricals (others have object or
+        string dtypes)
+    :return: a pandas DataFrame
+    :raise ImportError: if pandas is not installed
+    """
+    unknown = set(categorical) - set(FRAME_COLUMNS)
+    if unknown:
+        raise ArgumentError('Unknown columns: {}'.format(', '.join(sorted(unknown))))
+    import pandas
+
+    columns = _section_columns(enzymes, section, categorical)
+    for column, values in columns.items():
+        if isinstance(values, _Categories):
+            columns[column] = pandas.Categorical.from_codes(values.codes, values.categories)
+        elif column in ('proteins', 'references'):
+            columns[column] = pandas.Series(values, dtype=object)
+    return pandas.DataFrame(columns, columns=list(FRAME_COLUMNS))
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+===============================
+BRENDA Enzyme Database Transfer
+===============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    transfer.py
+
+.. |c| unicode:: U+A9
+"""
+
+__all__ = ["FORMAT_VERSION", "encode_enzymes", "decode_enzymes", "send_enzymes", "recv_enzymes"]
+
+import pickle
+import zlib
+
+from brenda.parser import _restore_comment, _restore_entry, _restore_enzyme, _restore_protein
+from brenda.utils import ArgumentError, unique_enzymes
+
+
+# Version of the batched encoding, checked when decoding
+FORMAT_VERSION = 1
+
+
+def _comment_to_tuple(comment):
+    if comment is None:
+        return None
+    return comment.msg, comment.proteins, comment.references
+
+
+def _comment_from_tuple(data):
+    if data is None:
+        return None
+    return _restore_comment(*data)
+
+
+def encode_enzymes(enzymes, level=1):
+    """Encodes a batch of enzymes, e.g. to send them to another process.
+
+    Enzymes are flattened into nested tuples of strings, integers and lists,
+    which are pickled much faster than the objects themselves, and the result
+    is compressed with zlib (most of its size is text that compresses well).
+
+    Only the fields of the object model are encoded (as with to_jsonl): entries
+    shared between enzymes (see the cache_size option of BRENDAParser) are
+    decoded as distinct, equal entries, and attributes added afterwards (e.g.
+    Protein.global_id) are not encoded.
+
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances
+    :param level: zlib compression level, from 0 (no compression, fastest) to
+        9 (smallest)
+    :return: encoded enzymes (bytes)
+    """
+    if not 0 <= level <= 9:
+        raise ArgumentError('Compression level must be between 0 and 9: {}'.format(level))
+    records = [
+        (enzyme.ec_number, enzyme.comment, enzyme.references,
+         [(protein_id, protein._index, protein.organism, protein.identifiers, protein.references,
+           protein.information, _comment_to_tuple(protein.comment))
+          for protein_id, protein in enzyme.proteins.items()],
+         [(section, [(entry.msg, entry.proteins, entry.references, entry.information,
+                      _comment_to_tuple(entry.comment)) for entry in entries])
+          for section, entries in enzyme.entries.items()])
+        for enzyme in unique_enzymes(enzymes)]
+    data = pickle.dumps((FORMAT_VERSION, records), pickle.HIGHEST_PROTOCOL)
+    return zlib.compress(data, level) if level else data
+
+
+def decode_enzymes(data):
+    """Decodes a batch of enzymes encoded by encode_enzymes.
+
+    :param data: encoded enzymes (bytes)
+    :return: list of Enzyme instances, in the order they were encoded
+    """
+    if data[:1] != pickle.PROTO:  # compressed
+        data = zlib.decompress(data)
+    version, records = pickle.loads(data)
+    if version != FORMAT_VERSION:
+        raise ArgumentError('Unsupported encoding version: {}'.format(version))
+
+    enzymes = list()
+    for ec_number, comment, references, proteins, sections in records:
+        proteins = {
+            protein_id: _restore_protein(index, organism, identifiers, protein_references,
+                                         information, _comment_from_tuple(protein_comment))
+            for protein_id, index, organism, identifiers, protein_references, information,
+            protein_comment in proteins}
+        entries = {
+            section: [_restore_entry(msg, entry_proteins, entry_references, information,
+                                     _comment_from_tuple(entry_comment))
+                      for msg, entry_proteins, entry_references, information, entry_comment
+                      in section_entries]
+            for section, section_entries in sections}
+        enzymes.append(_restore_enzyme(ec_number, comment, proteins, references, entries))
+    return enzymes
+
+
+def send_enzymes(connection, enzymes, level=1):
+    """Sends a batch of enzymes through a multiprocessing connection (e.g. one
+    end of a multiprocessing.Pipe), encoded by encode_enzymes.
+
+    :param connection: a multiprocessing.connection.Connection instance
+    :param enzymes: dict as returned by BRENDAParser.parse, or an iterable of
+        Enzyme instances
+    :param level: zlib compression level (see encode_enzymes)
+    """
+    connection.send_bytes(encode_enzymes(enzymes, level))
+
+
+def recv_enzymes(connection):
+    """Receives a batch of enzymes sent by send_enzymes.
+
+    :param connection: a multiprocessing.connection.Connection instance
+    :return: list of Enzyme instances
+    """
+    return decode_enzymes(connection.recv_bytes())
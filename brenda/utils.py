@@ -24,7 +24,8 @@ BRENDA Enzyme Database Parser
 import re
 import errno
 import sys
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from collections.abc import Mapping
 
 
 class ArgumentError(Exception):
@@ -54,38 +55,137 @@ class ArgumentError(Exception):
         return self.strerror
 
 
+_ec_number = re.compile(r'[1-7](\.\d+){2}\.\d+')
+_ec_number_full = re.compile(r'[1-7](\.\d+){2}\.\d+$')
+
+
 def has_ec_number(text):
-    return re.search(r'[1-7](\.\d+){2}\.\d+', text) is not None
+    return '.' in text and _ec_number.search(text) is not None
 
 
 def is_ec_number(text):
-    return re.match(r'[1-7](\.\d+){2}\.\d+$', text) is not None
+    return text.count('.') == 3 and _ec_number_full.match(text) is not None
+
+
+def ec_prefixes(ec_number):
+    """Returns the partial EC numbers under which an enzyme is indexed, from
+    the general class down to the full EC number, e.g. '1', '1.1', '1.1.1'
+    and '1.1.1.1' for '1.1.1.1'.
+
+    :param ec_number: a full EC number
+    :return: list of partial EC numbers
+    """
+    ec_num = ec_number.split('.')
+    return ['.'.join(ec_num[:i]) for i in range(1, len(ec_num) + 1)]
+
+
+def in_ec_class(ec_number, ec_prefix):
+    """Returns True if ec_number is ec_prefix or belongs to the (sub)class
+    designated by ec_prefix, e.g. '3.4.21.1' belongs to '3.4' but not to '3.41'.
+    """
+    return ec_number == ec_prefix or ec_number.startswith(ec_prefix + '.')
+
+
+def unique_enzymes(enzymes):
+    """Yields every Enzyme exactly once from either a dict (or EnzymeStore) as
+    returned by BRENDAParser.parse (where enzymes are also listed under partial
+    EC numbers) or an iterable of Enzyme instances.
+
+    :param enzymes: mapping of EC numbers to lists of Enzyme objects, or an
+        iterable of Enzyme objects
+    :return: generator of Enzyme objects
+    """
+    if isinstance(enzymes, Mapping):
+        for ec_number in enzymes:
+            if is_ec_number(ec_number):
+                yield from enzymes[ec_number]
+    else:
+        yield from enzymes
+
+
+Tags = namedtuple(
+    'Tags',
+    ['protein', 'comment', 'abnormal_comment', 'information', 'reference', 'numbers',
+     'accession'])
+
+# UniProt accession, see https://www.uniprot.org/help/accession_numbers
+_accession = r'[OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9][A-Z][A-Z0-9]{2}[0-9]|' \
+             '[A-NR-Z][0-9][A-Z][A-Z0-9]{2}[0-9][A-Z][A-Z0-9]{2}[0-9]'
+
+_tags = Tags(
+    protein=re.compile(r'#(.+?)#', re.UNICODE),
+    comment=re.compile(r' \((.*)\)', re.UNICODE),
+    abnormal_comment=re.compile(r'\|(.*?)\|', re.UNICODE),
+    information=re.compile(r'{(.*?)\}', re.UNICODE),
+    reference=re.compile(r'<(.+?)>', re.UNICODE),
+    numbers=re.compile(r'\d+', re.UNICODE),
+    accession=re.compile(r'(%s)\s+(uniprot|unipro|swissprot|genbank|trembl|embl)*' %
+                         _accession, re.UNICODE | re.I))
+
+# Proteins field such as '#1,2, 3#'
+protein_field = re.compile(r'#(\d)+(,*(\s)*\d+)*#')
+
+# Comment clauses are separated by semicolons and start with a proteins field,
+# e.g. '#8# ordered bi-bi mechanism <8>; #1,2# reaction mechanism <12>'
+comment_clause_separator = re.compile(r';\s*(?=#[\d,\s]+#)')
+clause_proteins = re.compile(r'#([\d,\s]+)#\s*')
+clause_references = re.compile(r'\s*<([\d,\s]+)>$')
 
 
 def init_tags():
-    Tags = namedtuple(
-        'Tags',
-        ['protein', 'comment', 'abnormal_comment', 'information', 'reference',
-         'numbers', 'accession'])
-
-    # UniProt accession, see https://www.uniprot.org/help/accession_numbers
-    _accession = r'[OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9][A-Z][A-Z0-9]{2}[0-9]|' \
-                 '[A-NR-Z][0-9][A-Z][A-Z0-9]{2}[0-9][A-Z][A-Z0-9]{2}[0-9]'
-
-    return Tags(
-        protein=re.compile(r'#(.+?)#', re.UNICODE),
-        comment=re.compile(r' \((.*)\)', re.UNICODE),
-        abnormal_comment=re.compile(r'\|(.*?)\|', re.UNICODE),
-        information=re.compile(r'{(.*?)\}', re.UNICODE),
-        reference=re.compile(r'<(.+?)>', re.UNICODE),
-        numbers=re.compile(r'\d+', re.UNICODE),
-        accession=re.compile(r'(%s)\s+(uniprot|unipro|swissprot|genbank|trembl|embl)*' %
-                             _accession, re.UNICODE | re.I))
+    """Returns the compiled regex's describing BRENDA tags. They are compiled
+    once, at import time, and shared by all callers.
+
+    :return: Tags instance
+    """
+    return _tags
+
+
+# Every UniProt accession starts with a letter immediately followed by a digit
+_accession_start = re.compile(r'[A-Z][0-9]', re.I)
+
+
+def find_accessions(text, pattern):
+    """Returns the match objects of all accession numbers in text.
+
+    Most PROTEIN entries (organism names) do not contain any accession number.
+    The first position where an accession may start is located with a cheap
+    two-character pattern, and the full accession pattern is only run from
+    there on, if at all.
+
+    :param text: text that may contain accession numbers
+    :param pattern: compiled accession pattern (see init_tags)
+    :return: list of match objects, group 1 being the accession and group 2
+        the (optional) data bank
+    """
+    start = _accession_start.search(text)
+    if start is None:
+        return []
+    return list(pattern.finditer(text, start.start()))
+
+
+def find_all(text, char):
+    """Returns the indexes of all occurrences of a character in text.
+
+    This is a str.find-based replacement for [m.start() for m in
+    re.finditer(char, text)], which is considerably cheaper for the short
+    texts of BRENDA entries.
+
+    :param text: text to search
+    :param char: character (or substring) to find
+    :return: list of indexes, in increasing order
+    """
+    indexes = list()
+    find = text.find
+    i = find(char)
+    while i != -1:
+        indexes.append(i)
+        i = find(char, i + 1)
+    return indexes
 
 
 def find_parentheses_indexes(text):
-    return [x.start() for x in re.finditer(r'\(', text)], \
-           [x.start() for x in re.finditer(r'\)', text)]
+    return find_all(text, '('), find_all(text, ')')
 
 
 def replace_abnormal_comment(text, aobj):
@@ -93,15 +193,116 @@ def replace_abnormal_comment(text, aobj):
            '(' + text[(aobj.start() + 1):(aobj.end() - 1)] + ')' + text[aobj.end():]
 
 
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    """A bounded mapping that evicts its least recently used items."""
+
+    def __init__(self, maxsize):
+        """Initializes an LRUCache instance holding at most maxsize items."""
+        if maxsize <= 0:
+            raise ArgumentError('LRUCache: expected positive size, got %s', maxsize)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """Returns the value stored for key (marking it as most recently
+        used), or default if key is not in the cache.
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Stores value for key, evicting the least recently used item if the
+        cache is full.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Removes all items and resets the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """Returns the cache statistics as a CacheInfo tuple."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+def count_lines(filename, encoding='utf8', block_size=1 << 15):
+    """Counts the lines of a text file, at the same line boundaries as
+    iter_line_blocks (a last line without line ending is counted too).
+
+    :param filename: path of the file
+    :param encoding: encoding of the file
+    :param block_size: number of characters read at once
+    :return: number of lines
+    """
+    with open(filename, encoding=encoding, newline='') as handle:
+        return sum(len(lines) for lines in iter_line_blocks(handle, block_size))
+
+
+def iter_line_blocks(handle, block_size=1 << 15):
+    """Yields the lines of a text file opened with newline='' in lists of
+    consecutive lines, split at all the line boundaries recognized by
+    str.splitlines (carriage returns, line feeds, U+2028, etc.), like
+    codecs.open does.
+
+    Reading large blocks and splitting them at once is much faster than
+    reading the file line by line.
+
+    :param handle: file object
+    :param block_size: number of characters read at once
+    :return: generator of lists of lines, with their line endings
+    """
+    tail = ''
+    for block in iter(lambda: handle.read(block_size), ''):
+        lines = (tail + block).splitlines(True)
+        tail = lines.pop()  # may be incomplete, or a CR followed by LF
+        yield lines
+    if tail:
+        yield [tail]
+
+
+def iter_lines(handle):
+    """Yields the lines of a text file opened with newline='' (see
+    iter_line_blocks).
+
+    :param handle: file object
+    :return: generator of lines, with their line endings
+    """
+    for lines in iter_line_blocks(handle):
+        yield from lines
+
+
 class ProgressMeter:
     """Displays a progress meter."""
     def __init__(self, label, end=None, **kw_args):
         super(ProgressMeter, self).__init__(**kw_args)
-        if end:
-            self.end = float(end)
-            self.label = label
+        self.label = label
+        self.end = float(end) if end else None
 
     def update(self, current):
+        if self.end is None:  # unknown or empty total
+            return
         sys.stdout.write("\r{} {:.1%}".format(self.label, current / self.end))
         sys.stdout.flush()
 
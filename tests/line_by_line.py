@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    line_by_line.py
+
+.. |c| unicode:: U+A9
+"""
+
+from brenda.parser import BRENDAParser
+from brenda.utils import ArgumentError, has_ec_number, iter_lines
+
+
+class LineByLineParser(BRENDAParser):
+    """BRENDAParser reading the flat file line by line, and matching the
+    leading token of every line against the section names in turn, as the
+    parse loop did before it was made table-driven. It is kept as a baseline
+    for the table-driven loop, both for results and for speed, and does not
+    support threads.
+    """
+
+    def parse(self):
+        """Parses multiple Enzyme sections (see BRENDAParser.parse)."""
+        section_name = ''  # long section identifier, e.g. 'PROTEIN'
+        section_contents = list()  # contents of the section identified by section_name
+        short_entry = ''  # two- or three- letter section identifier, e.g. 'PR' for 'PROTEIN'
+        entry = list()  # contents of an entry identified by short_entry
+        entry_line = 0  # line number where the current entry starts
+        parser = self._parse_generic_entry
+
+        for line in iter_lines(self._file_handle):
+            if self._current.line_number % 1000 == 0:
+                self._progress.update(self._current.line_number)
+            self._current.line_number += 1
+
+            line = line.rstrip()
+            if not line or line.startswith('*'):
+                continue
+
+            content = line.split(None, 1)
+            if content[0] == 'ID' and len(content) > 1 and has_ec_number(content[1]):
+                self._parse_id(content[1])
+            elif content[0] in self._sections.keys():  # handle new section
+                # Finish handling previous section
+                if content[1:]:  # not a new section, actually
+                    entry.append(line.lstrip())
+                    continue
+                if entry:
+                    self._add_entry(section_contents, parser, section_name, entry, entry_line)
+                if section_contents and not self.is_section_redundant(section_name):
+                    if self._current.ec_number is None:  # skip to next EC due to invalid ID
+                        self._skip = True
+                        continue
+                    self._store_section(section_name, section_contents)
+
+                # Prepare to process current section
+                section_contents = list()
+                entry = list()
+                section_name = content[0]
+                parser = self._determine_parser_from_section_name(section_name)
+                short_entry = self._sections.get(section_name, False)
+                if not short_entry:
+                    raise ArgumentError('Unrecognised entry: \'%s\' @ #%s',
+                                        line, self._current.line_number)
+            elif content[0] == short_entry:  # handle previous and current entries
+                if entry:
+                    self._add_entry(section_contents, parser, section_name, entry, entry_line)
+                entry = content[1:]
+                entry_line = self._current.line_number
+            elif content[0] == '///':  # handle end of EC number description
+                if self._skip:
+                    self._skip = False
+                else:  # end one enzyme entry
+                    if entry:
+                        self._add_entry(section_contents, parser, section_name, entry,
+                                        entry_line)
+                    if section_contents and not self.is_section_redundant(section_name):
+                        self._store_section(section_name, section_contents)
+                    self._finish_enzyme()
+                # do not carry the last entry and section over to the next record
+                section_contents = list()
+                entry = list()
+            else:
+                entry.append(line.lstrip())
+        if self._store is not None:
+            self._finish_enzyme()
+            self._store.commit()
+            self._progress.close()
+            return self._store
+        res = dict(self.enzymes)
+        self._progress.close()
+        return res
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_conformance.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from brenda.conformance import MODES, check_conformance, diff_enzymes, fuzz_file, mutate, \
+    run_mode
+from brenda.utils import unique_enzymes
+from tests.line_by_line import LineByLineParser
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+# Seeds of the fuzzed copies of the test flat file
+SEEDS = (0, 1, 2, 3)
+
+# Seeds of further fuzzed copies checked against the line-by-line parse loop only
+LINE_SEEDS = range(4, 24)
+
+
+def error_keys(errors):
+    return [(e.line_number, e.ec_number, e.section, e.text, type(e.error).__name__)
+            for e in errors]
+
+
+class TestConformance(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestConformance, cls).setUpClass()
+        cls.enzymes, _, _ = run_mode('reference', input_test)
+
+    def assertConforms(self, filename):
+        results = check_conformance(filename, tolerant=True)
+        self.assertEqual([result.mode for result in results], list(MODES))
+        for result in results:
+            self.assertEqual(result.differences, list(), result.mode)
+            self.assertEqual(result.enzymes, 12)
+            self.assertGreater(result.bytes_per_second, 0)
+
+    def test_modes_conform_on_test_file(self):
+        self.assertConforms(input_test)
+
+    def test_modes_conform_on_fuzzed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'fuzzed.txt')
+            for seed in SEEDS:
+                with self.subTest(seed=seed):
+                    fuzz_file(input_test, output, seed, mutations=40)
+                    self.assertConforms(output)
+
+    def assertLineByLineConforms(self, filename):
+        expected, expected_errors, _ = run_mode('reference', filename, tolerant=True)
+        with LineByLineParser(filename, tolerant=True) as parser:
+            enzymes = list(unique_enzymes(parser.parse()))
+        self.assertEqual(diff_enzymes(expected, enzymes), list())
+        self.assertEqual(error_keys(parser.errors), error_keys(expected_errors))
+
+    def test_line_by_line_loop_conforms_on_test_file(self):
+        self.assertLineByLineConforms(input_test)
+
+    def test_line_by_line_loop_conforms_on_fuzzed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'fuzzed.txt')
+            for seed in SEEDS + tuple(LINE_SEEDS):
+                with self.subTest(seed=seed):
+                    fuzz_file(input_test, output, seed, mutations=40)
+                    self.assertLineByLineConforms(output)
+
+    def test_diff_detects_changed_fields(self):
+        actual, _, _ = run_mode('jsonl', input_test)
+        self.assertEqual(diff_enzymes(self.enzymes, actual), list())
+
+        enzyme = actual[0]
+        protein_id, protein = next(iter(enzyme.proteins.items()))
+        protein.organism = 'Unknown organism'
+        next(iter(enzyme.entries.values()))[0].msg = 'changed'
+        paths = [difference.path for difference in diff_enzymes(self.enzymes, actual)]
+        self.assertEqual(len(paths), 2)
+        self.assertIn((enzyme.ec_number, 'proteins', str(protein_id), 'organism'), paths)
+        self.assertTrue(any(path[-1] == 'msg' for path in paths))
+
+        differences = diff_enzymes(self.enzymes, actual[1:])
+        self.assertEqual([difference.path for difference in differences], [('ec_numbers',)])
+
+    def test_fuzzing_is_deterministic(self):
+        with open(input_test, encoding='utf8', newline='') as handle:
+            text = handle.read()
+        mutated = mutate(text, random.Random(7), 40)
+        self.assertEqual(mutated, mutate(text, random.Random(7), 40))
+        self.assertNotEqual(mutated, text)
+        self.assertNotEqual(mutated, mutate(text, random.Random(8), 40))
+        self.assertEqual([line for line in mutated.split('\n') if line.startswith('ID')],
+                         [line for line in text.split('\n') if line.startswith('ID')])
+
+
+if __name__ == '__main__':
+    unittest.main()
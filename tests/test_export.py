@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_export.py
+
+.. |c| unicode:: U+A9
+"""
+
+import io
+import os
+import pathlib
+import tempfile
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.export import to_jsonl, from_jsonl, iter_jsonl, enzyme_to_dict, orjson
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestJsonLinesExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestJsonLinesExport, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+
+    def _roundtrip(self, backend):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'brenda.jsonl')
+            count = to_jsonl(self.brenda, filename, backend=backend)
+            with open(filename, 'rb') as handle:
+                self.assertEqual(len(handle.readlines()), count)
+            return count, from_jsonl(filename, backend=backend)
+
+    def test_every_enzyme_is_written_once(self):
+        count, _ = self._roundtrip('json')
+        self.assertEqual(count, len([ec for ec in self.brenda if ec.count('.') == 3]))
+
+    def test_roundtrip_preserves_enzymes(self):
+        _, loaded = self._roundtrip('json')
+        self.assertEqual(sorted(loaded.keys()), sorted(self.brenda.keys()))
+        for ec_number in self.brenda:
+            self.assertEqual([enzyme_to_dict(e) for e in loaded[ec_number]],
+                             [enzyme_to_dict(e) for e in self.brenda[ec_number]])
+
+    def test_roundtrip_restores_object_model(self):
+        _, loaded = self._roundtrip('json')
+        enzyme = loaded['6.6.1.2'][0]
+        self.assertEqual(enzyme.proteins[7].information, 'some information')
+        self.assertEqual(enzyme.proteins[1].comment.msg, 'nomen rejiciendum')
+        self.assertEqual(loaded['1.1.1.888'][0].comment, 'transferred from 1.1.1.999')
+        reaction = loaded['1.1.1.35'][0].entries['REACTION'][0]
+        self.assertEqual(reaction.msg, '(S)-3-hydroxyacyl-CoA + NAD+ = 3-oxoacyl-CoA + NADH + H+')
+        self.assertEqual(reaction.comment.proteins, [4, 5, 19, 25])
+
+    def test_roundtrip_with_path(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / 'brenda.jsonl'
+            count = to_jsonl(self.brenda, path, backend='json')
+            loaded = from_jsonl(path, backend='json')
+            self.assertEqual(len(list(iter_jsonl(path, backend='json'))), count)
+        self.assertEqual(sorted(loaded.keys()), sorted(self.brenda.keys()))
+
+    @unittest.skipIf(orjson is None, 'orjson not installed')
+    def test_orjson_backend_is_interchangeable(self):
+        handle = io.BytesIO()
+        to_jsonl(self.brenda['1.1.1'], handle, backend='orjson')
+        handle.seek(0)
+        loaded = list(iter_jsonl(handle, backend='json'))
+        self.assertEqual([enzyme_to_dict(e) for e in loaded],
+                         [enzyme_to_dict(e) for e in self.brenda['1.1.1']])
+
+
+if __name__ == '__main__':
+    unittest.main()
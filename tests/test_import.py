@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_import.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+# Import time benchmark thresholds (cumulative, as reported by -X importtime)
+MAX_PACKAGE_IMPORT_SECONDS = 0.02
+MAX_PARSER_IMPORT_SECONDS = 0.2
+
+
+def run_python(code, *options):
+    """Runs Python code in a new interpreter and returns its standard output
+    and standard error.
+    """
+    result = subprocess.run([sys.executable] + list(options) + ['-c', code],
+                            capture_output=True, text=True, check=True)
+    return result.stdout, result.stderr
+
+
+def import_time(module):
+    """Returns the cumulative import time of a module in a new interpreter, in
+    seconds.
+    """
+    _, stderr = run_python('import ' + module, '-X', 'importtime')
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative) / 1e6
+    raise AssertionError('Module not imported: ' + module)
+
+
+class TestImport(unittest.TestCase):
+    def test_package_import_is_lazy(self):
+        stdout, _ = run_python(
+            'import sys, brenda; print(sorted(m for m in sys.modules if m.startswith("brenda")))')
+        self.assertEqual(stdout.strip(), "['brenda']")
+
+    def test_attributes_load_submodules(self):
+        stdout, _ = run_python(
+            'import sys, brenda; brenda.BRENDAParser; brenda.store; '
+            'print(sorted(m for m in sys.modules if m.startswith("brenda")))')
+        self.assertEqual(stdout.strip(), "['brenda', 'brenda.parser', 'brenda.reactions', "
+                                         "'brenda.store', 'brenda.utils']")
+        import brenda
+        from brenda.parser import BRENDAParser
+        self.assertIs(brenda.BRENDAParser, BRENDAParser)
+        with self.assertRaises(AttributeError):
+            brenda.UnknownName
+        self.assertIn('BRENDAParser', dir(brenda))
+
+    def test_parser_does_not_import_executors(self):
+        stdout, _ = run_python(
+            'import sys, brenda.parser; print("multiprocessing" in sys.modules, '
+            '"concurrent.futures" in sys.modules)')
+        self.assertEqual(stdout.strip(), 'False False')
+
+    def test_parser_without_recordclass(self):
+        without_recordclass = 'import sys; sys.modules["recordclass"] = None; '
+        code = ('from brenda.parser import BRENDAParser; from brenda.export import to_jsonl\n'
+                'with BRENDAParser({!r}) as parser:\n'
+                '    to_jsonl(parser.parse(), {!r})')
+        with tempfile.TemporaryDirectory() as directory:
+            outputs = list()
+            for prefix in ('', without_recordclass):
+                output = os.path.join(directory, 'brenda.jsonl')
+                run_python(prefix + code.format(input_test, output))
+                with open(output, 'rb') as handle:
+                    outputs.append(handle.read())
+            self.assertEqual(outputs[0], outputs[1])
+
+        stdout, _ = run_python(without_recordclass +
+                               'from brenda.parser import Current, recordclass; '
+                               'current = Current(1, 2, 3, 4, 5, 6); current.line_number = 7; '
+                               'print(recordclass is None, current.proteins, current.line_number)')
+        self.assertEqual(stdout.strip(), 'True 1 7')
+
+    def test_import_time(self):
+        self.assertLess(import_time('brenda'), MAX_PACKAGE_IMPORT_SECONDS)
+        self.assertLess(import_time('brenda.parser'), MAX_PARSER_IMPORT_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_memory.py
+
+.. |c| unicode:: U+A9
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from brenda.memory import deep_size, measure_parse, size_breakdown
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+thresholds_file = os.path.join('resources', 'memory_thresholds.json')
+
+# Number of copies of the test flat file parsed, from smallest to largest
+SCALES = (1, 2, 4)
+
+
+class TestMemory(unittest.TestCase):
+    """Memory benchmarks, failing when parsing needs more memory than the
+    thresholds stored in resources/memory_thresholds.json.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestMemory, cls).setUpClass()
+        with open(thresholds_file) as handle:
+            cls.thresholds = json.load(handle)
+        with open(input_test, 'rb') as handle:
+            data = handle.read()
+
+        cls.sizes = list()
+        cls.measures = list()
+        with tempfile.TemporaryDirectory() as directory:
+            for scale in SCALES:
+                filename = os.path.join(directory, 'brenda_{}.txt'.format(scale))
+                with open(filename, 'wb') as handle:
+                    handle.write(data * scale)
+                cls.sizes.append(len(data) * scale)
+                cls.measures.append(measure_parse(filename))
+        cls.breakdown = size_breakdown(cls.measures[0].result)
+
+    def test_peak_memory(self):
+        for size, measure in zip(self.sizes, self.measures):
+            self.assertLessEqual(measure.peak / size, self.thresholds['peak_bytes_per_input_byte'])
+
+    def test_retained_memory(self):
+        for size, measure in zip(self.sizes, self.measures):
+            self.assertLessEqual(measure.retained / size,
+                                 self.thresholds['retained_bytes_per_input_byte'])
+
+    def test_memory_scales_linearly(self):
+        ratios = [measure.peak / size for size, measure in zip(self.sizes, self.measures)]
+        self.assertLessEqual(max(ratios) / min(ratios), self.thresholds['max_scaling_ratio'])
+
+    def test_retained_size_per_object(self):
+        breakdown = self.breakdown
+        self.assertEqual((breakdown.n_enzymes, breakdown.n_proteins), (12, 245))
+        self.assertLessEqual(breakdown.enzymes / breakdown.n_enzymes,
+                             self.thresholds['bytes_per_enzyme'])
+        self.assertLessEqual(breakdown.proteins / breakdown.n_proteins,
+                             self.thresholds['bytes_per_protein'])
+        self.assertLessEqual(breakdown.entries / breakdown.n_entries,
+                             self.thresholds['bytes_per_entry'])
+
+    def test_retained_size_per_section(self):
+        breakdown = self.breakdown
+        self.assertEqual(sum(breakdown.sections.values()), breakdown.entries)
+        self.assertEqual(sum(breakdown.section_entries.values()), breakdown.n_entries)
+        for section, threshold in self.thresholds['section_bytes_per_entry'].items():
+            self.assertLessEqual(
+                breakdown.sections[section] / breakdown.section_entries[section], threshold,
+                section)
+
+    def test_deep_size_counts_shared_objects_once(self):
+        shared = ['x' * 100]
+        self.assertEqual(deep_size([shared, shared]) - deep_size([shared]),
+                         sys.getsizeof([shared, shared]) - sys.getsizeof([shared]))
+        seen = set()
+        size = deep_size(shared, seen)
+        self.assertEqual(deep_size(shared, seen), 0)
+        self.assertGreater(size, 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
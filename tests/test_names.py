@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_names.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.names import NameHit, NameIndex, normalize_name
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestNameIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestNameIndex, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+        cls.index = NameIndex.from_enzymes(cls.brenda)
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('G-1-P Dehydrogenase'), 'g1pdehydrogenase')
+        self.assertEqual(normalize_name(' CobN–CobST '), 'cobncobst')
+
+    def test_lookup_synonym(self):
+        self.assertEqual(self.index.lookup('G1PDH'),
+                         [NameHit('1.1.1.261', 'SYNONYMS', 'G1PDH', [11])])
+        self.assertEqual(self.index.lookup('egsa'),
+                         [NameHit('1.1.1.261', 'SYNONYMS', 'EgsA', [10, 11])])
+        self.assertEqual(self.index.lookup('no such enzyme'), [])
+
+    def test_lookup_is_punctuation_insensitive(self):
+        self.assertEqual(self.index.lookup('g 1 p dehydrogenase'),
+                         self.index.lookup('G-1-P-dehydrogenase'))
+        self.assertEqual(len(self.index.lookup('G-1-P dehydrogenase')), 2)
+
+    def test_ec_numbers(self):
+        self.assertEqual(self.index.ec_numbers('cobaltochelatase'), ['6.6.1.2'])
+        self.assertEqual(self.index.ec_numbers('sn-glycerol-1-phosphate dehydrogenase'),
+                         ['1.1.1.261'])
+
+    def test_complete(self):
+        names = [hit.name for hit in self.index.complete('cob', limit=None)]
+        self.assertIn('cobaltochelatase', names)
+        self.assertIn('CobNST', names)
+        self.assertTrue(all(normalize_name(name).startswith('cob') for name in names))
+        self.assertEqual(len({normalize_name(hit.name)
+                              for hit in self.index.complete('cob', limit=2)}), 2)
+        self.assertEqual(self.index.complete('zzz'), [])
+
+    def test_fuzzy(self):
+        matches = self.index.fuzzy('G1PHD', max_distance=2)
+        self.assertIn((2, NameHit('1.1.1.261', 'SYNONYMS', 'G1PDH', [11])), matches)
+        matches = self.index.fuzzy('cobaltochelatse')
+        self.assertEqual(matches[0][0], 1)
+        self.assertEqual(matches[0][1].ec_number, '6.6.1.2')
+        distances = [distance for distance, _ in matches]
+        self.assertEqual(distances, sorted(distances))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,10 +20,28 @@ BRENDA Enzyme Database Parser
 
 import unittest
 import os
-from brenda.parser import BRENDAParser
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from brenda.parser import BRENDAParser, Entry, Protein, MalformedEntry, CommentClause, \
+    parse_entry, parse_entries, iter_entries, split_comment, summarize_stats
+from brenda.export import enzyme_to_dict
+from brenda.utils import ArgumentError, count_lines
+from tests.line_by_line import LineByLineParser
 
 input_test = os.path.join('resources', 'brenda_test.txt')
 
+# Upper bound for the time of the parse loop relative to the line-by-line loop
+# it replaced, entries not being parsed (see TestParseLoopBenchmark). Typical
+# values are around 0.65; the bound leaves room for timing noise.
+MAX_LOOP_TIME_RATIO = 0.9
+
+# Upper bound for the time of parsing with threads relative to sequential
+# parsing (see TestThreadsBenchmark). With the GIL, threads cannot parse faster
+# than the calling thread: typical values are around 1.1, whereas submitting
+# every entry on its own took more than twice as long.
+MAX_THREADS_TIME_RATIO = 1.3
+
 
 class TestBrendaParser(unittest.TestCase):
     @classmethod
@@ -124,6 +142,13 @@ class TestBrendaParser(unittest.TestCase):
         self.assertIsNone(entry777.comment)
         self.assertEqual(entry888.comment, 'transferred from 1.1.1.999')
 
+    def test_ic50_entries(self):
+        self.assertEqual(BRENDAParser._sections['IC50_VALUE'], 'IC50')
+        entries = self.brenda['1.1.1.100'][0].entries['IC50_VALUE']
+        self.assertEqual(len(entries), 25)
+        self.assertEqual((entries[2].msg, entries[2].information, entries[2].proteins),
+                         ('0.0212', 'kaempferol', [38]))
+
     def test_reaction_with_comment(self):
         text = \
             'a long-chain acyl-[acyl-carrier protein] + reduced flavodoxin '\
@@ -382,6 +407,403 @@ class TestBrendaParser(unittest.TestCase):
             reaction.msg,
             'colloidal chitin + H2O = N-acetylglucosamine + N,N-diacetylchitobiose + ?')
 
+    def test_last_section_is_not_carried_over_to_next_record(self):
+        self.assertEqual(len(self.brenda['1.1.1.35'][0].entries['PI_VALUE']), 3)
+        self.assertEqual(self.brenda['1.1.1.666'][0].entries, {})
+        self.assertEqual(self.brenda['1.1.1.888'][0].entries, {})
+
+    def test_comment_clauses(self):
+        text = \
+            '#1,2# dihydroclavaminate + 2-oxoglutarate + O2 = clavaminate + succinate + ' \
+            'CO2 + H2O (#2# stereochemical course of oxygen insertion <5>; #1,2# cyclization ' \
+            '<1,2,3>; #2# syn-elimination; of the requisite hydrogens <12>) |#2# 5S) enantiomer ' \
+            '<3,4>| <1,2,3> '
+        reaction = self.parser._parse_generic_entry(text)
+        self.assertEqual(reaction.comment.clauses, [
+            CommentClause('stereochemical course of oxygen insertion', [2], [5]),
+            CommentClause('cyclization', [1, 2], [1, 2, 3]),
+            CommentClause('syn-elimination; of the requisite hydrogens', [2], [12]),
+            CommentClause('5S) enantiomer', [2], [3, 4])])
+        self.assertIsNone(reaction.clauses)
+
+    def test_comment_clauses_without_tags(self):
+        entry = self.brenda['6.6.1.2'][0]
+        self.assertEqual(entry.proteins[1].comment.clauses,
+                         [CommentClause('nomen rejiciendum', None, None)])
+        self.assertEqual(split_comment(None), [])
+
+    def test_comment_numbers_are_deduplicated(self):
+        comment = self.parser._parse_comment('; '.join(
+            '#{},{}# remark <{},1>'.format(i, i + 1, i) for i in range(1, 2001)))
+        self.assertEqual(comment.proteins, list(range(1, 2002)))
+        self.assertEqual(comment.references, list(range(1, 2001)))
+        self.assertEqual(len(comment.clauses), 2000)
+        self.assertEqual(comment.clauses[-1], CommentClause('remark', [2000, 2001], [2000, 1]))
+
+
+class TestThreadedBrendaParser(unittest.TestCase):
+    def test_threaded_parse_matches_serial_parse(self):
+        with BRENDAParser(input_test) as parser:
+            expected = parser.parse()
+        with BRENDAParser(input_test, threads=4) as parser:
+            brenda = parser.parse()
+        self.assertEqual(sorted(brenda), sorted(expected))
+        for ec_number in expected:
+            self.assertEqual([enzyme_to_dict(e) for e in brenda[ec_number]],
+                             [enzyme_to_dict(e) for e in expected[ec_number]])
+
+    def test_parse_entry(self):
+        entry = parse_entry('REACTION', '#5# lithocholic acid + NADPH + H+ = '
+                                        'ursodeoxycholic acid + NADP+ (#5# r <9>) <9>')
+        self.assertIsInstance(entry, Entry)
+        self.assertEqual(entry.msg, 'lithocholic acid + NADPH + H+ = ursodeoxycholic acid + NADP+')
+        self.assertEqual(entry.comment.msg, '#5# r <9>')
+
+        protein_id, protein = parse_entry('PROTEIN', '#11# Methanocaldococcus jannaschii Q58122 '
+                                                     'UniProt <14>')
+        self.assertEqual(protein_id, 11)
+        self.assertIsInstance(protein, Protein)
+        self.assertEqual(protein.organism, 'Methanocaldococcus jannaschii')
+        self.assertEqual(protein.identifiers, ['Q58122'])
+        self.assertEqual(protein.references, [14])
+
+    def test_parse_entry_concurrently(self):
+        texts = ['#{0}# compound{0} = product{0} (#{0}# comment {0} <{0}>) <{0}>'.format(i)
+                 for i in range(1, 2001)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            entries = list(executor.map(parse_entry, ['SUBSTRATE_PRODUCT'] * len(texts), texts))
+        for i, entry in enumerate(entries, 1):
+            self.assertEqual(entry.msg, 'compound{0} = product{0}'.format(i))
+            self.assertEqual(entry.proteins, [i])
+            self.assertEqual(entry.references, [i])
+            self.assertEqual(entry.comment.msg, '#{0}# comment {0} <{0}>'.format(i))
+
+
+class TestBatchParsing(unittest.TestCase):
+    entries = [
+        ('PROTEIN', '#11# Methanocaldococcus jannaschii Q58122 UniProt <14>'),
+        ('SP', '#8# more = ? (#8# no activity with glycerol-2-phosphate <8>) <8>'),
+        ('KM_VALUE', '#1# 0.05 {NADH} (#1# pH 7.5, 25°C <2>) <2>'),
+        ('PROTEIN', 'Mus musculus <2>'),
+        ('RECOMMENDED_NAME', 'sn-glycerol-1-phosphate dehydrogenase'),
+    ] * 7
+
+    def _check(self, results):
+        self.assertEqual(len(results), len(self.entries))
+        for i in range(0, len(results), 5):
+            self.assertEqual(results[i][0], 11)
+            self.assertEqual(results[i][1].identifiers, ['Q58122'])
+            self.assertEqual(results[i + 1].msg, 'more = ?')
+            self.assertEqual(results[i + 2].information, 'NADH')
+            self.assertEqual(results[i + 2].comment.msg, '#1# pH 7.5, 25°C <2>')
+            self.assertIsInstance(results[i + 3], MalformedEntry)
+            self.assertEqual(results[i + 3].line_number, i + 3)
+            self.assertIsInstance(results[i + 3].error, ArgumentError)
+            self.assertEqual(results[i + 4].msg, 'sn-glycerol-1-phosphate dehydrogenase')
+
+    def test_parse_entries(self):
+        self._check(parse_entries(self.entries, chunk_size=4, tolerant=True))
+
+    def test_parse_entries_is_strict_by_default(self):
+        self.assertRaises(ArgumentError, parse_entries, self.entries)
+
+    def test_iter_entries_streams(self):
+        results = iter_entries(iter(self.entries), chunk_size=3, tolerant=True)
+        self.assertIsInstance(next(results), tuple)
+        self.assertEqual(len(list(results)), len(self.entries) - 1)
+
+    def test_parse_entries_with_executor(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self._check(parse_entries(self.entries, chunk_size=4, workers=3, executor=executor,
+                                      tolerant=True))
+
+    def test_parse_entries_with_worker_processes(self):
+        results = parse_entries(self.entries, chunk_size=4, workers=2, tolerant=True)
+        self._check(results)
+        indexes = [results[i][1]._index for i in range(0, len(results), 5)]
+        self.assertEqual(indexes, sorted(set(indexes)))
+
+
+class TestTolerantBrendaParser(unittest.TestCase):
+    malformed = \
+        'ID\t1.1.1.1\n' \
+        'PROTEIN\n' \
+        'PR\t#1# Homo sapiens   <1>\n' \
+        'PR\tMus musculus   <2>\n' \
+        'PR\t#3# Rattus norvegicus   <3>\n' \
+        '\n' \
+        'RECOMMENDED_NAME\n' \
+        'RN\talcohol dehydrogenase\n' \
+        '///\n'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp_dir.name, 'malformed.txt')
+        with open(self.filename, 'w') as handle:
+            handle.write(self.malformed)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_malformed_entry_aborts_parsing(self):
+        with BRENDAParser(self.filename) as parser:
+            self.assertRaises(ArgumentError, parser.parse)
+
+    def test_tolerant_mode_records_malformed_entries(self):
+        with BRENDAParser(self.filename, tolerant=True) as parser:
+            brenda = parser.parse()
+        enzyme = brenda['1.1.1.1'][0]
+        self.assertEqual(sorted(enzyme.proteins), [1, 3])
+        self.assertEqual(enzyme.entries['RECOMMENDED_NAME'][0].msg, 'alcohol dehydrogenase')
+        self.assertEqual(len(parser.errors), 1)
+        error = parser.errors[0]
+        self.assertEqual(error.line_number, 4)
+        self.assertEqual(error.ec_number, '1.1.1.1')
+        self.assertEqual(error.section, 'PROTEIN')
+        self.assertEqual(error.text, 'Mus musculus   <2>')
+        self.assertIsInstance(error.error, ArgumentError)
+        self.assertEqual(str(error.error), 'Protein reference missing: \'Mus musculus   <2>\' @ #4')
+
+    def test_tolerant_mode_records_malformed_proteins_field(self):
+        filename = os.path.join(self.tmp_dir.name, 'inhibitors.txt')
+        with open(filename, 'w') as handle:
+            handle.write('ID\t1.1.1.1\n'
+                         'INHIBITORS\n'
+                         'IN\t#1,3 x <2>\n'
+                         'IN\t#2# 50% NaCl <3>\n'
+                         '///\n')
+        with BRENDAParser(filename, tolerant=True) as parser:
+            brenda = parser.parse()
+        self.assertEqual(brenda['1.1.1.1'][0].entries['INHIBITORS'][0].msg, '50% NaCl')
+        self.assertEqual(len(parser.errors), 1)
+        error = parser.errors[0]
+        self.assertEqual((error.line_number, error.section), (3, 'INHIBITORS'))
+        self.assertIsInstance(error.error, ArgumentError)
+        self.assertEqual(str(error.error), 'Protein reference missing: \'1,3 x <2>\' @ #3')
+
+    def test_malformed_proteins_field_message(self):
+        with self.assertRaises(ArgumentError) as context:
+            parse_entry('IN', '#1,3 x 100% <2>', 7)
+        self.assertEqual(str(context.exception),
+                         'Protein reference missing: \'1,3 x 100% <2>\' @ #7')
+
+    def test_tolerant_mode_error_budget(self):
+        with BRENDAParser(self.filename, tolerant=True, max_errors=0) as parser:
+            self.assertRaises(ArgumentError, parser.parse)
+
+    def test_tolerant_mode_with_threads(self):
+        with BRENDAParser(self.filename, tolerant=True, threads=2) as parser:
+            brenda = parser.parse()
+        self.assertEqual(sorted(brenda['1.1.1.1'][0].proteins), [1, 3])
+        self.assertEqual([(e.line_number, e.section) for e in parser.errors], [(4, 'PROTEIN')])
+
+    def test_malformed_entry_aborts_parsing_with_threads(self):
+        with BRENDAParser(self.filename, threads=2) as parser:
+            self.assertRaises(ArgumentError, parser.parse)
+
+
+class TestCachedBrendaParser(unittest.TestCase):
+    def test_cached_parse_matches_uncached_parse(self):
+        with BRENDAParser(input_test) as parser:
+            expected = parser.parse()
+        with BRENDAParser(input_test, cache_size=100) as parser:
+            brenda = parser.parse()
+        self.assertEqual(sorted(brenda), sorted(expected))
+        for ec_number in expected:
+            self.assertEqual([enzyme_to_dict(e) for e in brenda[ec_number]],
+                             [enzyme_to_dict(e) for e in expected[ec_number]])
+
+        info = parser.cache_info()
+        self.assertGreater(info.hits, 0)
+        self.assertEqual(info.maxsize, 100)
+        self.assertLessEqual(info.currsize, 100)
+
+    def test_identical_entries_are_shared(self):
+        with BRENDAParser(input_test, cache_size=1000) as parser:
+            brenda = parser.parse()
+        entries = brenda['1.1.1.261'][0].entries['REACTION_TYPE']
+        self.assertEqual(entries[1].msg, 'oxidation')
+        self.assertIs(entries[1], brenda['1.1.1.100'][0].entries['REACTION_TYPE'][1])
+        self.assertIs(entries[1], brenda['1.5.1.11'][0].entries['REACTION_TYPE'][0])
+
+    def test_cache_is_disabled_by_default(self):
+        self.assertIsNone(BRENDAParser(input_test).cache_info())
+
+
+class TestScanStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestScanStats, cls).setUpClass()
+        cls.records = BRENDAParser(input_test).scan_stats()
+        with BRENDAParser(input_test) as parser:
+            cls.brenda = parser.parse()
+
+    def test_records(self):
+        self.assertEqual([record.ec_number for record in self.records],
+                         [ec for ec in self.brenda if ec.count('.') == 3])
+        first = self.records[0]
+        self.assertEqual((first.line_number, first.lines), (1, 507))
+        with open(input_test, 'rb') as handle:
+            data = handle.read()
+        self.assertEqual(first.bytes, data.index(b'\nID') + 1)
+        self.assertEqual(self.records[-1].lines, 2)
+
+    def test_entries_match_parsed_enzymes(self):
+        for record in self.records:
+            if record.ec_number not in ('6.6.1.2', '1.14.14.43', '2.4.1.53'):
+                continue  # other records have repeated sections, see scan_stats
+            enzyme = self.brenda[record.ec_number][0]
+            self.assertEqual(record.entries.get('PROTEIN', 0), len(enzyme.proteins))
+            self.assertEqual({section: count for section, count in record.entries.items()
+                              if not BRENDAParser.is_section_redundant(section)},
+                             {section: len(entries) for section, entries in enzyme.entries.items()})
+
+    def test_repeated_sections_are_counted(self):
+        record = self.records[0]
+        self.assertEqual(record.entries['ACTIVATING_COMPOUND'], 2)
+        self.assertEqual(len(self.brenda['1.1.1.261'][0].entries['ACTIVATING_COMPOUND']), 1)
+
+    def test_summarize_stats(self):
+        summary = summarize_stats(self.records)
+        self.assertEqual(summary[0].section, 'KM_VALUE')
+        self.assertEqual(summary[0].entries,
+                         sum(record.entries.get('KM_VALUE', 0) for record in self.records))
+        proteins = [stats for stats in summary if stats.section == 'PROTEIN'][0]
+        self.assertEqual(proteins.records, 9)
+        self.assertEqual(proteins.max_entries, 87)
+
+
+class TestParseLoop(unittest.TestCase):
+    record = \
+        'ID\t1.1.1.1\n' \
+        '********************\n' \
+        'PROTEIN\n' \
+        'PR\t#1# Homo sapiens <1>\n' \
+        '\n' \
+        'KM_VALUE\n' \
+        'KM\t#1# 0.5 {NAD+} (#1# at pH 7.5\n' \
+        '\tSUBSTRATE_PRODUCT given, SP assay <1>) <1>\n' \
+        'KM\t#1# 1.2 {ethanol} <1>\n' \
+        '///\n'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def parse(self, text):
+        filename = os.path.join(self.tmp_dir.name, 'record.txt')
+        with open(filename, 'w', newline='') as handle:
+            handle.write(text)
+        with BRENDAParser(filename) as parser:
+            brenda = parser.parse()
+        return brenda, parser
+
+    def test_continuation_lines(self):
+        brenda, _ = self.parse(self.record)
+        entries = brenda['1.1.1.1'][0].entries['KM_VALUE']
+        self.assertEqual([entry.msg for entry in entries], ['0.5', '1.2'])
+        self.assertEqual(entries[0].comment.msg,
+                         '#1# at pH 7.5 SUBSTRATE_PRODUCT given, SP assay <1>')
+        self.assertEqual(entries[0].information, 'NAD+')
+
+    def test_line_endings(self):
+        expected, parser = self.parse(self.record)
+        self.assertEqual(parser._current.line_number, 10)
+        expected = enzyme_to_dict(expected['1.1.1.1'][0])
+        for text in (self.record.replace('\n', '\r\n'), self.record.rstrip('\n'),
+                     self.record.replace('(#1# at pH 7.5\n', '(#1# at pH 7.5\u2028')):
+            brenda, _ = self.parse(text)
+            self.assertEqual(enzyme_to_dict(brenda['1.1.1.1'][0]), expected)
+
+    def test_carriage_returns_only(self):
+        expected, _ = self.parse(self.record)
+        brenda, parser = self.parse(self.record.replace('\n', '\r'))
+        self.assertEqual(parser._current.line_number, 10)
+        self.assertEqual(enzyme_to_dict(brenda['1.1.1.1'][0]),
+                         enzyme_to_dict(expected['1.1.1.1'][0]))
+        filename = os.path.join(self.tmp_dir.name, 'record.txt')
+        self.assertEqual(count_lines(filename), 10)
+
+    def test_single_line_without_line_ending(self):
+        brenda, parser = self.parse('ID\t1.1.1.1')
+        self.assertEqual(parser._current.line_number, 1)
+        self.assertEqual(brenda['1.1.1.1'][0].ec_number, '1.1.1.1')
+        filename = os.path.join(self.tmp_dir.name, 'record.txt')
+        self.assertEqual(count_lines(filename), 1)
+
+
+class _LoopParser(BRENDAParser):
+    """Runs the parse loop only: entries are dropped instead of being parsed."""
+    def _add_entry(self, section_contents, parser, section_name, entry, line_number):
+        pass
+
+
+class _LineByLineLoopParser(LineByLineParser):
+    """Runs the line-by-line loop only (see _LoopParser)."""
+    def _add_entry(self, section_contents, parser, section_name, entry, line_number):
+        pass
+
+
+class TestParseLoopBenchmark(unittest.TestCase):
+    @staticmethod
+    def best_time(parser_class, filename, repeat=3):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with parser_class(filename) as parser:
+                parser.parse()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_faster_than_line_by_line_loop(self):
+        with open(input_test, encoding='utf8') as handle:
+            text = handle.read()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'brenda.txt')
+            with open(filename, 'w', encoding='utf8') as handle:
+                handle.write(text * 10)
+            baseline = self.best_time(_LineByLineLoopParser, filename)
+            seconds = self.best_time(_LoopParser, filename)
+        self.assertLess(seconds, baseline * MAX_LOOP_TIME_RATIO)
+
+
+class _BatchCountingParser(BRENDAParser):
+    """Records the largest number of batches in flight in the thread pool."""
+    def _submit_batch(self, enzyme):
+        super(_BatchCountingParser, self)._submit_batch(enzyme)
+        self.max_in_flight = max(getattr(self, 'max_in_flight', 0), len(self._pending))
+
+
+class TestThreadsBenchmark(unittest.TestCase):
+    @staticmethod
+    def best_time(filename, repeat=3, **options):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with BRENDAParser(filename, **options) as parser:
+                parser.parse()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_threads_are_not_slower(self):
+        with open(input_test, encoding='utf8') as handle:
+            text = handle.read()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'brenda.txt')
+            with open(filename, 'w', encoding='utf8') as handle:
+                handle.write(text * 10)
+            baseline = self.best_time(filename)
+            seconds = self.best_time(filename, threads=4)
+        self.assertLess(seconds, baseline * MAX_THREADS_TIME_RATIO)
+
+    def test_batches_in_flight_are_bounded(self):
+        with _BatchCountingParser(input_test, threads=2) as parser:
+            parser.parse()
+        self.assertLessEqual(parser.max_in_flight, 4)
+        self.assertEqual(len(parser._pending), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
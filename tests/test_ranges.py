@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_ranges.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import random
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.ranges import RangeHit, RangeIndex, parse_range
+from brenda.utils import ArgumentError
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestRangeIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestRangeIndex, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+        cls.index = RangeIndex.from_enzymes(cls.brenda)
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('7'), (7.0, 7.0))
+        self.assertEqual(parse_range('6.5-7.5'), (6.5, 7.5))
+        self.assertEqual(parse_range('-20'), (-20.0, -20.0))
+        self.assertIsNone(parse_range('-999'))
+        self.assertIsNone(parse_range('more'))
+
+    def test_query(self):
+        hits = self.index.query('PH_OPTIMUM', 7.4, 7.4)
+        self.assertIn(RangeHit('1.1.1.261', 11, 'PH_OPTIMUM', 0), hits)
+        self.assertIn(RangeHit('1.1.1.261', 3, 'PH_OPTIMUM', 1), hits)
+        self.assertNotIn(RangeHit('1.1.1.261', 8, 'PH_OPTIMUM', 2), hits)
+        self.assertEqual(self.index.query('PH_OPTIMUM', 100, 200), [])
+        with self.assertRaises(ArgumentError):
+            self.index.query('NO_SUCH_SECTION', 1, 2)
+        with self.assertRaises(ArgumentError):
+            self.index.query('SUBSTRATE_PRODUCT', 1, 2)
+
+    def test_kinetic_values(self):
+        hits = self.index.query('KM_VALUE', 0.1)
+        self.assertTrue(hits)
+        for hit in hits:
+            entry = self.brenda[hit.ec_number][0].entries['KM_VALUE'][hit.index]
+            self.assertEqual(parse_range(entry.msg), (0.1, 0.1))
+        for section in ('TURNOVER_NUMBER', 'KI_VALUE', 'IC50_VALUE', 'SPECIFIC_ACTIVITY'):
+            self.assertTrue(self.index.query(section, 0, 1e6), section)
+        self.assertEqual(self.index.query('IC50_VALUE', -1000, -998), [])
+
+    def test_query_matches_scan(self):
+        intervals = self.index._intervals['MOLECULAR_WEIGHT']
+        rng = random.Random(0)
+        for _ in range(50):
+            low = rng.uniform(0, 400000)
+            high = low + rng.uniform(0, 100000)
+            expected = [hit for a, b, hit in intervals if a <= high and b >= low]
+            self.assertEqual(self.index.query('MOLECULAR_WEIGHT', low, high), expected)
+
+    def test_query_all(self):
+        proteins = self.index.query_all({'PH_OPTIMUM': (6, 8), 'TEMPERATURE_OPTIMUM': (70, 100)})
+        self.assertIn(('1.1.1.261', 3), proteins)
+        self.assertIn(('1.1.1.261', 8), proteins)
+        self.assertNotIn(('1.1.1.261', 11), proteins)
+        ec_numbers = self.index.query_all({'PH_OPTIMUM': (6, 8), 'TEMPERATURE_OPTIMUM': (70, 100)},
+                                          by='ec_number')
+        self.assertEqual(ec_numbers, sorted({ec for ec, _ in proteins}))
+
+
+if __name__ == '__main__':
+    unittest.main()
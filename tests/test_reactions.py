@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_reactions.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.reactions import Equation, ReactionNetwork, parse_equation
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestReactions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestReactions, cls).setUpClass()
+        with BRENDAParser(input_test, equations=True) as cls.bp:
+            cls.brenda = cls.bp.parse()
+
+    def test_parse_equation(self):
+        equation = parse_equation(
+            'sn-glycerol 1-phosphate + NAD(P)+ = glycerone phosphate + NAD(P)H + H+')
+        self.assertEqual(equation.substrates, [(1, 'sn-glycerol 1-phosphate'), (1, 'NAD(P)+')])
+        self.assertEqual(equation.products,
+                         [(1, 'glycerone phosphate'), (1, 'NAD(P)H'), (1, 'H+')])
+
+    def test_parse_equation_with_stoichiometry(self):
+        equation = parse_equation('2 H2O2 = O2 + 2 H2O')
+        self.assertEqual(equation, Equation([(2, 'H2O2')], [(1, 'O2'), (2, 'H2O')]))
+
+    def test_parse_equation_with_bogus_spacing(self):
+        equation = parse_equation('lithocholic acid + NADPH + H+  = ursodeoxycholic acid + NADP+')
+        self.assertEqual(equation.substrates,
+                         [(1, 'lithocholic acid'), (1, 'NADPH'), (1, 'H+')])
+        self.assertEqual(equation.products, [(1, 'ursodeoxycholic acid'), (1, 'NADP+')])
+
+    def test_parse_non_equation(self):
+        self.assertIsNone(parse_equation('redox reaction'))
+
+    def test_parser_stores_equations(self):
+        reaction = self.brenda['1.1.1.35'][0].entries['REACTION'][0]
+        self.assertEqual(reaction.equation.products,
+                         [(1, '3-oxoacyl-CoA'), (1, 'NADH'), (1, 'H+')])
+
+    def test_network_matches_entries(self):
+        network = ReactionNetwork.from_enzymes(self.brenda)
+        self.assertEqual(network.shape, self.bp.network.shape)
+        self.assertEqual(network.compounds, self.bp.network.compounds)
+        self.assertEqual(network.reactions, self.bp.network.reactions)
+        self.assertEqual(network.incidence(), self.bp.network.incidence())
+
+    def test_incidence_matrix(self):
+        network = ReactionNetwork()
+        network.add(parse_equation('A + 2 B = C'), 'r0')
+        network.add(parse_equation('C + A = A + D'), 'r1')
+        indptr, indices, data = network.incidence()
+        self.assertEqual(network.compounds, ['A', 'B', 'C', 'D'])
+        self.assertEqual(list(indptr), [0, 1, 2, 4, 5])
+        self.assertEqual(list(indices), [0, 0, 0, 1, 1])
+        self.assertEqual(list(data), [-1, -2, 1, -1, 1])
+
+    def test_placeholders_are_left_out_of_network(self):
+        equation = parse_equation('A + NAD+ = ?')
+        self.assertEqual(equation.products, [(1, '?')])
+        network = ReactionNetwork()
+        network.add(equation, 'r0')
+        network.add(parse_equation('B = ?'), 'r1')
+        network.add(parse_equation('more = ?'), 'r2')
+        self.assertEqual(network.compounds, ['A', 'NAD+', 'B'])
+        self.assertEqual(network.shape, (3, 3))
+        indptr, indices, data = network.incidence()
+        self.assertEqual(list(indices), [0, 0, 1])
+
+        network = ReactionNetwork.from_enzymes(self.brenda)
+        self.assertTrue(any(entry.msg.endswith('= ?') for enzyme in self.brenda['1.1.1.35']
+                            for entry in enzyme.entries['SUBSTRATE_PRODUCT']))
+        self.assertNotIn('?', network.compound_ids)
+        self.assertNotIn('more', network.compound_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_registry.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import unittest
+
+from brenda.parser import BRENDAParser, Current, Protein
+from brenda.registry import ProteinRegistry
+from brenda.utils import unique_enzymes
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestProteinRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestProteinRegistry, cls).setUpClass()
+        cls.registry = ProteinRegistry()
+        with BRENDAParser(input_test, registry=cls.registry) as bp:
+            cls.brenda = bp.parse()
+
+    def test_every_protein_is_registered(self):
+        for ec_number in self.brenda:
+            for enzyme in self.brenda[ec_number]:
+                for protein in enzyme.proteins.values():
+                    record = self.registry.records[protein.global_id]
+                    self.assertIs(protein.organism, record.organism)
+                    self.assertIs(protein.identifiers, record.identifiers)
+
+    def test_same_protein_is_shared(self):
+        enzyme = self.brenda['6.6.1.2'][0]
+        self.assertEqual(enzyme.proteins[5].global_id, enzyme.proteins[6].global_id)
+        self.assertNotEqual(enzyme.proteins[1].global_id, enzyme.proteins[5].global_id)
+        global_id = self.registry.lookup('Pseudomonas denitrificans',
+                                         ['Q9HZQ3', 'P29929', 'P29934', 'P29933'])
+        self.assertEqual(global_id, enzyme.proteins[5].global_id)
+        self.assertEqual(self.registry.occurrences(global_id),
+                         [('6.6.1.2', 5), ('6.6.1.2', 6), ('6.6.1.2', 7)])
+        self.assertEqual(self.registry.ec_numbers(global_id), ['6.6.1.2'])
+
+    def test_proteins_without_accessions_are_not_shared(self):
+        proteins = [protein for enzyme in unique_enzymes(self.brenda)
+                    for protein in enzyme.proteins.values()
+                    if protein.organism == 'Homo sapiens' and not protein.identifiers]
+        self.assertEqual(len(proteins), 2)
+        self.assertNotEqual(proteins[0].global_id, proteins[1].global_id)
+        self.assertIs(proteins[0].organism, proteins[1].organism)
+        for protein in proteins:
+            self.assertEqual(len(self.registry.occurrences(protein.global_id)), 1)
+        self.assertIsNone(self.registry.lookup('Homo sapiens'))
+
+    def test_per_ec_fields_are_kept(self):
+        enzyme = self.brenda['6.6.1.2'][0]
+        self.assertEqual(enzyme.proteins[5].comment.msg, 'nomen rejiciendum')
+        self.assertEqual(enzyme.proteins[6].comment.msg, 'bogus')
+
+    @staticmethod
+    def protein(organism, identifiers):
+        return Protein(organism, Current(identifiers, None, None, None, None, None))
+
+    def test_first_registration_order(self):
+        registry = ProteinRegistry()
+        first = self.protein('Homo sapiens', ['P00001'])
+        second = self.protein('Mus musculus', ['P00002'])
+        again = self.protein('Homo sapiens', ['P00001'])
+        third = self.protein('Homo sapiens', [])
+        self.assertEqual([registry.register('1.1.1.1', 1, first),
+                          registry.register('1.1.1.1', 2, second),
+                          registry.register('2.2.2.2', 1, again),
+                          registry.register('2.2.2.2', 2, third)], [0, 1, 0, 2])
+        self.assertEqual(registry.records,
+                         [('Homo sapiens', ['P00001']), ('Mus musculus', ['P00002']),
+                          ('Homo sapiens', [])])
+
+    def test_registry_after_parsing(self):
+        registry = ProteinRegistry()
+        with BRENDAParser(input_test, threads=2) as bp:
+            registry.register_enzymes(bp.parse())
+        self.assertEqual(registry.records, self.registry.records)
+        self.assertIsNone(registry.lookup('Homo sapiens', ['P00000']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_search.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import tempfile
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.search import Hit, TextIndex, tokenize
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestTextIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestTextIndex, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+        cls.index = TextIndex.from_enzymes(cls.brenda)
+
+    def _texts(self, hits):
+        texts = list()
+        for hit in hits:
+            enzyme = self.brenda[hit.ec_number][0]
+            if hit.section == 'PROTEIN':
+                item = enzyme.proteins[hit.index]
+                texts.append(item.organism if hit.field == 'msg' else None)
+            else:
+                item = enzyme.entries[hit.section][hit.index]
+            if hit.field == 'comment':
+                texts.append(item.comment.msg)
+            elif hit.field == 'information':
+                texts.append(item.information)
+            elif hit.section != 'PROTEIN':
+                texts.append(item.msg)
+        return texts
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('#11# Mg2+ (about 20% <14>)'),
+                         ['11', 'mg2', 'about', '20', '14'])
+
+    def test_keyword_query_matches_substring_scan(self):
+        hits = self.index.search('Zn2+')
+        self.assertTrue(hits)
+        for text in self._texts(hits):
+            self.assertIn('zn2', text.lower())
+
+    def test_scoped_query(self):
+        hits = self.index.search('zn2', ec_prefix='1.1.1', section='METALS_IONS',
+                                 field='comment')
+        self.assertIn(Hit('1.1.1.261', 'METALS_IONS', 1, 'comment'), hits)
+        for hit in hits:
+            self.assertTrue(hit.ec_number.startswith('1.1.1.'))
+            self.assertEqual((hit.section, hit.field), ('METALS_IONS', 'comment'))
+        self.assertEqual(self.index.search('zn2', ec_prefix='1.1.11'), [])
+
+    def test_phrase_query(self):
+        hits = self.index.search('"about 20% of the activity"')
+        self.assertEqual(len(hits), 3)
+        self.assertEqual(self.index.search('"activity about"'), [])
+
+    def test_prefix_query(self):
+        hits = self.index.search('dehydrogen* glycerol*', section='SYNONYMS')
+        texts = self._texts(hits)
+        self.assertIn('sn-glycerol-1-phosphate dehydrogenase', texts)
+        self.assertIn('Zn2+-dependent sn-glycerol-1-phosphate dehydrogenase', texts)
+        self.assertNotIn('G-1-P dehydrogenase', texts)
+
+    def test_organism_query(self):
+        hits = self.index.search('pyrococcus', section='PROTEIN')
+        self.assertIn(Hit('1.1.1.261', 'PROTEIN', 2, 'msg'), hits)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, 'brenda.index')
+            self.index.save(filename)
+            index = TextIndex.load(filename)
+        self.assertEqual(len(index), len(self.index))
+        self.assertEqual(index.search('dehydrogen* "g-1-p"'),
+                         self.index.search('dehydrogen* "g-1-p"'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_server.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import threading
+import unittest
+
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from brenda.export import enzyme_to_dict, entry_to_dict
+from brenda.parser import BRENDAParser
+from brenda.server import BRENDAServer, BRENDAClient, QueryEngine
+from brenda.utils import ArgumentError
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestBRENDAServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestBRENDAServer, cls).setUpClass()
+        with BRENDAParser(input_test) as parser:
+            cls.brenda = parser.parse()
+        cls.server = BRENDAServer(cls.brenda, port=0, cache_size=10)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.client = BRENDAClient(*cls.server.server_address)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join()
+        super(TestBRENDAServer, cls).tearDownClass()
+
+    def test_enzymes(self):
+        enzymes = self.client.enzymes('1.14')
+        self.assertEqual([enzyme_to_dict(e) for e in enzymes],
+                         [enzyme_to_dict(e) for e in self.brenda['1.14']])
+        with self.assertRaises(KeyError):
+            self.client.enzymes('9.9.9.9')
+
+    def test_entries(self):
+        entries = self.client.entries('1.1.1.261', 'SUBSTRATE_PRODUCT')
+        expected = self.brenda['1.1.1.261'][0].entries['SUBSTRATE_PRODUCT']
+        self.assertEqual([(ec, entry_to_dict(entry)) for ec, entry in entries],
+                         [('1.1.1.261', entry_to_dict(entry)) for entry in expected])
+        self.assertEqual(self.client.entries('1.1.1.261', 'UNKNOWN'), [])
+
+    def test_organism_and_accession(self):
+        self.assertEqual(self.client.organism('pseudomonas denitrificans'),
+                         [('6.6.1.2', 1), ('6.6.1.2', 5), ('6.6.1.2', 6), ('6.6.1.2', 7)])
+        self.assertEqual(self.client.accession('P29933'),
+                         [('6.6.1.2', 5), ('6.6.1.2', 6), ('6.6.1.2', 7)])
+        self.assertEqual(self.client.accession('X00000'), [])
+
+    def test_results_are_cached(self):
+        self.client.enzymes('6.6.1.2')
+        before = self.client.stats()
+        self.client.enzymes('6.6.1.2')
+        after = self.client.stats()
+        self.assertEqual(after['hits'], before['hits'] + 1)
+        self.assertEqual(after['misses'], before['misses'])
+        self.assertGreater(after['hit_rate'], 0)
+        self.assertLessEqual(after['currsize'], 10)
+
+    def test_invalid_query(self):
+        with self.assertRaises(ArgumentError):
+            self.client._get('unknown')
+        with self.assertRaises(ArgumentError):
+            self.client._get('enzymes', '1.1.1.261', 'x', 'y')
+        url = 'http://{}:{}/entries/1.1.1.261/KM_VALUE/z'.format(*self.server.server_address)
+        with self.assertRaises(HTTPError) as context:
+            urlopen(url, timeout=10)
+        self.assertEqual(context.exception.code, 400)
+        context.exception.close()
+
+    def test_percent_in_path(self):
+        with self.assertRaises(ArgumentError) as context:
+            self.client._get('foo 100%')
+        self.assertEqual(str(context.exception), 'Unknown query: /foo%20100%25')
+        url = 'http://{}:{}/foo%20bar'.format(*self.server.server_address)
+        with self.assertRaises(HTTPError) as context:
+            urlopen(url, timeout=10)
+        self.assertEqual(context.exception.code, 400)
+        context.exception.close()
+
+    def test_internal_error(self):
+        def query(path):
+            raise RuntimeError('broken')
+        self.server.engine.query = query  # shadows QueryEngine.query
+        try:
+            url = 'http://{}:{}/enzymes/1.1.1.1'.format(*self.server.server_address)
+            with self.assertRaises(HTTPError) as context:
+                urlopen(url, timeout=10)
+            self.assertEqual(context.exception.code, 500)
+            context.exception.close()
+        finally:
+            del self.server.engine.query
+
+
+class TestQueryEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestQueryEngine, cls).setUpClass()
+        with BRENDAParser(input_test) as parser:
+            cls.brenda = parser.parse()
+
+    def test_malformed_paths(self):
+        engine = QueryEngine(self.brenda)
+        for path in ('/', '/enzymes', '/enzymes/1.1.1.261/x/y', '/entries/1.1.1.261',
+                     '/entries/1.1.1.261/KM_VALUE/z', '/organism/a/b', '/accession',
+                     '/foo%20bar', '/enzymes/1.1/x%20y', '/100%'):
+            with self.subTest(path=path):
+                with self.assertRaises(ArgumentError) as context:
+                    engine.query(path)
+                self.assertIn(path, str(context.exception))
+
+    def test_paths_are_normalized(self):
+        engine = QueryEngine(self.brenda)
+        result = engine.query('/enzymes/6.6.1.2')
+        self.assertEqual(engine.query('//enzymes//6.6.1.2/'), result)
+        self.assertEqual(engine.query('/enzymes/6%2E6%2E1%2E2'), result)
+        self.assertEqual(engine.stats()['hits'], 2)
+
+    def test_large_results_are_not_cached(self):
+        engine = QueryEngine(self.brenda, max_result_size=1000)
+        self.assertGreater(len(engine.query('/enzymes/1')), 1000)
+        self.assertEqual(engine.stats()['currsize'], 0)
+        engine.query('/accession/P29933')
+        self.assertEqual(engine.stats()['currsize'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_store.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import tempfile
+import unittest
+
+from brenda.export import enzyme_to_dict
+from brenda.parser import BRENDAParser
+from brenda.store import EnzymeStore
+from brenda.utils import ArgumentError, unique_enzymes
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestEnzymeStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestEnzymeStore, cls).setUpClass()
+        with BRENDAParser(input_test) as parser:
+            cls.expected = parser.parse()
+        cls.store = EnzymeStore(cache_size=2)
+        with BRENDAParser(input_test, store=cls.store) as parser:
+            cls.brenda = parser.parse()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.store.close()
+        super(TestEnzymeStore, cls).tearDownClass()
+
+    def test_parse_returns_store(self):
+        self.assertIs(self.brenda, self.store)
+
+    def test_store_has_same_keys_as_dict(self):
+        self.assertEqual(list(self.brenda), list(self.expected))
+        self.assertEqual(len(self.brenda), len(self.expected))
+        self.assertIn('1.1.1', self.brenda)
+        self.assertNotIn('9.9.9.9', self.brenda)
+        with self.assertRaises(KeyError):
+            self.brenda['9.9.9.9']
+
+    def test_store_has_same_enzymes_as_dict(self):
+        for ec_number in self.expected:
+            self.assertEqual([enzyme_to_dict(e) for e in self.brenda[ec_number]],
+                             [enzyme_to_dict(e) for e in self.expected[ec_number]])
+
+    def test_enzymes_are_loaded_on_demand(self):
+        enzymes = self.brenda['1']
+        self.assertEqual(len(enzymes), len(self.expected['1']))
+        self.assertEqual([e.ec_number for e in enzymes[:3]],
+                         [e.ec_number for e in self.expected['1'][:3]])
+        self.assertLessEqual(self.brenda.cache_info().currsize, 2)
+        self.assertEqual([e.ec_number for e in self.brenda.enzymes()],
+                         [e.ec_number for e in unique_enzymes(self.expected)])
+
+    def test_store_can_be_reopened(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'brenda.sqlite')
+            with EnzymeStore(filename) as store:
+                with BRENDAParser(input_test, store=store) as parser:
+                    parser.parse()
+            with EnzymeStore(filename) as store:
+                self.assertEqual(store['6.6.1.2'][0].proteins[5].organism,
+                                 self.expected['6.6.1.2'][0].proteins[5].organism)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ArgumentError):
+            EnzymeStore(cache_size=0)
+        with self.assertRaises(ArgumentError):
+            BRENDAParser(input_test, threads=2, store=self.store)
+
+
+if __name__ == '__main__':
+    unittest.main()
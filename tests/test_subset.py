@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_subset.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import tempfile
+import unittest
+
+from collections import Counter
+
+from brenda.conformance import diff_enzymes
+from brenda.parser import BRENDAParser
+from brenda.subset import extract_records, iter_records, sample_records, parse_sample, \
+    _allocate
+from brenda.utils import ArgumentError, unique_enzymes
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestSubset(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestSubset, cls).setUpClass()
+        with open(input_test, 'rb') as handle:
+            cls.data = handle.read()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.output = os.path.join(cls.directory.name, 'subset.txt')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super(TestSubset, cls).tearDownClass()
+
+    def test_records(self):
+        records = list(iter_records(self.data))
+        self.assertEqual(len(records), 12)
+        self.assertEqual(records[0].ec_number, '1.1.1.261')
+        self.assertEqual(records[-1].ec_number, '1.1.1.888')
+        self.assertTrue(self.data[records[1].start:records[1].end].startswith(b'ID\t6.6.1.2\n'))
+        self.assertTrue(self.data[records[1].start:records[1].end].endswith(b'\n///\n'))
+
+    def test_record_without_end_line(self):
+        data = b'ID\t1.1.1.1\nPROTEIN\nPR\t#1# Homo sapiens <1>\n\nID\t1.1.1.2\n///\n'
+        self.assertEqual([(r.ec_number, r.start) for r in iter_records(data)],
+                         [('1.1.1.1', 0), ('1.1.1.2', data.index(b'ID\t1.1.1.2'))])
+
+    def test_extract_all_records_copies_file(self):
+        self.assertEqual(extract_records(input_test, self.output), 12)
+        with open(self.output, 'rb') as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    def test_extract_ec_class(self):
+        self.assertEqual(extract_records(input_test, self.output, ['1.14', '6']), 4)
+        with BRENDAParser(self.output) as parser:
+            brenda = parser.parse()
+        self.assertEqual(sorted(ec for ec in brenda if ec.count('.') == 3),
+                         ['1.14.11.9', '1.14.14.43', '1.14.14.46', '6.6.1.2'])
+
+    def test_extract_organism(self):
+        organism = 'Pseudomonas denitrificans'
+        self.assertEqual(extract_records(input_test, self.output, organism=organism), 1)
+        self.assertEqual(extract_records(input_test, self.output, ['1'], organism=organism), 0)
+        with open(self.output, 'rb') as handle:
+            self.assertEqual(handle.read(), b'')
+
+
+
+class TestSample(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestSample, cls).setUpClass()
+        with open(input_test, 'rb') as handle:
+            cls.records = list(iter_records(handle.read()))
+        with BRENDAParser(input_test) as parser:
+            cls.brenda = parser.parse()
+
+    def test_sample_is_reproducible(self):
+        sample = sample_records(self.records, 5, seed=1)
+        self.assertEqual(len(sample), 5)
+        self.assertEqual(sample, sample_records(iter(self.records), 5, seed=1))
+        self.assertNotEqual(sample, sample_records(self.records, 5, seed=2))
+        self.assertEqual(sample, sorted(sample, key=lambda record: record.start))
+
+    def test_sample_size(self):
+        self.assertEqual(len(sample_records(self.records, 0.5, seed=1)), 6)
+        self.assertEqual(len(sample_records(self.records, 1.0, seed=1)), 12)
+        self.assertEqual(sample_records(self.records, 20, seed=1), self.records)
+        self.assertEqual(sample_records(self.records, 0, seed=1), list())
+        with self.assertRaises(ArgumentError):
+            sample_records(self.records, 1.5)
+        with self.assertRaises(ArgumentError):
+            sample_records(self.records, -1)
+
+    def test_sample_is_uniform(self):
+        counts = Counter(record.ec_number for seed in range(1200)
+                         for record in sample_records(self.records, 3, seed=seed))
+        self.assertEqual(len(counts), 12)
+        for count in counts.values():
+            self.assertTrue(230 < count < 370, count)
+
+    def test_stratified_sample(self):
+        classes = Counter(record.ec_number.split('.')[0] for record in self.records)
+        self.assertEqual(classes, {'1': 10, '2': 1, '6': 1})
+        for seed in range(10):
+            sample = sample_records(self.records, 3, seed=seed, stratify=True)
+            self.assertEqual(sorted(record.ec_number.split('.')[0] for record in sample),
+                             ['1', '2', '6'])
+        sample = sample_records(self.records, 0.5, seed=1, stratify=True)
+        self.assertEqual(Counter(record.ec_number.split('.')[0] for record in sample),
+                         {'1': 4, '2': 1, '6': 1})
+
+    def test_allocate(self):
+        self.assertEqual(_allocate(3, [10, 1, 1]), [1, 1, 1])
+        self.assertEqual(_allocate(2, [10, 1, 1]), [2, 0, 0])
+        self.assertEqual(_allocate(6, [10, 5, 5]), [2, 2, 2])
+        self.assertEqual(_allocate(30, [10, 5, 5]), [10, 5, 5])
+        for size in range(21):
+            shares = _allocate(size, [10, 6, 3, 1])
+            self.assertEqual(sum(shares), size)
+            self.assertTrue(all(0 <= share <= count
+                                for share, count in zip(shares, [10, 6, 3, 1])))
+
+    def test_parse_sample(self):
+        brenda = parse_sample(input_test, 4, seed=3, stratify=True)
+        enzymes = list(unique_enzymes(brenda))
+        self.assertEqual(len(enzymes), 4)
+        expected = [self.brenda[enzyme.ec_number][0] for enzyme in enzymes]
+        self.assertEqual(diff_enzymes(expected, enzymes), list())
+        self.assertEqual([enzyme.ec_number for enzyme in enzymes],
+                         [enzyme.ec_number for enzyme in unique_enzymes(
+                             parse_sample(input_test, 4, seed=3, stratify=True))])
+
+    def test_extract_sample_of_ec_class(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'sample.txt')
+            self.assertEqual(extract_records(input_test, output, ['1.1'], sample=2, seed=0), 2)
+            with BRENDAParser(output) as parser:
+                brenda = parser.parse()
+            self.assertEqual(len(brenda['1.1']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_tables.py
+
+.. |c| unicode:: U+A9
+"""
+
+import os
+import pathlib
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.tables import FRAME_COLUMNS, protein_table, accession_table, tables_from_file, \
+    to_frame
+from brenda.utils import ArgumentError, find_accessions, init_tags
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+class TestProteinTables(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestProteinTables, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+
+    def test_find_accessions_without_candidates(self):
+        tags = init_tags()
+        self.assertEqual(find_accessions('Methanosarcina barkeri', tags.accession), [])
+        self.assertEqual(find_accessions('Escherichia coli K-12', tags.accession), [])
+
+    def test_find_accessions_with_data_banks(self):
+        tags = init_tags()
+        matches = find_accessions('Pseudomonas denitrificans P29933 and P29934 SwissProt ',
+                                  tags.accession)
+        self.assertEqual([(m.group(1), m.group(2)) for m in matches],
+                         [('P29933', None), ('P29934', 'SwissProt')])
+
+    def test_protein_table(self):
+        rows = protein_table(self.brenda)
+        self.assertEqual(len(rows), sum(len(self.brenda[ec][0].proteins)
+                                        for ec in self.brenda if ec.count('.') == 3))
+        row = [r for r in rows if r.ec_number == '6.6.1.2' and r.protein_id == 2][0]
+        self.assertEqual(row.organism, 'Salmonella enterica')
+        self.assertEqual(row.accessions, ['A0A022YWF9'])
+
+    def test_accession_table(self):
+        table = accession_table(self.brenda)
+        self.assertEqual(table['A3MTM6'], [('1.1.1.261', 10)])
+        self.assertEqual(table['P29933'], [('6.6.1.2', 5), ('6.6.1.2', 6), ('6.6.1.2', 7)])
+
+    def test_tables_from_file(self):
+        rows, table = tables_from_file(input_test)
+        self.assertEqual(rows, protein_table(self.brenda))
+        self.assertEqual(table, accession_table(self.brenda))
+
+    def test_tables_from_path(self):
+        self.assertEqual(tables_from_file(pathlib.Path(input_test)), tables_from_file(input_test))
+
+
+@unittest.skipIf(pandas is None, 'pandas is not installed')
+class TestFrames(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestFrames, cls).setUpClass()
+        with BRENDAParser(input_test) as bp:
+            cls.brenda = bp.parse()
+        cls.enzymes = [cls.brenda[ec][0] for ec in cls.brenda if ec.count('.') == 3]
+
+    def test_frame_has_one_row_per_entry(self):
+        frame = to_frame(self.brenda, 'SUBSTRATE_PRODUCT')
+        self.assertEqual(list(frame.columns), list(FRAME_COLUMNS))
+        entries = [(enzyme.ec_number, entry) for enzyme in self.enzymes
+                   for entry in enzyme.entries.get('SUBSTRATE_PRODUCT', ())]
+        self.assertEqual(len(frame), len(entries))
+        for row, (ec_number, entry) in zip(frame.itertuples(index=False), entries):
+            self.assertEqual(row.ec_number, ec_number)
+            self.assertEqual(row.msg, entry.msg)
+            self.assertEqual(row.proteins, entry.proteins)
+            self.assertEqual(row.references, entry.references)
+            if entry.information is None:
+                self.assertTrue(pandas.isna(row.information))
+            else:
+                self.assertEqual(row.information, entry.information)
+            if entry.comment is None:
+                self.assertTrue(pandas.isna(row.comment))
+            else:
+                self.assertEqual(row.comment, entry.comment.msg)
+
+    def test_frame_categorical_columns(self):
+        frame = to_frame(self.brenda, 'SUBSTRATE_PRODUCT')
+        for column in ('ec_number', 'msg', 'information', 'organism'):
+            self.assertEqual(frame[column].dtype, 'category', column)
+        self.assertEqual(list(frame['ec_number'].cat.categories),
+                         list(dict.fromkeys(frame['ec_number'].astype(str))))
+        frame = to_frame(self.brenda, 'SUBSTRATE_PRODUCT', categorical=())
+        self.assertNotEqual(frame['ec_number'].dtype, 'category')
+        with self.assertRaises(ArgumentError):
+            to_frame(self.brenda, 'SUBSTRATE_PRODUCT', categorical=('unknown',))
+
+    def test_frame_joins_organisms(self):
+        frame = to_frame(self.brenda, 'COFACTOR')
+        enzyme = self.brenda['6.6.1.2'][0]
+        rows = frame[frame['ec_number'] == '6.6.1.2']
+        for organism, entry in zip(rows['organism'], enzyme.entries['COFACTOR']):
+            organisms = list(dict.fromkeys(enzyme.proteins[protein_id].organism
+                                           for protein_id in entry.proteins))
+            self.assertEqual(organism.split('; '), organisms)
+
+    def test_frame_of_missing_section(self):
+        frame = to_frame(self.brenda, 'UNKNOWN_SECTION')
+        self.assertEqual(len(frame), 0)
+        self.assertEqual(list(frame.columns), list(FRAME_COLUMNS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_transfer.py
+
+.. |c| unicode:: U+A9
+"""
+
+import multiprocessing
+import os
+import pickle
+import unittest
+
+from brenda.conformance import diff_enzymes
+from brenda.parser import BRENDAParser
+from brenda.transfer import encode_enzymes, decode_enzymes, send_enzymes, recv_enzymes
+from brenda.utils import ArgumentError, unique_enzymes
+
+input_test = os.path.join('resources', 'brenda_test.txt')
+
+
+def _send_parsed(connection):
+    with BRENDAParser(input_test) as parser:
+        send_enzymes(connection, parser.parse())
+    connection.close()
+
+
+class TestPickling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestPickling, cls).setUpClass()
+        with BRENDAParser(input_test, cache_size=1000) as parser:
+            cls.enzymes = list(unique_enzymes(parser.parse()))
+
+    def test_pickled_enzymes_are_identical(self):
+        enzymes = pickle.loads(pickle.dumps(self.enzymes, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(diff_enzymes(self.enzymes, enzymes), list())
+        protein = next(iter(enzymes[0].proteins.values()))
+        self.assertEqual(protein._index, next(iter(self.enzymes[0].proteins.values()))._index)
+
+    def test_pickling_does_not_store_attribute_names(self):
+        data = pickle.dumps(self.enzymes, pickle.HIGHEST_PROTOCOL)
+        self.assertNotIn(b'ec_number', data)
+        self.assertNotIn(b'identifiers', data)
+
+    def test_pickling_keeps_shared_entries(self):
+        enzymes = [enzyme for enzyme in self.enzymes
+                   if enzyme.ec_number in ('1.1.1.261', '1.1.1.100')]
+        shared = [enzyme.entries['REACTION_TYPE'][0] for enzyme in enzymes]
+        self.assertIs(shared[0], shared[1])
+        enzymes = pickle.loads(pickle.dumps(enzymes, pickle.HIGHEST_PROTOCOL))
+        self.assertIs(enzymes[0].entries['REACTION_TYPE'][0],
+                      enzymes[1].entries['REACTION_TYPE'][0])
+
+    def test_pickling_keeps_extra_attributes(self):
+        enzyme = pickle.loads(pickle.dumps(self.enzymes[0]))
+        protein = next(iter(enzyme.proteins.values()))
+        protein.global_id = 42
+        protein = pickle.loads(pickle.dumps(protein))
+        self.assertEqual(protein.global_id, 42)
+
+        comment = next(entry.comment for entries in enzyme.entries.values()
+                       for entry in entries if entry.comment is not None)
+        clauses = comment.clauses
+        copy = pickle.loads(pickle.dumps(comment))
+        self.assertNotIn('_clauses', copy.__dict__)
+        self.assertEqual(copy.clauses, clauses)
+
+
+class TestTransfer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TestTransfer, cls).setUpClass()
+        with BRENDAParser(input_test) as parser:
+            cls.brenda = parser.parse()
+        cls.enzymes = list(unique_enzymes(cls.brenda))
+
+    def test_decoded_enzymes_are_identical(self):
+        for level in (0, 1, 9):
+            enzymes = decode_enzymes(encode_enzymes(self.brenda, level))
+            self.assertEqual(diff_enzymes(self.enzymes, enzymes), list())
+
+    def test_encoding_is_smaller_than_pickling(self):
+        size = len(pickle.dumps(self.enzymes, pickle.HIGHEST_PROTOCOL))
+        self.assertLess(len(encode_enzymes(self.enzymes, 0)), size)
+        self.assertLess(len(encode_enzymes(self.enzymes)) * 3, size)
+
+    def test_invalid_level(self):
+        with self.assertRaises(ArgumentError):
+            encode_enzymes(self.enzymes, 10)
+
+    def test_send_enzymes_between_processes(self):
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_send_parsed, args=(sender,))
+        process.start()
+        sender.close()
+        enzymes = recv_enzymes(receiver)
+        process.join()
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(diff_enzymes(self.enzymes, enzymes), list())
+
+
+if __name__ == '__main__':
+    unittest.main()
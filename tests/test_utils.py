@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+
+"""
+=============================
+BRENDA Enzyme Database Parser
+=============================
+
+:Author:
+    Alexandra Zaharia
+:Date:
+    2026-10-18
+:Copyright:
+    Copyright |c| 2026, Alexandra Zaharia, all rights reserved.
+:File:
+    test_utils.py
+
+.. |c| unicode:: U+A9
+"""
+
+import re
+import timeit
+import unittest
+
+from brenda.parser import BRENDAParser
+from brenda.utils import has_ec_number, is_ec_number, find_all, find_parentheses_indexes, \
+    init_tags, LRUCache
+
+# Upper bound for the time per call of a helper that runs on every line of the
+# flat file, relative to the implementation it replaced (see the reference_*
+# functions below), which looked up or compiled its pattern on every call.
+# Typical values are between 0.05 and 0.75; the bound leaves room for timing
+# noise while still failing for the replaced implementations.
+MAX_TIME_RATIO = 0.9
+
+
+def seconds_per_call(func, *args, number=20000):
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=5)) / number
+
+
+def reference_has_ec_number(text):
+    return re.search(r'[1-7](\.\d+){2}\.\d+', text) is not None
+
+
+def reference_is_ec_number(text):
+    return re.match(r'[1-7](\.\d+){2}\.\d+$', text) is not None
+
+
+def reference_has_protein_field_structure(text):
+    pattern = re.compile(r'#(\d)+(,*(\s)*\d+)*#')
+    return pattern.match(text)
+
+
+def reference_find_parentheses_indexes(text):
+    return [x.start() for x in re.finditer(r'\(', text)], \
+        [x.start() for x in re.finditer(r'\)', text)]
+
+
+class TestUtils(unittest.TestCase):
+    def test_has_ec_number(self):
+        self.assertTrue(has_ec_number('1.1.1.109 (transferred to EC 1.3.1.28)'))
+        self.assertTrue(has_ec_number('6.6.1.2'))
+        self.assertFalse(has_ec_number('8.1.1.1'))
+        self.assertFalse(has_ec_number('1.1.1'))
+        self.assertFalse(has_ec_number('nomen rejiciendum'))
+
+    def test_is_ec_number(self):
+        self.assertTrue(is_ec_number('1.1.1.261'))
+        self.assertFalse(is_ec_number('1.1.1'))
+        self.assertFalse(is_ec_number('1.1.1.261 (deleted)'))
+        self.assertFalse(is_ec_number('1.1.1.1.1'))
+
+    def test_init_tags_is_shared(self):
+        self.assertIs(init_tags(), init_tags())
+
+    def test_find_all(self):
+        text = '#1# a (b) (c(d)) <2>'
+        self.assertEqual(find_all(text, '#'), [x.start() for x in re.finditer('#', text)])
+        self.assertEqual(find_parentheses_indexes(text),
+                         ([x.start() for x in re.finditer(r'\(', text)],
+                          [x.start() for x in re.finditer(r'\)', text)]))
+        self.assertEqual(find_all('', '('), [])
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(tuple(cache.info()), (2, 1, 2, 2))
+
+
+class TestUtilsBenchmark(unittest.TestCase):
+    line = '#1,2,3,4,5,7,8# dihydroxyacetone phosphate + NAD(P)H = sn-glycerol 1-phosphate ' \
+           '+ NAD(P)+ (#1,2,3,4,5,7# method specific to glycerol-1-phosphate <2>) {ir} <2,3>'
+
+    def assertFasterThan(self, func, reference, *args):
+        self.assertEqual(bool(func(*args)), bool(reference(*args)))
+        self.assertLess(seconds_per_call(func, *args),
+                        seconds_per_call(reference, *args) * MAX_TIME_RATIO)
+
+    def test_ec_number_detection_overhead(self):
+        self.assertFasterThan(has_ec_number, reference_has_ec_number, self.line)
+        self.assertFasterThan(has_ec_number, reference_has_ec_number, '1.1.1.109 (transferred)')
+        self.assertFasterThan(is_ec_number, reference_is_ec_number, '1.1.1.261')
+
+    def test_protein_field_structure_overhead(self):
+        self.assertFasterThan(BRENDAParser.has_protein_field_structure,
+                              reference_has_protein_field_structure, '#1,2, 3#')
+
+    def test_parentheses_indexes_overhead(self):
+        self.assertEqual(find_parentheses_indexes(self.line),
+                         reference_find_parentheses_indexes(self.line))
+        self.assertFasterThan(find_parentheses_indexes, reference_find_parentheses_indexes,
+                              self.line)
+
+
+if __name__ == '__main__':
+    unittest.main()